@@ -33,6 +33,11 @@ mediapipe_datas = collect_data_files(
 )
 datas = mediapipe_datas
 
+# MediaPipe Tasks 모델 (있을 때만 포함)
+models_dir = project_dir / "models"
+if models_dir.is_dir():
+    datas.append((str(models_dir), "models"))
+
 mediapipe_bins = collect_dynamic_libs("mediapipe")
 cv2_bins = collect_dynamic_libs("cv2")
 binaries = mediapipe_bins + cv2_bins
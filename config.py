@@ -5,6 +5,7 @@ AirTouch Configuration
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
 from pathlib import Path
@@ -14,6 +15,7 @@ APP_VERSION = "5.0.0"
 APP_AUTHOR = "AirTouch Lab"
 
 
+@functools.lru_cache(maxsize=1)
 def _resolve_base_dir() -> Path:
     """포터블/패키징 환경(PyInstaller)과 개발 환경 모두에서 기준 경로를 반환."""
     if getattr(sys, "frozen", False):
@@ -21,15 +23,14 @@ def _resolve_base_dir() -> Path:
     return Path(__file__).resolve().parent
 
 
-BASE_DIR: Path = _resolve_base_dir()
-DEFAULT_DATA_ROOT = Path(os.environ.get("APPDATA", Path.home())) / APP_NAME
-APP_DATA_DIR = Path(os.environ.get("AIRTOUCH_DATA_DIR", DEFAULT_DATA_ROOT)).expanduser()
-APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+def _default_data_root() -> Path:
+    return Path(os.environ.get("APPDATA", Path.home())) / APP_NAME
 
-LOG_FILE = APP_DATA_DIR / "airtouch.log"
-SETTINGS_FILE = APP_DATA_DIR / "settings.json"
-BUILD_OUTPUT_DIR = BASE_DIR / "dist"
-INSTALLER_OUTPUT_DIR = BUILD_OUTPUT_DIR / "installer"
+
+@functools.lru_cache(maxsize=1)
+def _resolve_data_dir() -> Path:
+    """사용자 데이터 디렉터리 경로 (생성은 하지 않음)."""
+    return Path(os.environ.get("AIRTOUCH_DATA_DIR", _default_data_root())).expanduser()
 
 
 def resolve_resource(*parts: str) -> Path:
@@ -42,18 +43,24 @@ def resolve_resource(*parts: str) -> Path:
     Returns:
         Path: 절대 경로
     """
-    return BASE_DIR.joinpath(*parts)
+    return _resolve_base_dir().joinpath(*parts)
+
 
+@functools.lru_cache(maxsize=1)
+def configure_mediapipe_resources() -> None:
+    """
+    PyInstaller 환경에서 mediapipe가 모델 파일을 찾을 수 있도록 설정.
 
-def _configure_mediapipe_resources() -> None:
-    """PyInstaller 환경에서 mediapipe가 모델 파일을 찾을 수 있도록 설정."""
+    mediapipe 바인딩 import 비용이 크므로 import 시점이 아니라
+    FaceMesh/Hands 생성 직전에 한 번만 호출된다.
+    """
     try:
         from mediapipe.python._framework_bindings import resource_util  # type: ignore
     except Exception:
         return
 
     for relative in (Path("_internal") / "mediapipe", Path("mediapipe")):
-        candidate = BASE_DIR / relative
+        candidate = _resolve_base_dir() / relative
         if candidate.exists():
             try:
                 resource_util.set_resource_dir(str(candidate))
@@ -62,13 +69,18 @@ def _configure_mediapipe_resources() -> None:
             break
 
 
-_configure_mediapipe_resources()
-
 
 # ===== 웹캠 설정 =====
 CAM_INDEX = 0
 CAM_WIDTH = 1280
 CAM_HEIGHT = 720
+CAM_FOURCC = "MJPG"              # 카메라 픽셀 포맷 (MJPG: USB 대역폭 절감, None이면 드라이버 기본값)
+CAM_BUFFER_SIZE = 1              # 드라이버 프레임 버퍼 수 (작을수록 입력 지연 감소)
+CAM_DISABLE_AUTOFOCUS = True     # 자동 초점 끄기
+CAM_DISABLE_AUTO_EXPOSURE = True # 자동 노출 끄기
+PIPELINE_THREADED = True         # 캡처/추론/렌더링 스레드 파이프라인 사용
+INFERENCE_SCALE = 0.5            # MediaPipe 입력 축소 비율 (1.0이면 원본 해상도)
+USE_OPENCL = False               # 추론 전처리(축소/색 변환)를 OpenCL(UMat)로 실행
 
 # ===== MediaPipe 설정 =====
 FACE_DETECTION_CONFIDENCE = 0.5
@@ -77,6 +89,26 @@ HAND_DETECTION_CONFIDENCE = 0.7
 HAND_TRACKING_CONFIDENCE = 0.6
 MAX_NUM_FACES = 1
 MAX_NUM_HANDS = 2  # 스크롤 제스처를 위해 양손 검출
+HAND_MODEL_COMPLEXITY = 1  # 손 랜드마크 모델 (0: lite, 1: full, solutions API만 해당)
+
+# 손 모델 적응 전환 (두 번째 손이 없으면 lite + 한 손 모델 사용)
+ADAPTIVE_HAND_MODEL = True
+HAND_LITE_COMPLEXITY = 0         # 한 손 모델 복잡도
+SECOND_HAND_HOLD_MS = 2000       # 두 번째 손이 사라진 뒤 양손 모델 유지 시간
+SECOND_HAND_PROBE_INTERVAL = 15  # 한 손 모델 사용 중 양손 모델로 재확인하는 주기 (추론 횟수)
+
+# MediaPipe Tasks 모델 (BASE_DIR 기준 경로, 파일이 있으면 Tasks API 사용)
+HAND_LANDMARKER_MODEL = "models/hand_landmarker.task"
+FACE_LANDMARKER_MODEL = "models/face_landmarker.task"
+MEDIAPIPE_USE_GPU = True          # Tasks API에서 GPU 델리게이트 우선 사용 (실패 시 CPU)
+
+# 손 추론 프레임 건너뛰기 (사이 프레임은 랜드마크 외삽)
+HAND_INFERENCE_INTERVAL = 2      # 손 추론 주기 (프레임, 1이면 매 프레임)
+PREDICTION_RATIO = 0.5           # 사이 프레임 외삽 비율
+PREDICTION_MAX_WRIST_JUMP = 0.15 # 추론 간 손목 이동이 이보다 크면 (정규화 좌표) 외삽 생략
+HAND_IDLE_AFTER_MISSES = 10      # 연속으로 손을 놓친 추론 횟수가 이보다 많으면 저빈도 탐색
+HAND_IDLE_INFERENCE_INTERVAL = 4 # 저빈도 탐색 주기 (프레임)
+FACE_INFERENCE_INTERVAL = 2      # 얼굴 추론 주기 (프레임, 사이 프레임은 직전 결과 재사용)
 
 # ===== ACTIVE/IDLE 전환 설정 =====
 FACTOR = 1.20                    # Z 거리 비율 (120%)
@@ -111,7 +143,9 @@ MIRROR_DEFAULT = False           # 시작 시 좌우 반전
 
 # ===== Zoom 설정 =====
 PX_PER_STEP = 30.0               # Pinch 거리 → Wheel 스텝 변환 비율
-DEADZONE_PX = 3.0                # Deadzone (픽셀)
+DEADZONE_PX = 3.0                # 스텝 경계를 바깥으로 미는 Deadzone (픽셀, 느린 Pinch 기준 최대값)
+DEADZONE_FULL_SPEED = 400.0      # 이 속도(픽셀/초) 이상이면 Deadzone 0
+DEADZONE_CURVE = 1.0             # 속도 → Deadzone 축소 곡선 지수
 MAX_STEPS_PER_FRAME = 6          # 프레임당 최대 Zoom 스텝
 WHEEL_DELTA = 120                # 마우스 휠 1칸
 
@@ -151,6 +185,8 @@ ACTIVE_CURSOR_SHAPE = IDC_HAND   # ACTIVE 시 커서 모양
 
 # ===== UI 설정 =====
 WINDOW_NAME = "AirTouch - Virtual Touch Plane V5"
+SHOW_WINDOW = True       # False면 미리보기 창/오버레이 없이 실행 (헤드리스)
+HUD_REDRAW_EVERY_N = 1   # 미리보기(오버레이 + imshow) 갱신 주기 (프레임, 사이 프레임은 직전 화면 유지)
 HUD_FONT = 0  # cv2.FONT_HERSHEY_SIMPLEX
 HUD_FONT_SCALE = 0.8
 HUD_FONT_THICKNESS = 2
@@ -160,7 +196,8 @@ HUD_COLOR_ACTIVE = (0, 255, 0)   # 초록색
 HUD_COLOR_NORMAL = (255, 255, 255)  # 흰색
 
 # ===== 키보드 단축키 안내 =====
-HELP_TEXT = """
+def _build_help_text() -> str:
+    return """
 ========================================
 AirTouch V5 - Perspective Correction
 ========================================
@@ -173,4 +210,35 @@ Controls:
   [-]=: adjust z_margin and hysteresis
   r: reset baseline
 ========================================
-"""
\ No newline at end of file
+"""
+
+
+# ===== 지연 초기화 속성 (PEP 562) =====
+def _ensure_data_dir() -> Path:
+    """사용자 데이터 디렉터리를 처음 필요할 때 생성."""
+    data_dir = _resolve_data_dir()
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
+
+_LAZY_ATTRS = {
+    "BASE_DIR": _resolve_base_dir,
+    "DEFAULT_DATA_ROOT": _default_data_root,
+    "APP_DATA_DIR": _resolve_data_dir,
+    "BUILD_OUTPUT_DIR": lambda: _resolve_base_dir() / "dist",
+    "INSTALLER_OUTPUT_DIR": lambda: _resolve_base_dir() / "dist" / "installer",
+    "LOG_FILE": lambda: _ensure_data_dir() / "airtouch.log",
+    "SETTINGS_FILE": lambda: _ensure_data_dir() / "settings.json",
+    "HELP_TEXT": _build_help_text,
+}
+
+
+def __getattr__(name: str):
+    """import 시점이 아닌 첫 접근 시점에 계산하고 모듈 전역에 캐시."""
+    try:
+        factory = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = factory()
+    globals()[name] = value
+    return value
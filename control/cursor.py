@@ -4,15 +4,75 @@ Cursor Control Module
 """
 
 import ctypes
-try:
-    import win32api
-    WINDOWS_AVAILABLE = True
-except ImportError:
-    WINDOWS_AVAILABLE = False
+from ctypes import wintypes
 
-from utils.math_utils import clamp
-from filters.ema_filter import MultiEMAFilter
 import config
+from .win_input import get_win32
+
+# user32 함수 프로토타입 (모듈 로드 시 한 번만 바인딩)
+try:
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+    _LoadCursorW = _user32.LoadCursorW
+    _LoadCursorW.argtypes = (wintypes.HINSTANCE, wintypes.LPVOID)
+    _LoadCursorW.restype = wintypes.HANDLE
+
+    _CopyIcon = _user32.CopyIcon
+    _CopyIcon.argtypes = (wintypes.HANDLE,)
+    _CopyIcon.restype = wintypes.HANDLE
+
+    _SetSystemCursor = _user32.SetSystemCursor
+    _SetSystemCursor.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+    _SetSystemCursor.restype = wintypes.BOOL
+
+    _SystemParametersInfoW = _user32.SystemParametersInfoW
+    _SystemParametersInfoW.argtypes = (wintypes.UINT, wintypes.UINT, wintypes.LPVOID, wintypes.UINT)
+    _SystemParametersInfoW.restype = wintypes.BOOL
+
+    USER32_AVAILABLE = True
+except (AttributeError, OSError):
+    USER32_AVAILABLE = False
+
+
+def _update_cursor(state, nx, ny, alpha, width, height, last, thr):
+    """
+    커서 갱신 융합 커널 (클램프 + 스케일 + EMA + 정수 변환 + 임계값)
+
+    Args:
+        state: 이전 EMA 상태 (sx, sy) 또는 None (첫 프레임)
+        nx, ny: 정규화된 입력 좌표 (미러 적용 후)
+        alpha: EMA 계수
+        width, height: 화면 크기 (픽셀)
+        last: 마지막 전송 좌표 (x, y) 또는 None
+        thr: 이동 임계값 (픽셀)
+
+    Returns:
+        (sx, sy, final_x, final_y, moved)
+    """
+    # 0~1 범위 제한 후 화면 좌표로 변환
+    nx = 0.0 if nx < 0.0 else 1.0 if nx > 1.0 else nx
+    ny = 0.0 if ny < 0.0 else 1.0 if ny > 1.0 else ny
+    sx = nx * width
+    sy = ny * height
+
+    # EMA 필터 적용 (처음 값은 그대로 사용)
+    if state is not None:
+        px, py = state
+        sx = px + alpha * (sx - px)
+        sy = py + alpha * (sy - py)
+
+    # 정수로 변환 및 범위 제한
+    fx = int(sx)
+    fy = int(sy)
+    fx = width - 1 if fx > width - 1 else fx
+    fy = height - 1 if fy > height - 1 else fy
+
+    # 이동 임계값 체크 (제곱 거리 비교, 첫 프레임은 항상 이동)
+    if last is None:
+        return sx, sy, fx, fy, True
+    dx = fx - last[0]
+    dy = fy - last[1]
+    return sx, sy, fx, fy, dx * dx + dy * dy >= thr * thr
 
 
 class CursorMapper:
@@ -34,7 +94,9 @@ class CursorMapper:
         """
         # 화면 크기
         if screen_width is None or screen_height is None:
-            if WINDOWS_AVAILABLE:
+            win32 = get_win32()
+            if win32 is not None:
+                win32api, _ = win32
                 self.screen_width = win32api.GetSystemMetrics(0)
                 self.screen_height = win32api.GetSystemMetrics(1)
             else:
@@ -44,58 +106,43 @@ class CursorMapper:
             self.screen_width = screen_width
             self.screen_height = screen_height
         
-        # EMA 필터 (X, Y 좌표)
-        self.ema_filter = MultiEMAFilter(alpha=ema_alpha, dimensions=2)
-        
+        # EMA 필터 상태 (X, Y 좌표 / None이면 첫 프레임)
+        self._ema_alpha = float(ema_alpha)
+        self._ema_state = None
+
         # 설정
         self.move_threshold = move_threshold
         self.mirror = mirror
-        
+
         # 마지막 전송한 좌표
         self._last_sent = None
-    
+
     def map_to_screen(self, normalized_x, normalized_y):
         """
         정규화된 좌표 (0~1)를 화면 좌표로 변환
-        
+
         Args:
             normalized_x: 정규화된 X 좌표 (0~1)
             normalized_y: 정규화된 Y 좌표 (0~1)
-        
+
         Returns:
             (screen_x, screen_y) - 화면 좌표 (픽셀)
         """
         # 미러 모드 적용
         if self.mirror:
             normalized_x = 1.0 - normalized_x
-        
-        # 화면 좌표로 변환
-        screen_x = clamp(normalized_x, 0.0, 1.0) * self.screen_width
-        screen_y = clamp(normalized_y, 0.0, 1.0) * self.screen_height
-        
-        # EMA 필터 적용
-        filtered_x, filtered_y = self.ema_filter.update((screen_x, screen_y))
-        
-        # 정수로 변환 및 범위 제한
-        final_x = int(clamp(filtered_x, 0, self.screen_width - 1))
-        final_y = int(clamp(filtered_y, 0, self.screen_height - 1))
-        
-        # 이동 임계값 체크
-        should_move = False
-        if self._last_sent is None:
-            should_move = True
-        else:
-            dx = abs(final_x - self._last_sent[0])
-            dy = abs(final_y - self._last_sent[1])
-            if dx >= self.move_threshold or dy >= self.move_threshold:
-                should_move = True
-        
-        if should_move:
+
+        sx, sy, final_x, final_y, moved = _update_cursor(
+            self._ema_state, float(normalized_x), float(normalized_y),
+            self._ema_alpha, self.screen_width, self.screen_height,
+            self._last_sent, self.move_threshold
+        )
+        self._ema_state = (sx, sy)
+
+        if moved:
             self._last_sent = (final_x, final_y)
-            return (final_x, final_y, True)  # 이동됨
-        else:
-            return (final_x, final_y, False)  # 이동 안 됨
-    
+        return (final_x, final_y, moved)
+
     def toggle_mirror(self):
         """미러 모드 토글"""
         self.mirror = not self.mirror
@@ -107,7 +154,7 @@ class CursorMapper:
     
     def reset(self):
         """필터 초기화"""
-        self.ema_filter.reset()
+        self._ema_state = None
         self._last_sent = None
 
 
@@ -127,7 +174,18 @@ class SystemCursorChanger:
         self.enabled = enabled
         self.active_cursor_shape = active_cursor_shape
         self._cursor_changed = False
-        self.windows_available = WINDOWS_AVAILABLE
+        self.windows_available = get_win32() is not None
+
+        # 커서 핸들은 한 번만 로드
+        self._hcur = None
+        if self.windows_available and USER32_AVAILABLE:
+            try:
+                self._hcur = _LoadCursorW(None, self.active_cursor_shape)
+            except Exception as e:
+                print(f"Failed to load cursor: {e}")
+                self.windows_available = False
+        else:
+            self.windows_available = False
     
     def apply_active_cursor(self):
         """ACTIVE 커서 적용 (손 모양 등)"""
@@ -135,8 +193,8 @@ class SystemCursorChanger:
             return False
         
         try:
-            hcur = ctypes.windll.user32.LoadCursorW(None, ctypes.c_void_p(self.active_cursor_shape))
-            ctypes.windll.user32.SetSystemCursor(hcur, config.IDC_ARROW)
+            # SetSystemCursor는 전달된 핸들을 파괴하므로 캐시된 핸들의 복사본을 넘김
+            _SetSystemCursor(_CopyIcon(self._hcur), config.IDC_ARROW)
             self._cursor_changed = True
             return True
         except Exception as e:
@@ -149,7 +207,7 @@ class SystemCursorChanger:
             return False
         
         try:
-            ctypes.windll.user32.SystemParametersInfoW(config.SPI_SETCURSORS, 0, None, 0)
+            _SystemParametersInfoW(config.SPI_SETCURSORS, 0, None, 0)
             self._cursor_changed = False
             return True
         except Exception as e:
@@ -4,18 +4,57 @@ Virtual Keyboard Control Module
 """
 
 import cv2
+import math
 import numpy as np
 import time
 
-try:
-    import win32api
-    import win32con
-    WINDOWS_AVAILABLE = True
-except ImportError:
-    WINDOWS_AVAILABLE = False
-    print("Warning: win32api not available. Keyboard typing disabled.")
+from .win_input import get_win32, tap_key
 
-from utils.math_utils import angle_at_joint
+
+def _keyboard_kernel(mcp_x, mcp_y, pip_x, pip_y, dip_x, dip_y,
+                     prev_click, click_th, rel_th, hitmap):
+    """
+    프레임당 수치 연산 커널 (각도 계산 + 충돌 검사 + 클릭 상태 전이)
+
+    Args:
+        mcp_x, mcp_y: 검지 MCP 좌표
+        pip_x, pip_y: 검지 PIP 좌표
+        dip_x, dip_y: 검지 DIP 좌표
+        prev_click: 이전 클릭 상태 (0 or 1)
+        click_th: 클릭 각도 임계값
+        rel_th: 릴리즈 각도 임계값
+        hitmap: 픽셀 → 키 인덱스 테이블 (int16, -1은 빈 칸)
+
+    Returns:
+        (hit_index, click_edge, new_state, angle_deg)
+    """
+    # PIP 관절 각도 (angle_at_joint와 동일한 계산을 스칼라로 수행)
+    v1x, v1y = mcp_x - pip_x, mcp_y - pip_y
+    v2x, v2y = dip_x - pip_x, dip_y - pip_y
+    n1 = math.hypot(v1x, v1y) + 1e-9
+    n2 = math.hypot(v2x, v2y) + 1e-9
+    cos_a = (v1x * v2x + v1y * v2y) / (n1 * n2)
+    cos_a = -1.0 if cos_a < -1.0 else 1.0 if cos_a > 1.0 else cos_a
+    angle = math.degrees(math.acos(cos_a))
+
+    # 키 충돌 검사
+    hit = -1
+    fx, fy = int(mcp_x), int(mcp_y)
+    h, w = hitmap.shape
+    if 0 <= fx < w and 0 <= fy < h:
+        hit = int(hitmap[fy, fx])
+
+    # 클릭 상태 전이 (키 위에 있을 때만)
+    edge = 0
+    state = prev_click
+    if hit >= 0:
+        if angle <= click_th and not prev_click:
+            state = 1
+            edge = 1
+        elif angle >= rel_th and prev_click:
+            state = 0
+
+    return hit, edge, state, angle
 
 
 class VirtualKeyboard:
@@ -67,6 +106,7 @@ class VirtualKeyboard:
         self.show_keyboard = True
         self.last_key_press = {}
         self.key_cooldown_ms = 300
+        self.key_cooldown_ns = self.key_cooldown_ms * 1_000_000
 
         # 클릭 상태 추적
         self.finger_click_state = False
@@ -74,12 +114,16 @@ class VirtualKeyboard:
         # 시각화
         self.hovered_key = None
         self.pressed_keys = {}  # {key_char: timestamp}
+        self._joint_px = np.empty((4, 2), dtype=np.int32)  # MCP/PIP/DIP/TIP 픽셀 좌표
 
-        self.windows_available = WINDOWS_AVAILABLE
+        self.windows_available = get_win32() is not None
+        if not self.windows_available:
+            print("Warning: win32api not available. Keyboard typing disabled.")
 
     def _build_keyboard_layout(self):
         """키보드 레이아웃 좌표 계산"""
         self.key_rects = {}
+        self._text_meta = {}
 
         # 각 행의 시작 X 좌표
         row_starts = {
@@ -105,17 +149,82 @@ class VirtualKeyboard:
                 h = self.key_size
 
                 self.key_rects[key] = (x, y, w, h)
+
+                # 키 텍스트 (위치/크기는 고정이므로 미리 계산)
+                if key == 'SPACE':
+                    text = '____SPACE____'
+                    font_scale = 0.6
+                elif key == 'BACKSPACE':
+                    text = '<- BACK'
+                    font_scale = 0.6
+                else:
+                    text = key
+                    font_scale = 0.8
+
+                ts = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)[0]
+                self._text_meta[key] = (x + (w - ts[0]) // 2, y + (h + ts[1]) // 2,
+                                        text, font_scale)
+
                 x += w + self.key_spacing
 
             y += self.key_size + self.key_spacing
 
+        # 픽셀 → 키 인덱스 룩업 테이블 (충돌 검사 O(1))
+        self._idx_to_key = list(self.key_rects.keys())
+        self._hitmap = np.full((self.frame_h, self.frame_w), -1, dtype=np.int16)
+        # 경계가 겹치면 앞선 키가 우선하도록 역순으로 채움 (경계 포함)
+        for idx in range(len(self._idx_to_key) - 1, -1, -1):
+            kx, ky, kw, kh = self.key_rects[self._idx_to_key[idx]]
+            self._hitmap[ky:ky + kh + 1, kx:kx + kw + 1] = idx
+
+        # 레이아웃이 바뀌면 정적 오버레이도 다시 렌더링
+        self._render_base_overlay()
+
+    def _render_base_overlay(self):
+        """
+        정적 키보드 오버레이 사전 렌더링
+
+        반투명 배경과 기본 색상의 키를 한 번만 그려두고,
+        매 프레임에는 호버/눌림 키만 덧그린다.
+        """
+        # 키보드가 차지하는 하단 스트립만 보관
+        self._strip_y = max(0, self.keyboard_y_start - 20)
+
+        canvas = np.full((self.frame_h, self.frame_w, 3), 30, dtype=np.uint8)
+        mask = np.zeros((self.frame_h, self.frame_w), dtype=np.uint8)
+
+        for key_char in self.key_rects:
+            self._draw_key(canvas, key_char, self.KEY_COLOR_NORMAL)
+
+            x, y, w, h = self.key_rects[key_char]
+            cv2.rectangle(mask, (x, y), (x + w, y + h), 255, -1)
+            cv2.rectangle(mask, (x, y), (x + w, y + h), 255, 2)
+
+        self._overlay_strip = np.ascontiguousarray(canvas[self._strip_y:])
+        # 키 영역은 불투명하게 복사 (H, W, 1) → 채널 방향 브로드캐스트
+        self._key_mask = (mask[self._strip_y:] > 0)[:, :, np.newaxis]
+
+    def _draw_key(self, frame, key_char, color):
+        """키 하나 그리기 (박스 + 테두리 + 텍스트)"""
+        x, y, w, h = self.key_rects[key_char]
+
+        # 키 박스
+        cv2.rectangle(frame, (x, y), (x + w, y + h), color, -1)
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (200, 200, 200), 2)
+
+        # 키 텍스트
+        text_x, text_y, text, font_scale = self._text_meta[key_char]
+        cv2.putText(frame, text, (text_x, text_y),
+                   cv2.FONT_HERSHEY_SIMPLEX, font_scale, self.TEXT_COLOR, 2)
+
     def _check_key_collision(self, finger_pos):
         """손가락과 키 충돌 감지"""
-        fx, fy = finger_pos
+        fx, fy = int(finger_pos[0]), int(finger_pos[1])
 
-        for key_char, (kx, ky, kw, kh) in self.key_rects.items():
-            if (kx <= fx <= kx + kw) and (ky <= fy <= ky + kh):
-                return key_char
+        if 0 <= fx < self.frame_w and 0 <= fy < self.frame_h:
+            idx = int(self._hitmap[fy, fx])
+            if idx >= 0:
+                return self._idx_to_key[idx]
 
         return None
 
@@ -137,14 +246,14 @@ class VirtualKeyboard:
 
     def _can_press_key(self, key_char):
         """키 반복 입력 방지"""
-        now_ms = int(time.time() * 1000)
+        now_ns = time.perf_counter_ns()
 
         if key_char not in self.last_key_press:
-            self.last_key_press[key_char] = now_ms
+            self.last_key_press[key_char] = now_ns
             return True
 
-        if now_ms - self.last_key_press[key_char] > self.key_cooldown_ms:
-            self.last_key_press[key_char] = now_ms
+        if now_ns - self.last_key_press[key_char] > self.key_cooldown_ns:
+            self.last_key_press[key_char] = now_ns
             return True
 
         return False
@@ -155,6 +264,7 @@ class VirtualKeyboard:
             return
 
         try:
+            _, win32con = get_win32()
             if key_char == 'SPACE':
                 vk_code = win32con.VK_SPACE
             elif key_char == 'BACKSPACE':
@@ -164,11 +274,8 @@ class VirtualKeyboard:
             else:
                 return
 
-            # 키 누름
-            win32api.keybd_event(vk_code, 0, 0, 0)
-            time.sleep(0.01)
-            # 키 뗌
-            win32api.keybd_event(vk_code, 0, win32con.KEYEVENTF_KEYUP, 0)
+            # 키 누름 + 뗌을 SendInput 한 번으로 전송 (캡처 루프 블로킹 없음)
+            tap_key(vk_code)
 
             print(f"[TYPED] {key_char}")
 
@@ -183,47 +290,26 @@ class VirtualKeyboard:
         if not self.show_keyboard:
             return frame
 
-        # 반투명 배경
-        overlay = frame.copy()
-        cv2.rectangle(overlay,
-                     (0, self.keyboard_y_start - 20),
-                     (self.frame_w, self.frame_h),
-                     (30, 30, 30),
-                     -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        # 반투명 배경 + 기본 키 (사전 렌더링된 오버레이를 하단 영역에만 합성)
+        ys = self._strip_y
+        ye = min(frame.shape[0], self.frame_h)
+        xe = min(frame.shape[1], self.frame_w)
+        roi = frame[ys:ye, :xe]
+        base = self._overlay_strip[:ye - ys, :xe]
+        cv2.addWeighted(base, 0.7, roi, 0.3, 0, roi)
+        np.copyto(roi, base, where=self._key_mask[:ye - ys, :xe])
 
         now = time.time()
 
-        # 각 키 그리기
-        for key_char, (x, y, w, h) in self.key_rects.items():
-            # 키 색상 결정
-            if key_char in self.pressed_keys and (now - self.pressed_keys[key_char] < 0.2):
-                color = self.KEY_COLOR_PRESSED
-            elif key_char == self.hovered_key:
-                color = self.KEY_COLOR_HOVER
-            else:
-                color = self.KEY_COLOR_NORMAL
-
-            # 키 박스
-            cv2.rectangle(frame, (x, y), (x + w, y + h), color, -1)
-            cv2.rectangle(frame, (x, y), (x + w, y + h), (200, 200, 200), 2)
+        # 상태가 바뀐 키만 덧그리기
+        for key_char, pressed_at in self.pressed_keys.items():
+            if now - pressed_at < 0.2:
+                self._draw_key(frame, key_char, self.KEY_COLOR_PRESSED)
 
-            # 키 텍스트
-            if key_char == 'SPACE':
-                text = '____SPACE____'
-                font_scale = 0.6
-            elif key_char == 'BACKSPACE':
-                text = '<- BACK'
-                font_scale = 0.6
-            else:
-                text = key_char
-                font_scale = 0.8
-
-            text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)[0]
-            text_x = x + (w - text_size[0]) // 2
-            text_y = y + (h + text_size[1]) // 2
-            cv2.putText(frame, text, (text_x, text_y),
-                       cv2.FONT_HERSHEY_SIMPLEX, font_scale, self.TEXT_COLOR, 2)
+        if self.hovered_key is not None:
+            pressed_at = self.pressed_keys.get(self.hovered_key)
+            if pressed_at is None or now - pressed_at >= 0.2:
+                self._draw_key(frame, self.hovered_key, self.KEY_COLOR_HOVER)
 
         return frame
 
@@ -242,50 +328,55 @@ class VirtualKeyboard:
         h, w = frame.shape[:2]
 
         # 검지 MCP 위치 (커서)
-        mcp_pos = landmarks_2d['idx_mcp']
+        mcp_pos = landmarks_2d.idx_mcp
+
+        # 검지 관절 픽셀 좌표를 재사용 버퍼에 한 번에 정수 변환
+        joint_px = self._joint_px
+        joint_px[0] = mcp_pos
+        joint_px[1] = landmarks_2d.idx_pip
+        joint_px[2] = landmarks_2d.idx_dip
+        joint_px[3] = landmarks_2d.idx_tip
+        mcp_px, pip_px, dip_px, tip_px = map(tuple, joint_px.tolist())
 
         # 검지 MCP 표시
-        cv2.circle(frame, (int(mcp_pos[0]), int(mcp_pos[1])), 12, (255, 0, 255), -1)
-        cv2.circle(frame, (int(mcp_pos[0]), int(mcp_pos[1])), 15, (255, 0, 255), 2)
+        cv2.circle(frame, mcp_px, 12, (255, 0, 255), -1)
+        cv2.circle(frame, mcp_px, 15, (255, 0, 255), 2)
 
         # 검지 관절 선 그리기
-        cv2.line(frame, tuple(landmarks_2d['idx_mcp'].astype(int)),
-                tuple(landmarks_2d['idx_pip'].astype(int)), (0, 255, 0), 2)
-        cv2.line(frame, tuple(landmarks_2d['idx_pip'].astype(int)),
-                tuple(landmarks_2d['idx_dip'].astype(int)), (0, 255, 0), 2)
-        cv2.line(frame, tuple(landmarks_2d['idx_dip'].astype(int)),
-                tuple(landmarks_2d['idx_tip'].astype(int)), (0, 255, 0), 2)
+        cv2.line(frame, mcp_px, pip_px, (0, 255, 0), 2)
+        cv2.line(frame, pip_px, dip_px, (0, 255, 0), 2)
+        cv2.line(frame, dip_px, tip_px, (0, 255, 0), 2)
 
         # 양안 중점에서 MCP까지 선
         if eye_midpoint is not None:
             cv2.line(frame,
                     (int(eye_midpoint[0]), int(eye_midpoint[1])),
-                    (int(mcp_pos[0]), int(mcp_pos[1])),
+                    mcp_px,
                     (255, 0, 255), 2)
 
-        # 검지 각도 계산
-        index_angle = angle_at_joint(
-            landmarks_2d['idx_mcp'],
-            landmarks_2d['idx_pip'],
-            landmarks_2d['idx_dip']
+        # 검지 각도 / 키 충돌 / 클릭 상태 전이 (수치 커널)
+        pip_pos = landmarks_2d.idx_pip
+        dip_pos = landmarks_2d.idx_dip
+        hit, is_click, new_state, index_angle = _keyboard_kernel(
+            float(mcp_pos[0]), float(mcp_pos[1]),
+            float(pip_pos[0]), float(pip_pos[1]),
+            float(dip_pos[0]), float(dip_pos[1]),
+            int(self.finger_click_state),
+            self.click_angle_threshold, self.release_angle_threshold,
+            self._hitmap
         )
+        self.hovered_key = self._idx_to_key[hit] if hit >= 0 else None
 
         # 각도 표시
         angle_text = f"{index_angle:.1f}deg"
         angle_color = (0, 255, 0) if self.finger_click_state else (255, 255, 255)
         cv2.putText(frame, angle_text,
-                   (int(mcp_pos[0]) + 20, int(mcp_pos[1])),
+                   (mcp_px[0] + 20, mcp_px[1]),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, angle_color, 2)
+        self.finger_click_state = bool(new_state)
 
-        # 키 충돌 감지
-        self.hovered_key = self._check_key_collision(mcp_pos)
-
-        if self.hovered_key:
-            # 클릭 제스처 감지
-            is_click = self._detect_click_gesture(index_angle)
-
-            if is_click and self._can_press_key(self.hovered_key):
-                self._type_key(self.hovered_key)
+        if is_click and self._can_press_key(self.hovered_key):
+            self._type_key(self.hovered_key)
 
         # 키보드 그리기
         frame = self._draw_keyboard(frame)
@@ -3,13 +3,14 @@ Mouse Control Module
 마우스 클릭, 드래그 제어
 """
 
-try:
-    import win32api
-    import win32con
-    WINDOWS_AVAILABLE = True
-except ImportError:
-    WINDOWS_AVAILABLE = False
-    print("Warning: win32api not available. Mouse control disabled.")
+from .win_input import (
+    get_win32, mouse_input, send_inputs,
+    MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP
+)
+
+# 버튼 이벤트는 상대 좌표 (0, 0) → 현재 커서 위치에서 발생
+_LEFT_DOWN = mouse_input(MOUSEEVENTF_LEFTDOWN)
+_LEFT_UP = mouse_input(MOUSEEVENTF_LEFTUP)
 
 
 class MouseController:
@@ -21,26 +22,24 @@ class MouseController:
     
     def __init__(self):
         self.dragging = False
-        self.windows_available = WINDOWS_AVAILABLE
+        self.windows_available = get_win32() is not None
+        if not self.windows_available:
+            print("Warning: win32api not available. Mouse control disabled.")
     
     def click(self):
         """마우스 왼쪽 버튼 클릭"""
         if not self.windows_available:
             return
         
-        x, y = win32api.GetCursorPos()
-        win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, x, y, 0, 0)
-        win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, x, y, 0, 0)
+        send_inputs(_LEFT_DOWN, _LEFT_UP)
     
     def double_click(self):
         """마우스 왼쪽 버튼 더블클릭"""
         if not self.windows_available:
             return
         
-        x, y = win32api.GetCursorPos()
-        for _ in range(2):
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, x, y, 0, 0)
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, x, y, 0, 0)
+        # 4개 이벤트를 한 번의 SendInput으로 원자적 전송
+        send_inputs(_LEFT_DOWN, _LEFT_UP, _LEFT_DOWN, _LEFT_UP)
     
     def drag_start(self):
         """드래그 시작 (왼쪽 버튼 누른 상태 유지)"""
@@ -48,8 +47,7 @@ class MouseController:
             return
         
         if not self.dragging:
-            x, y = win32api.GetCursorPos()
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, x, y, 0, 0)
+            send_inputs(_LEFT_DOWN)
             self.dragging = True
     
     def drag_end(self):
@@ -58,8 +56,7 @@ class MouseController:
             return
         
         if self.dragging:
-            x, y = win32api.GetCursorPos()
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, x, y, 0, 0)
+            send_inputs(_LEFT_UP)
             self.dragging = False
     
     def is_dragging(self):
@@ -75,12 +72,14 @@ class MouseController:
         """현재 커서 위치 반환"""
         if not self.windows_available:
             return (0, 0)
+        win32api, _ = get_win32()
         return win32api.GetCursorPos()
     
     def set_cursor_position(self, x, y):
         """커서 위치 설정"""
         if not self.windows_available:
             return
+        win32api, _ = get_win32()
         win32api.SetCursorPos((int(x), int(y)))
 
 
@@ -100,7 +99,7 @@ class ClickManager:
         self.refractory_ms = refractory_ms
         self.double_click_hold_ms = double_click_hold_ms
         
-        self.last_click_time = 0
+        self.last_click_time = None  # 시계 기준점과 무관하게 첫 클릭 허용
         self.double_click_hold_start = None
         self.double_click_fired = False
     
@@ -109,11 +108,13 @@ class ClickManager:
         클릭 가능 여부 확인 (refractory period)
         
         Args:
-            current_time_ms: 현재 시간 (밀리초)
+            current_time_ms: 현재 시간 (밀리초, 단조 증가 시계 권장)
         
         Returns:
             클릭 가능 여부 (bool)
         """
+        if self.last_click_time is None:
+            return True
         return (current_time_ms - self.last_click_time) > self.refractory_ms
     
     def register_click(self, current_time_ms):
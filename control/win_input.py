@@ -0,0 +1,180 @@
+"""
+Win32 Input Module
+user32.SendInput 기반 저수준 키보드/마우스 입력
+"""
+
+import ctypes
+import functools
+from ctypes import wintypes
+
+try:
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    SENDINPUT_AVAILABLE = True
+except (AttributeError, OSError):
+    _user32 = None
+    SENDINPUT_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=1)
+def get_win32():
+    """
+    pywin32 모듈 지연 로드 (첫 호출 시 한 번만 import)
+
+    Returns:
+        (win32api, win32con) 또는 사용 불가 시 None
+    """
+    try:
+        import win32api
+        import win32con
+    except ImportError:
+        return None
+    return win32api, win32con
+
+
+# INPUT 타입
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+
+# 키보드 이벤트 플래그
+KEYEVENTF_KEYUP = 0x0002
+
+# 마우스 이벤트 플래그
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+MOUSEEVENTF_RIGHTDOWN = 0x0008
+MOUSEEVENTF_RIGHTUP = 0x0010
+MOUSEEVENTF_WHEEL = 0x0800
+MOUSEEVENTF_ABSOLUTE = 0x8000
+
+ULONG_PTR = ctypes.c_size_t
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ('dx', wintypes.LONG),
+        ('dy', wintypes.LONG),
+        ('mouseData', wintypes.DWORD),
+        ('dwFlags', wintypes.DWORD),
+        ('time', wintypes.DWORD),
+        ('dwExtraInfo', ULONG_PTR),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ('wVk', wintypes.WORD),
+        ('wScan', wintypes.WORD),
+        ('dwFlags', wintypes.DWORD),
+        ('time', wintypes.DWORD),
+        ('dwExtraInfo', ULONG_PTR),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ('uMsg', wintypes.DWORD),
+        ('wParamL', wintypes.WORD),
+        ('wParamH', wintypes.WORD),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [
+        ('mi', MOUSEINPUT),
+        ('ki', KEYBDINPUT),
+        ('hi', HARDWAREINPUT),
+    ]
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ('u',)
+    _fields_ = [
+        ('type', wintypes.DWORD),
+        ('u', _INPUTUNION),
+    ]
+
+
+if SENDINPUT_AVAILABLE:
+    _SendInput = _user32.SendInput
+    _SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+    _SendInput.restype = wintypes.UINT
+else:
+    _SendInput = None
+
+
+# 직전 SendInput 호출이 차단되었는지 (경고 중복 출력 방지)
+_blocked = False
+
+
+def key_input(vk_code, flags=0):
+    """
+    키보드 INPUT 구조체 생성
+
+    Args:
+        vk_code: 가상 키 코드
+        flags: KEYEVENTF_* 플래그
+
+    Returns:
+        INPUT 구조체
+    """
+    inp = INPUT(type=INPUT_KEYBOARD)
+    inp.ki = KEYBDINPUT(wVk=vk_code, wScan=0, dwFlags=flags, time=0, dwExtraInfo=0)
+    return inp
+
+
+def mouse_input(flags, dx=0, dy=0, data=0):
+    """
+    마우스 INPUT 구조체 생성
+
+    Args:
+        flags: MOUSEEVENTF_* 플래그
+        dx, dy: 이동량 (ABSOLUTE 플래그 시 0~65535 정규화 좌표)
+        data: 휠 이동량 등 부가 데이터
+
+    Returns:
+        INPUT 구조체
+    """
+    inp = INPUT(type=INPUT_MOUSE)
+    inp.mi = MOUSEINPUT(dx=dx, dy=dy, mouseData=data & 0xFFFFFFFF,
+                        dwFlags=flags, time=0, dwExtraInfo=0)
+    return inp
+
+
+def send_inputs(*inputs):
+    """
+    여러 INPUT을 한 번의 SendInput 호출로 전송 (원자적 주입)
+
+    Args:
+        *inputs: INPUT 구조체들
+
+    Returns:
+        실제로 주입된 이벤트 수 (잠금 화면/UAC 등으로 차단되면 요청보다 적거나 0)
+    """
+    global _blocked
+
+    if _SendInput is None or not inputs:
+        return 0
+
+    n = len(inputs)
+    arr = (INPUT * n)(*inputs)
+    sent = _SendInput(n, arr, ctypes.sizeof(INPUT))
+    if sent != n:
+        # 차단된 동안 매 프레임 출력하지 않도록 연속 실패의 첫 번째만 경고
+        if not _blocked:
+            print(f"Warning: SendInput injected {sent}/{n} events "
+                  f"(error {ctypes.get_last_error()})")
+        _blocked = True
+    else:
+        _blocked = False
+    return sent
+
+
+def tap_key(vk_code):
+    """
+    키 누름 + 뗌을 단일 호출로 전송
+
+    Args:
+        vk_code: 가상 키 코드
+    """
+    return send_inputs(key_input(vk_code), key_input(vk_code, KEYEVENTF_KEYUP))
@@ -3,16 +3,56 @@ Zoom Control Module
 Pinch 제스처 기반 Zoom In/Out 제어
 """
 
-try:
-    import win32api
-    import win32con
-    WINDOWS_AVAILABLE = True
-except ImportError:
-    WINDOWS_AVAILABLE = False
+import time
 
-import config
-from utils.math_utils import clamp
-from filters.ema_filter import EMAFilter
+from .win_input import (
+    get_win32, key_input, mouse_input, send_inputs,
+    KEYEVENTF_KEYUP, MOUSEEVENTF_WHEEL
+)
+from filters.ema_filter import EMAFilter, EMAFilterInt
+
+VK_CONTROL = 0x11
+
+# 매 호출마다 재생성하지 않도록 Ctrl 누름/뗌 INPUT을 미리 생성
+_CTRL_DOWN = key_input(VK_CONTROL)
+_CTRL_UP = key_input(VK_CONTROL, KEYEVENTF_KEYUP)
+
+
+def _make_step_kernel(px_per_step, max_steps_per_frame):
+    """
+    설정값을 클로저에 고정한 Zoom 스텝 계산 함수 생성
+    (PinchZoomManager는 설정값이 바뀌면 커널을 다시 생성)
+    
+    Args:
+        px_per_step: Pinch 거리 → Wheel 스텝 변환 비율
+        max_steps_per_frame: 프레임당 최대 스텝
+    
+    Returns:
+        step(delta, deadzone, prev_steps_sent) -> (steps_total, steps_to_fire)
+    """
+    lo = -max_steps_per_frame
+    hi = max_steps_per_frame
+    
+    def step(delta, deadzone, prev_steps_sent):
+        # Deadzone만큼 |delta|를 줄인 뒤 반올림 → 모든 스텝 경계가 deadzone만큼 바깥으로 이동
+        # (경계 근처 떨림으로 스텝이 오가는 것 방지, deadzone=0이면 단순 반올림)
+        mag = abs(delta) - deadzone
+        if mag <= 0.0:
+            steps_total = 0
+        else:
+            steps_total = int(round(mag / px_per_step))
+            if delta < 0:
+                steps_total = -steps_total
+        
+        # 증분만 계산 (정수끼리 비교하므로 clamp 호출/int 변환 불필요)
+        steps_to_fire = steps_total - prev_steps_sent
+        if steps_to_fire < lo:
+            steps_to_fire = lo
+        elif steps_to_fire > hi:
+            steps_to_fire = hi
+        return steps_total, steps_to_fire
+    
+    return step
 
 
 class ZoomController:
@@ -26,25 +66,29 @@ class ZoomController:
             wheel_delta: 마우스 휠 1칸 (기본: 120)
         """
         self.wheel_delta = int(wheel_delta)
-        self.windows_available = WINDOWS_AVAILABLE
+        self.windows_available = get_win32() is not None
     
-    def zoom_in(self):
-        """Zoom In (Ctrl + Wheel Up)"""
-        if not self.windows_available:
+    def zoom_by(self, steps):
+        """
+        여러 스텝을 한 번에 Zoom (Ctrl 누름 + 누적 휠 + Ctrl 뗌을 단일 SendInput으로 전송)
+        
+        Args:
+            steps: Zoom 스텝 수 (양수=In, 음수=Out)
+        """
+        if not self.windows_available or steps == 0:
             return
         
-        win32api.keybd_event(win32con.VK_CONTROL, 0, 0, 0)
-        win32api.mouse_event(win32con.MOUSEEVENTF_WHEEL, 0, 0, +self.wheel_delta, 0)
-        win32api.keybd_event(win32con.VK_CONTROL, 0, win32con.KEYEVENTF_KEYUP, 0)
+        send_inputs(_CTRL_DOWN,
+                    mouse_input(MOUSEEVENTF_WHEEL, data=int(steps * self.wheel_delta)),
+                    _CTRL_UP)
+    
+    def zoom_in(self):
+        """Zoom In (Ctrl + Wheel Up)"""
+        self.zoom_by(1)
     
     def zoom_out(self):
         """Zoom Out (Ctrl + Wheel Down)"""
-        if not self.windows_available:
-            return
-        
-        win32api.keybd_event(win32con.VK_CONTROL, 0, 0, 0)
-        win32api.mouse_event(win32con.MOUSEEVENTF_WHEEL, 0, 0, -self.wheel_delta, 0)
-        win32api.keybd_event(win32con.VK_CONTROL, 0, win32con.KEYEVENTF_KEYUP, 0)
+        self.zoom_by(-1)
 
 
 class PinchZoomManager:
@@ -59,6 +103,8 @@ class PinchZoomManager:
     def __init__(self, 
                  px_per_step=30.0,
                  deadzone_px=3.0,
+                 deadzone_full_speed=400.0,
+                 deadzone_curve=1.0,
                  max_steps_per_frame=6,
                  z_normalization_enabled=True,
                  min_z_for_normalization=20.0,
@@ -67,26 +113,39 @@ class PinchZoomManager:
         """
         Args:
             px_per_step: Pinch 거리 → Wheel 스텝 변환 비율
-            deadzone_px: Deadzone (픽셀)
+            deadzone_px: 최대 Deadzone (픽셀, 느린 Pinch 기준).
+                스텝 경계(px_per_step × (n + 0.5))를 이만큼 바깥으로 밀어
+                느린 Pinch가 경계 근처에서 떨려도 스텝이 오가지 않게 함
+            deadzone_full_speed: Deadzone이 0이 되는 Pinch 속도 (픽셀/초)
+            deadzone_curve: 속도 → Deadzone 축소 곡선 지수
             max_steps_per_frame: 프레임당 최대 스텝
             z_normalization_enabled: 원근 보정 활성화
             min_z_for_normalization: 최소 Z 거리
             reference_z_frames: 기준 Z 계산용 프레임 수
             ema_alpha: EMA 필터 계수
         """
-        self.px_per_step = float(px_per_step)
+        self._px_per_step = float(px_per_step)
+        self._max_steps_per_frame = int(max_steps_per_frame)
+        self._step_kernel = _make_step_kernel(self._px_per_step, self._max_steps_per_frame)
         self.deadzone_px = float(deadzone_px)
-        self.max_steps_per_frame = int(max_steps_per_frame)
+        
+        # 속도 적응형 Deadzone (빠른 Pinch일수록 Deadzone 축소 → 스텝 경계가 단순 반올림 위치로 복귀)
+        self.deadzone_full_speed = float(deadzone_full_speed)
+        self.deadzone_curve = float(deadzone_curve)
+        self._speed_ema = EMAFilter(alpha=0.5)
+        self._prev_pinch = None
+        self._prev_t_ms = None
         
         # 원근 보정
         self.z_normalization_enabled = z_normalization_enabled
         self.min_z_for_normalization = float(min_z_for_normalization)
         self.reference_z_frames = int(reference_z_frames)
         self.reference_z = None
-        self._z_samples = []
+        self._z_sum = 0.0
+        self._z_count = 0
         
-        # EMA 필터
-        self.ema_filter = EMAFilter(alpha=ema_alpha)
+        # EMA 필터 (픽셀 단위 신호 → 고정소수점 정수 EMA)
+        self.ema_filter = EMAFilterInt.from_alpha(ema_alpha)
         
         # 상태
         self.base_pinch = None
@@ -95,15 +154,66 @@ class PinchZoomManager:
         # Zoom 컨트롤러
         self.zoom_controller = ZoomController()
     
+    @property
+    def px_per_step(self):
+        """Pinch 거리 → Wheel 스텝 변환 비율"""
+        return self._px_per_step
+    
+    @px_per_step.setter
+    def px_per_step(self, value):
+        self._px_per_step = float(value)
+        self._step_kernel = _make_step_kernel(self._px_per_step, self._max_steps_per_frame)
+    
+    @property
+    def max_steps_per_frame(self):
+        """프레임당 최대 스텝"""
+        return self._max_steps_per_frame
+    
+    @max_steps_per_frame.setter
+    def max_steps_per_frame(self, value):
+        self._max_steps_per_frame = int(value)
+        self._step_kernel = _make_step_kernel(self._px_per_step, self._max_steps_per_frame)
+    
     def reset(self):
         """상태 초기화"""
         self.base_pinch = None
         self.prev_steps_sent = 0
         self.reference_z = None
-        self._z_samples = []
+        self._z_sum = 0.0
+        self._z_count = 0
         self.ema_filter.reset()
+        self._speed_ema.reset()
+        self._prev_pinch = None
+        self._prev_t_ms = None
+    
+    def _adaptive_deadzone(self, filtered_pinch, current_time_ms):
+        """
+        Pinch 속도에 따라 Deadzone 크기 계산
+        
+        Args:
+            filtered_pinch: 필터링된 Pinch 거리 (픽셀)
+            current_time_ms: 현재 시간 (ms)
+        
+        Returns:
+            float: 적용할 Deadzone (픽셀)
+        """
+        prev_pinch, prev_t = self._prev_pinch, self._prev_t_ms
+        self._prev_pinch = filtered_pinch
+        self._prev_t_ms = current_time_ms
+        
+        if prev_pinch is None:
+            return self.deadzone_px
+        
+        dt = (current_time_ms - prev_t) * 0.001
+        raw_speed = abs(filtered_pinch - prev_pinch) / (dt if dt > 1e-3 else 1e-3)
+        speed = self._speed_ema.update(raw_speed)
+        
+        t = speed / self.deadzone_full_speed
+        if t > 1.0:
+            t = 1.0
+        return self.deadzone_px * (1.0 - t ** self.deadzone_curve)
     
-    def process_pinch(self, pinch_distance, idx_tip_z, thumb_tip_z):
+    def process_pinch(self, pinch_distance, idx_tip_z, thumb_tip_z, current_time_ms=None):
         """
         Pinch 거리 처리 및 Zoom 스텝 계산
         
@@ -111,6 +221,7 @@ class PinchZoomManager:
             pinch_distance: 검지-엄지 거리 (픽셀)
             idx_tip_z: 검지 끝 Z 좌표
             thumb_tip_z: 엄지 끝 Z 좌표
+            current_time_ms: 현재 시간 (ms, 생략 시 내부 시계 사용)
         
         Returns:
             (steps_to_fire, info_dict)
@@ -125,6 +236,7 @@ class PinchZoomManager:
             'z_scale_factor': 1.0,
             'base_pinch': self.base_pinch,
             'delta': 0.0,
+            'deadzone': self.deadzone_px,
             'steps_total': 0,
             'steps_to_fire': 0,
             'collecting_ref_z': False
@@ -132,16 +244,17 @@ class PinchZoomManager:
         
         # 1. 원근 보정 적용
         if self.z_normalization_enabled and idx_tip_z is not None and thumb_tip_z is not None:
-            z_avg = (abs(idx_tip_z) + abs(thumb_tip_z)) / 2.0
+            z_avg = 0.5 * (abs(idx_tip_z) + abs(thumb_tip_z))
             info['z_avg'] = z_avg
             
             # Reference Z 설정 (처음 N 프레임 평균)
             if self.reference_z is None:
                 if z_avg >= self.min_z_for_normalization:
-                    self._z_samples.append(z_avg)
+                    self._z_sum += z_avg
+                    self._z_count += 1
                 
-                if len(self._z_samples) >= self.reference_z_frames:
-                    self.reference_z = float(sum(self._z_samples) / len(self._z_samples))
+                if self._z_count >= self.reference_z_frames:
+                    self.reference_z = float(self._z_sum / self._z_count)
                     info['reference_z'] = self.reference_z
                 else:
                     info['collecting_ref_z'] = True
@@ -160,6 +273,12 @@ class PinchZoomManager:
         # 2. EMA 필터링
         filtered_pinch = self.ema_filter.update(normalized_pinch)
         
+        # 속도 적응형 Deadzone
+        if current_time_ms is None:
+            current_time_ms = time.perf_counter_ns() // 1_000_000
+        deadzone = self._adaptive_deadzone(filtered_pinch, current_time_ms)
+        info['deadzone'] = deadzone
+        
         # 3. 기준선 설정
         if self.base_pinch is None:
             # Reference Z가 설정된 후에만 base_pinch 설정
@@ -173,16 +292,9 @@ class PinchZoomManager:
             delta = filtered_pinch - self.base_pinch
             info['delta'] = delta
             
-            if abs(delta) <= self.deadzone_px:
-                steps_total = 0
-            else:
-                steps_total = int(round(delta / self.px_per_step))
-            
+            # 5. 스텝 양자화 + 증분만 계산
+            steps_total, steps_to_fire = self._step_kernel(delta, deadzone, self.prev_steps_sent)
             info['steps_total'] = steps_total
-            
-            # 5. 증분만 계산
-            steps_to_fire = steps_total - self.prev_steps_sent
-            steps_to_fire = int(clamp(steps_to_fire, -self.max_steps_per_frame, self.max_steps_per_frame))
             info['steps_to_fire'] = steps_to_fire
             
             return (steps_to_fire, info)
@@ -200,17 +312,12 @@ class PinchZoomManager:
         Returns:
             실제 실행된 스텝 수
         """
-        if steps > 0:
-            for _ in range(steps):
-                self.zoom_controller.zoom_in()
-            self.prev_steps_sent += steps
-            return steps
-        elif steps < 0:
-            for _ in range(-steps):
-                self.zoom_controller.zoom_out()
-            self.prev_steps_sent += steps
-            return steps
-        return 0
+        if steps == 0:
+            return 0
+        
+        self.zoom_controller.zoom_by(steps)
+        self.prev_steps_sent += steps
+        return steps
     
     def toggle_normalization(self):
         """원근 보정 토글"""
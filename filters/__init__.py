@@ -3,6 +3,6 @@ Filters Package
 신호 필터링 패키지
 """
 
-from .ema_filter import EMAFilter, MultiEMAFilter
+from .ema_filter import EMAFilter, EMAFilterInt, MultiEMAFilter
 
-__all__ = ['EMAFilter', 'MultiEMAFilter']
\ No newline at end of file
+__all__ = ['EMAFilter', 'EMAFilterInt', 'MultiEMAFilter']
\ No newline at end of file
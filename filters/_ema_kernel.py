@@ -0,0 +1,37 @@
+"""
+EMA Kernels
+EMA 점화식 연산 커널
+"""
+
+import numpy as np
+
+
+def ema_step(prev, new, alpha, beta):
+    """
+    스칼라 EMA 한 스텝
+
+    Args:
+        prev: 이전 필터 값
+        new: 새로 측정된 값
+        alpha: 필터 계수
+        beta: 미리 계산한 (1 - alpha)
+
+    Returns:
+        필터링된 값
+    """
+    return alpha * new + beta * prev
+
+
+def ema_step_vec(state, new, alpha, beta):
+    """
+    벡터 EMA 한 스텝 (state를 제자리 갱신, 임시 배열 없이 ufunc out= 사용)
+
+    Args:
+        state: 필터 상태 버퍼 (float32[:], 제자리 갱신)
+        new: 새로 측정된 값들 (float32[:], 작업 버퍼로 덮어씀)
+        alpha: 필터 계수
+        beta: 미리 계산한 (1 - alpha)
+    """
+    np.multiply(new, alpha, out=new)
+    np.multiply(state, beta, out=state)
+    np.add(state, new, out=state)
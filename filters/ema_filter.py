@@ -3,6 +3,10 @@ Exponential Moving Average Filter
 지수 이동 평균 필터 (떨림 제거)
 """
 
+import numpy as np
+
+from ._ema_kernel import ema_step, ema_step_vec
+
 
 class EMAFilter:
     """
@@ -11,6 +15,9 @@ class EMAFilter:
     손 떨림이나 센서 노이즈를 제거하여 부드러운 값을 출력
     """
     
+    # 프레임마다 여러 인스턴스가 갱신되므로 인스턴스 dict 없이 고정 슬롯 사용
+    __slots__ = ('alpha', '_beta', '_value')
+    
     def __init__(self, alpha=0.5):
         """
         Args:
@@ -19,6 +26,7 @@ class EMAFilter:
                    - 낮을수록 이전 값 유지 (느린 반응, 부드러움)
         """
         self.alpha = float(alpha)
+        self._beta = 1.0 - self.alpha
         self._value = None
     
     def update(self, new_value):
@@ -36,7 +44,7 @@ class EMAFilter:
             self._value = new_value
         else:
             # EMA 공식: new = α × current + (1-α) × previous
-            self._value = self.alpha * new_value + (1 - self.alpha) * self._value
+            self._value = ema_step(self._value, new_value, self.alpha, self._beta)
         
         return self._value
     
@@ -51,6 +59,76 @@ class EMAFilter:
     def set_alpha(self, alpha):
         """필터 계수 변경"""
         self.alpha = float(alpha)
+        self._beta = 1.0 - self.alpha
+
+
+class EMAFilterInt:
+    """
+    고정소수점 정수 EMA 필터
+
+    픽셀 단위 신호(Pinch 거리 등)를 정수 연산만으로 필터링.
+    내부 상태는 frac_bits 만큼의 소수 비트를 가진 고정소수점으로 보관하여
+    정수 나눗셈 절삭으로 값이 목표에 도달하지 못하고 멈추는 현상을 방지한다.
+    """
+    
+    __slots__ = ('a', 'd', 'frac_bits', '_half', '_acc')
+    
+    def __init__(self, alpha_numer=128, alpha_denom=256, frac_bits=8):
+        """
+        Args:
+            alpha_numer: 필터 계수 분자 (alpha = alpha_numer / alpha_denom)
+            alpha_denom: 필터 계수 분모
+            frac_bits: 내부 상태 소수 비트 수
+        """
+        self.a = int(alpha_numer)
+        self.d = int(alpha_denom)
+        self.frac_bits = int(frac_bits)
+        self._half = (1 << self.frac_bits) >> 1
+        self._acc = None
+    
+    @classmethod
+    def from_alpha(cls, alpha, alpha_denom=256, frac_bits=8):
+        """실수 계수로 생성 (alpha_denom 단위로 양자화)"""
+        return cls(int(round(float(alpha) * alpha_denom)), alpha_denom, frac_bits)
+    
+    @property
+    def alpha(self):
+        """실수 환산 필터 계수"""
+        return self.a / self.d
+    
+    def update(self, new_value):
+        """
+        새로운 값으로 필터 업데이트
+        
+        Args:
+            new_value: 새로 측정된 값 (픽셀)
+        
+        Returns:
+            필터링된 값 (정수 픽셀, 반올림)
+        """
+        x = int(round(new_value * (1 << self.frac_bits)))
+        if self._acc is None:
+            # 처음 값은 그대로 사용
+            self._acc = x
+        else:
+            # EMA 공식 (고정소수점): acc += α × (x - acc)
+            self._acc += (self.a * (x - self._acc)) // self.d
+        
+        return (self._acc + self._half) >> self.frac_bits
+    
+    def get_value(self):
+        """현재 필터링된 값 반환 (정수 픽셀)"""
+        if self._acc is None:
+            return None
+        return (self._acc + self._half) >> self.frac_bits
+    
+    def reset(self):
+        """필터 초기화"""
+        self._acc = None
+    
+    def set_alpha(self, alpha):
+        """필터 계수 변경"""
+        self.a = int(round(float(alpha) * self.d))
 
 
 class MultiEMAFilter:
@@ -60,50 +138,61 @@ class MultiEMAFilter:
     예: (x, y) 좌표를 동시에 필터링
     """
     
+    __slots__ = ('alpha', '_beta', 'dimensions', '_values', '_initialized')
+    
     def __init__(self, alpha=0.5, dimensions=2):
         """
         Args:
             alpha: 필터 계수
             dimensions: 필터링할 값의 차원 (예: 2D 좌표는 2)
         """
+        dimensions = int(dimensions)
+        if dimensions < 1:
+            raise ValueError(f"dimensions must be >= 1, got {dimensions}")
+        
         self.alpha = float(alpha)
+        self._beta = 1.0 - self.alpha
         self.dimensions = dimensions
-        self._values = None
+        self._values = np.zeros(dimensions, dtype=np.float32)
+        self._initialized = False
     
     def update(self, new_values):
         """
         새로운 값들로 필터 업데이트
         
         Args:
-            new_values: 새로 측정된 값들 (tuple or list)
+            new_values: 새로 측정된 값들 (tuple, list or numpy array)
+                        길이는 반드시 dimensions와 같아야 함
         
         Returns:
             필터링된 값들 (tuple)
         """
-        if len(new_values) != self.dimensions:
-            raise ValueError(f"Expected {self.dimensions} values, got {len(new_values)}")
+        arr = np.array(new_values, dtype=np.float32)  # 입력 배열은 수정하지 않도록 복사
+        if arr.shape != (self.dimensions,):
+            raise ValueError(f"Expected {self.dimensions} values, got {arr.size}")
         
-        if self._values is None:
+        if not self._initialized:
             # 처음 값은 그대로 사용
-            self._values = tuple(new_values)
+            self._values[:] = arr
+            self._initialized = True
         else:
-            # 각 차원에 대해 EMA 적용
-            filtered = []
-            for i in range(self.dimensions):
-                filtered_val = self.alpha * new_values[i] + (1 - self.alpha) * self._values[i]
-                filtered.append(filtered_val)
-            self._values = tuple(filtered)
+            # 모든 차원에 대해 한 번에 EMA 적용 (제자리 연산)
+            ema_step_vec(self._values, arr, self.alpha, self._beta)
         
-        return self._values
+        return tuple(self._values.tolist())
     
     def get_values(self):
         """현재 필터링된 값들 반환"""
-        return self._values
+        if not self._initialized:
+            return None
+        return tuple(self._values.tolist())
     
     def reset(self):
         """필터 초기화"""
-        self._values = None
+        self._values[:] = 0
+        self._initialized = False
     
     def set_alpha(self, alpha):
         """필터 계수 변경"""
-        self.alpha = float(alpha)
\ No newline at end of file
+        self.alpha = float(alpha)
+        self._beta = 1.0 - self.alpha
@@ -3,13 +3,21 @@ Gesture Package
 얼굴/손 검출 및 제스처 인식 패키지
 """
 
-from .detector import FaceDetector, HandDetector
+from .detector import FaceDetector, HandDetector, HandLandmarks
 from .recognizer import FingerGestureRecognizer, PinchRecognizer, ShakaModeRecognizer
+from .recognizer import HandFeatures, compute_hand_features
+from .resampler import TemporalResampler
+from .adaptive import AdaptiveHandDetector
 
 __all__ = [
     'FaceDetector',
     'HandDetector',
+    'HandLandmarks',
     'FingerGestureRecognizer',
     'PinchRecognizer',
-    'ShakaModeRecognizer'
+    'ShakaModeRecognizer',
+    'HandFeatures',
+    'compute_hand_features',
+    'TemporalResampler',
+    'AdaptiveHandDetector'
 ]
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Adaptive Hand Model Module
+두 번째 손 유무에 따라 lite(한 손) / full(양손) 손 검출기 전환
+"""
+
+import time
+
+import config
+
+
+class AdaptiveHandDetector:
+    """
+    한 손만 보이는 동안은 가벼운 lite 모델(max 1 hand)로 추론하고,
+    두 번째 손이 보이면 양손 모델로 전환 (스크롤 제스처 등)
+
+    - lite 사용 중에도 probe_interval 추론마다 양손 모델로 두 번째 손을 재확인
+    - 두 번째 손이 사라진 뒤 hold_ms 동안은 양손 모델 유지
+    """
+
+    def __init__(self, lite_detector, full_detector,
+                 hold_ms=config.SECOND_HAND_HOLD_MS,
+                 probe_interval=config.SECOND_HAND_PROBE_INTERVAL):
+        """
+        Args:
+            lite_detector: 한 손용 HandDetector (가벼운 모델)
+            full_detector: 양손용 HandDetector
+            hold_ms: 두 번째 손이 사라진 뒤 양손 모델 유지 시간 (밀리초)
+            probe_interval: lite 사용 중 양손 모델 재확인 주기 (추론 횟수)
+        """
+        self.lite_detector = lite_detector
+        self.full_detector = full_detector
+        self.hold_ms = hold_ms
+        self.probe_interval = max(1, int(probe_interval))
+
+        self._tick = 0
+        self._last_multi_ms = None   # 두 번째 손을 마지막으로 본 시각
+
+    def is_full_active(self, now_ms):
+        """양손 모델 사용 구간인지 확인"""
+        return (self._last_multi_ms is not None
+                and now_ms - self._last_multi_ms < self.hold_ms)
+
+    def detect(self, rgb_image):
+        """
+        손 검출 (HandDetector.detect와 같은 인터페이스)
+
+        Args:
+            rgb_image: RGB 이미지 (numpy array)
+
+        Returns:
+            손 랜드마크 리스트 또는 None
+        """
+        now_ms = time.perf_counter_ns() // 1_000_000
+        tick = self._tick
+        self._tick += 1
+
+        if self.is_full_active(now_ms) or tick % self.probe_interval == 0:
+            hand_landmarks_list = self.full_detector.detect(rgb_image)
+        else:
+            hand_landmarks_list = self.lite_detector.detect(rgb_image)
+
+        if hand_landmarks_list and len(hand_landmarks_list) > 1:
+            self._last_multi_ms = now_ms
+
+        return hand_landmarks_list
+
+    def close(self):
+        """리소스 해제"""
+        self.lite_detector.close()
+        self.full_detector.close()
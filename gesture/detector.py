@@ -3,12 +3,180 @@ Gesture Detection Module
 MediaPipe 기반 얼굴 및 손 검출
 """
 
+import functools
+import time
+from typing import NamedTuple
+
 import cv2
 import numpy as np
-import mediapipe as mp
 import config
 
 
+@functools.lru_cache(maxsize=1)
+def _mediapipe():
+    """
+    MediaPipe 지연 로드 (TFLite 런타임 포함 import 비용이 크므로 검출기 생성 시점에 한 번만)
+
+    Returns:
+        mediapipe 모듈
+    """
+    import mediapipe as mp
+    return mp
+
+
+@functools.lru_cache(maxsize=1)
+def _landmark_pb2():
+    """MediaPipe 랜드마크 protobuf 모듈 지연 로드 (draw_landmarks 매 호출 import 방지)"""
+    from mediapipe.framework.formats import landmark_pb2
+    return landmark_pb2
+
+
+class HandLandmarks(NamedTuple):
+    """
+    손 랜드마크 21개 2D 좌표 (MediaPipe HandLandmark 인덱스 순서)
+
+    각 필드는 (21, 2) float32 배열의 행 view.
+    속성 접근(lm.idx_mcp)을 권장하며, 기존 코드 호환을 위해
+    문자열 키 접근(lm['idx_mcp'])도 지원한다.
+    """
+    wrist: np.ndarray
+    thm_cmc: np.ndarray
+    thm_mcp: np.ndarray
+    thm_ip: np.ndarray
+    thm_tip: np.ndarray
+    idx_mcp: np.ndarray
+    idx_pip: np.ndarray
+    idx_dip: np.ndarray
+    idx_tip: np.ndarray
+    mid_mcp: np.ndarray
+    mid_pip: np.ndarray
+    mid_dip: np.ndarray
+    mid_tip: np.ndarray
+    ring_mcp: np.ndarray
+    ring_pip: np.ndarray
+    ring_dip: np.ndarray
+    ring_tip: np.ndarray
+    pinky_mcp: np.ndarray
+    pinky_pip: np.ndarray
+    pinky_dip: np.ndarray
+    pinky_tip: np.ndarray
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def keys(self):
+        """dict 호환용 키 목록"""
+        return self._fields
+
+
+# 손 랜드마크 이름 (MediaPipe HandLandmark 인덱스 순서, 0~20)
+HAND_LANDMARK_NAMES = HandLandmarks._fields
+
+# HandLandmark 인덱스 (HandLandmarks 필드 순서 = MediaPipe HandLandmark 번호)
+# MediaPipe를 import하지 않고도 쓸 수 있도록 int 상수로 고정
+(WRIST,
+ THUMB_CMC, THUMB_MCP, THUMB_IP, THUMB_TIP,
+ INDEX_FINGER_MCP, INDEX_FINGER_PIP, INDEX_FINGER_DIP, INDEX_FINGER_TIP,
+ MIDDLE_FINGER_MCP, MIDDLE_FINGER_PIP, MIDDLE_FINGER_DIP, MIDDLE_FINGER_TIP,
+ RING_FINGER_MCP, RING_FINGER_PIP, RING_FINGER_DIP, RING_FINGER_TIP,
+ PINKY_MCP, PINKY_PIP, PINKY_DIP, PINKY_TIP) = range(len(HAND_LANDMARK_NAMES))
+
+# 얼굴 눈꼬리 인덱스 (FaceMesh)
+_R_EYE_OUTER = config.R_EYE_OUTER
+_R_EYE_INNER = config.R_EYE_INNER
+_L_EYE_OUTER = config.L_EYE_OUTER
+_L_EYE_INNER = config.L_EYE_INNER
+
+
+def _tasks_model_path(relative):
+    """Tasks 모델 파일 경로 (없으면 None → solutions API 사용)"""
+    path = config.resolve_resource(relative)
+    return str(path) if path.exists() else None
+
+
+class _LandmarkList:
+    """Tasks API 결과를 solutions API와 같은 `.landmark` 인터페이스로 감싸는 어댑터"""
+
+    __slots__ = ('landmark',)
+
+    def __init__(self, landmarks):
+        self.landmark = landmarks
+
+
+class _VideoClock:
+    """VIDEO 모드용 단조 증가 타임스탬프 (ms)"""
+
+    def __init__(self):
+        self._last_ms = -1
+
+    def next_ms(self):
+        now_ms = time.perf_counter_ns() // 1_000_000
+        self._last_ms = now_ms if now_ms > self._last_ms else self._last_ms + 1
+        return self._last_ms
+
+
+def _create_landmarker(kind, model_path, detection_confidence, tracking_confidence,
+                       max_results=None):
+    """
+    MediaPipe Tasks 랜드마커 생성 (GPU 델리게이트 우선, 실패 시 CPU)
+
+    Args:
+        kind: 'hand' 또는 'face'
+        model_path: .task 모델 파일 경로
+        detection_confidence: 검출 신뢰도 임계값
+        tracking_confidence: 추적 신뢰도 임계값
+        max_results: 최대 검출 수 (None이면 config.MAX_NUM_HANDS / MAX_NUM_FACES)
+
+    Returns:
+        HandLandmarker / FaceLandmarker 또는 실패 시 None
+    """
+    try:
+        from mediapipe.tasks.python import BaseOptions
+        from mediapipe.tasks.python import vision
+    except Exception as e:
+        print(f"Warning: MediaPipe Tasks {kind} landmarker unavailable ({e}). Using solutions API.")
+        return None
+
+    def build_options(base_options):
+        if kind == 'hand':
+            return vision.HandLandmarkerOptions(
+                base_options=base_options,
+                running_mode=vision.RunningMode.VIDEO,
+                num_hands=max_results or config.MAX_NUM_HANDS,
+                min_hand_detection_confidence=detection_confidence,
+                min_hand_presence_confidence=detection_confidence,
+                min_tracking_confidence=tracking_confidence
+            )
+        return vision.FaceLandmarkerOptions(
+            base_options=base_options,
+            running_mode=vision.RunningMode.VIDEO,
+            num_faces=max_results or config.MAX_NUM_FACES,
+            min_face_detection_confidence=detection_confidence,
+            min_face_presence_confidence=detection_confidence,
+            min_tracking_confidence=tracking_confidence
+        )
+
+    landmarker_cls = vision.HandLandmarker if kind == 'hand' else vision.FaceLandmarker
+
+    # GPU 델리게이트 우선 시도 (Windows/Linux: OpenGL, macOS: Metal), 실패 시 CPU
+    delegates = [BaseOptions.Delegate.CPU]
+    if config.MEDIAPIPE_USE_GPU:
+        delegates.insert(0, BaseOptions.Delegate.GPU)
+
+    for delegate in delegates:
+        try:
+            base_options = BaseOptions(model_asset_path=model_path, delegate=delegate)
+            return landmarker_cls.create_from_options(build_options(base_options))
+        except Exception as e:
+            if delegate == BaseOptions.Delegate.GPU:
+                print(f"Warning: GPU delegate unavailable for {kind} landmarker ({e}). Falling back to CPU.")
+            else:
+                print(f"Warning: MediaPipe Tasks {kind} landmarker unavailable ({e}). Using solutions API.")
+    return None
+
+
 class FaceDetector:
     """
     MediaPipe FaceMesh 기반 얼굴 검출
@@ -24,25 +192,53 @@ class FaceDetector:
             detection_confidence: 검출 신뢰도 임계값
             tracking_confidence: 추적 신뢰도 임계값
         """
-        self.face_mesh = mp.solutions.face_mesh.FaceMesh(
-            static_image_mode=False,
-            max_num_faces=config.MAX_NUM_FACES,
-            refine_landmarks=False,
-            min_detection_confidence=detection_confidence,
-            min_tracking_confidence=tracking_confidence
-        )
+        config.configure_mediapipe_resources()
+
+        # Tasks 모델이 있으면 Tasks API, 없으면 기존 solutions API
+        self._landmarker = None
+        model_path = _tasks_model_path(config.FACE_LANDMARKER_MODEL)
+        if model_path is not None:
+            self._landmarker = _create_landmarker(
+                'face', model_path, detection_confidence, tracking_confidence)
+            self._clock = _VideoClock()
+
+        self.face_mesh = None
+        if self._landmarker is None:
+            mp = _mediapipe()
+            self.face_mesh = mp.solutions.face_mesh.FaceMesh(
+                static_image_mode=False,
+                max_num_faces=config.MAX_NUM_FACES,
+                refine_landmarks=False,
+                min_detection_confidence=detection_confidence,
+                min_tracking_confidence=tracking_confidence
+            )
     
     def detect(self, rgb_image):
         """
         얼굴 검출 및 처리
         
         Args:
-            rgb_image: RGB 이미지 (numpy array)
+            rgb_image: RGB 이미지 (C-contiguous uint8 HxWx3, 호출부에서 재사용 가능)
         
         Returns:
             얼굴 랜드마크 또는 None
         """
-        results = self.face_mesh.process(rgb_image)
+        if self._landmarker is not None:
+            mp = _mediapipe()
+            image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_image)
+            result = self._landmarker.detect_for_video(image, self._clock.next_ms())
+            if result.face_landmarks:
+                return _LandmarkList(result.face_landmarks[0])
+            return None
+
+        # 읽기 전용으로 표시하면 MediaPipe가 내부 복사 없이 참조로 전달
+        # (호출자의 배열이므로 추론 후 원래 플래그로 복구)
+        writeable = rgb_image.flags.writeable
+        rgb_image.flags.writeable = False
+        try:
+            results = self.face_mesh.process(rgb_image)
+        finally:
+            rgb_image.flags.writeable = writeable
         
         if results.multi_face_landmarks:
             return results.multi_face_landmarks[0]
@@ -64,34 +260,48 @@ class FaceDetector:
         """
         lm = face_landmarks.landmark
         
-        def get_point_3d(index):
-            """랜드마크 인덱스 → 3D 좌표"""
-            point_xy = np.array([lm[index].x * image_width, 
-                                lm[index].y * image_height], dtype=np.float32)
-            point_z = float(lm[index].z) * image_width
-            return (point_xy, point_z)
-        
-        # 오른쪽 눈 (사용자 기준 왼쪽)
-        r_outer_xy, r_outer_z = get_point_3d(config.R_EYE_OUTER)
-        r_inner_xy, r_inner_z = get_point_3d(config.R_EYE_INNER)
-        r_center_xy = 0.5 * (r_outer_xy + r_inner_xy)
-        r_center_z = 0.5 * (r_outer_z + r_inner_z)
+        # 눈꼬리 4점 (오른쪽 바깥/안쪽, 왼쪽 바깥/안쪽)을 (4, 3) 배열로 모아 한 번에 스케일
+        pts = np.array([
+            (lm[i].x, lm[i].y, lm[i].z)
+            for i in (_R_EYE_OUTER, _R_EYE_INNER, _L_EYE_OUTER, _L_EYE_INNER)
+        ])
+        pts *= (image_width, image_height, image_width)
         
-        # 왼쪽 눈 (사용자 기준 오른쪽)
-        l_outer_xy, l_outer_z = get_point_3d(config.L_EYE_OUTER)
-        l_inner_xy, l_inner_z = get_point_3d(config.L_EYE_INNER)
-        l_center_xy = 0.5 * (l_outer_xy + l_inner_xy)
-        l_center_z = 0.5 * (l_outer_z + l_inner_z)
+        # 오른쪽 눈 (사용자 기준 왼쪽), 왼쪽 눈 (사용자 기준 오른쪽)
+        r_center = 0.5 * (pts[0] + pts[1])
+        l_center = 0.5 * (pts[2] + pts[3])
         
         # 양안 중점
-        eye_midpoint_xy = 0.5 * (r_center_xy + l_center_xy)
-        eye_midpoint_z = 0.5 * (r_center_z + l_center_z)
+        mid = 0.5 * (r_center + l_center)
+        
+        r_center_xy = r_center[:2].astype(np.float32)
+        l_center_xy = l_center[:2].astype(np.float32)
+        eye_midpoint_xy = mid[:2].astype(np.float32)
+        eye_midpoint_z = float(mid[2])
         
         return (r_center_xy, l_center_xy, eye_midpoint_xy, eye_midpoint_z)
     
     def close(self):
         """리소스 해제"""
-        self.face_mesh.close()
+        if self._landmarker is not None:
+            self._landmarker.close()
+        else:
+            self.face_mesh.close()
+
+
+def landmarks_array(landmarks_2d):
+    """
+    HandLandmarks → (21, 2) 좌표 배열
+
+    21개 점을 하나의 배열로 쌓아 복사한다. 이미 (21, 2) float32 배열이면 그대로 반환.
+
+    Args:
+        landmarks_2d: 2D 랜드마크 (HandLandmarks 또는 (21, 2) 배열)
+
+    Returns:
+        np.ndarray: (21, 2) float32 배열
+    """
+    return np.asarray(landmarks_2d, dtype=np.float32)
 
 
 class HandDetector:
@@ -103,31 +313,71 @@ class HandDetector:
     
     def __init__(self,
                  detection_confidence=config.HAND_DETECTION_CONFIDENCE,
-                 tracking_confidence=config.HAND_TRACKING_CONFIDENCE):
+                 tracking_confidence=config.HAND_TRACKING_CONFIDENCE,
+                 model_complexity=config.HAND_MODEL_COMPLEXITY,
+                 max_num_hands=config.MAX_NUM_HANDS):
         """
         Args:
             detection_confidence: 검출 신뢰도 임계값
             tracking_confidence: 추적 신뢰도 임계값
+            model_complexity: 랜드마크 모델 복잡도 (0: lite, 1: full, solutions API만 해당)
+            max_num_hands: 최대 검출 손 개수
         """
-        self.hands = mp.solutions.hands.Hands(
-            static_image_mode=False,
-            max_num_hands=config.MAX_NUM_HANDS,
-            min_detection_confidence=detection_confidence,
-            min_tracking_confidence=tracking_confidence
-        )
+        config.configure_mediapipe_resources()
+        self.max_num_hands = max_num_hands
+
+        # Tasks 모델이 있으면 Tasks API, 없으면 기존 solutions API
+        self._landmarker = None
+        model_path = _tasks_model_path(config.HAND_LANDMARKER_MODEL)
+        if model_path is not None:
+            self._landmarker = _create_landmarker(
+                'hand', model_path, detection_confidence, tracking_confidence,
+                max_results=max_num_hands)
+            self._clock = _VideoClock()
+
+        self.hands = None
+        mp = _mediapipe()
+        if self._landmarker is None:
+            self.hands = mp.solutions.hands.Hands(
+                static_image_mode=False,
+                max_num_hands=max_num_hands,
+                model_complexity=model_complexity,
+                min_detection_confidence=detection_confidence,
+                min_tracking_confidence=tracking_confidence
+            )
         self.drawer = mp.solutions.drawing_utils
+        self._hand_connections = mp.solutions.hands.HAND_CONNECTIONS
+
+        # 픽셀 변환 스케일 캐시
+        self._scale_key = None
+        self._scale = None
     
     def detect(self, rgb_image):
         """
         손 검출 및 처리
 
         Args:
-            rgb_image: RGB 이미지 (numpy array)
+            rgb_image: RGB 이미지 (C-contiguous uint8 HxWx3, 호출부에서 재사용 가능)
 
         Returns:
             손 랜드마크 리스트 또는 None
         """
-        results = self.hands.process(rgb_image)
+        if self._landmarker is not None:
+            mp = _mediapipe()
+            image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_image)
+            result = self._landmarker.detect_for_video(image, self._clock.next_ms())
+            if result.hand_landmarks:
+                return [_LandmarkList(hand) for hand in result.hand_landmarks]
+            return None
+
+        # 읽기 전용으로 표시하면 MediaPipe가 내부 복사 없이 참조로 전달
+        # (호출자의 배열이므로 추론 후 원래 플래그로 복구)
+        writeable = rgb_image.flags.writeable
+        rgb_image.flags.writeable = False
+        try:
+            results = self.hands.process(rgb_image)
+        finally:
+            rgb_image.flags.writeable = writeable
 
         if results.multi_hand_landmarks:
             return results.multi_hand_landmarks
@@ -141,10 +391,17 @@ class HandDetector:
             image: 그릴 이미지 (numpy array, BGR)
             hand_landmarks: MediaPipe 손 랜드마크
         """
+        if isinstance(hand_landmarks, _LandmarkList):
+            # drawing_utils는 protobuf 랜드마크 리스트를 요구
+            landmark_pb2 = _landmark_pb2()
+            hand_landmarks = landmark_pb2.NormalizedLandmarkList(landmark=[
+                landmark_pb2.NormalizedLandmark(x=p.x, y=p.y, z=p.z)
+                for p in hand_landmarks.landmark
+            ])
         self.drawer.draw_landmarks(
             image, 
             hand_landmarks, 
-            mp.solutions.hands.HAND_CONNECTIONS
+            self._hand_connections
         )
     
     def get_landmarks_2d(self, hand_landmarks, image_width, image_height):
@@ -157,73 +414,24 @@ class HandDetector:
             image_height: 이미지 높이
 
         Returns:
-            dict: {landmark_name: (x, y)}
+            HandLandmarks: 랜드마크별 (x, y) 좌표
         """
-        lm = hand_landmarks.landmark
+        # 21개 점을 한 번에 (21, 2) 배열로 모은 뒤 한 번의 곱셈으로 픽셀 변환
+        # 곱셈은 float64로 계산하고 결과를 float32 출력 버퍼에 바로 기록 (중간 배열 없음)
+        # 양손을 동시에 비교하고 이전 프레임 좌표를 보관하는 호출부(스크롤)가 있으므로
+        # 출력 버퍼는 프레임 간에 재사용하지 않고 호출마다 새로 할당
+        raw = np.array([(p.x, p.y) for p in hand_landmarks.landmark], dtype=np.float64)
+        pts = np.empty(raw.shape, dtype=np.float32)
+        np.multiply(raw, self._pixel_scale(image_width, image_height), out=pts, casting='same_kind')
 
-        def get_point_2d(landmark_enum):
-            """랜드마크 enum → 2D 좌표"""
-            return np.array([
-                lm[landmark_enum].x * image_width,
-                lm[landmark_enum].y * image_height
-            ], dtype=np.float32)
-
-        # 엄지
-        thm_cmc = get_point_2d(mp.solutions.hands.HandLandmark.THUMB_CMC)
-        thm_mcp = get_point_2d(mp.solutions.hands.HandLandmark.THUMB_MCP)
-        thm_ip = get_point_2d(mp.solutions.hands.HandLandmark.THUMB_IP)
-        thm_tip = get_point_2d(mp.solutions.hands.HandLandmark.THUMB_TIP)
-
-        # 검지
-        idx_mcp = get_point_2d(mp.solutions.hands.HandLandmark.INDEX_FINGER_MCP)
-        idx_pip = get_point_2d(mp.solutions.hands.HandLandmark.INDEX_FINGER_PIP)
-        idx_dip = get_point_2d(mp.solutions.hands.HandLandmark.INDEX_FINGER_DIP)
-        idx_tip = get_point_2d(mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP)
-
-        # 중지
-        mid_mcp = get_point_2d(mp.solutions.hands.HandLandmark.MIDDLE_FINGER_MCP)
-        mid_pip = get_point_2d(mp.solutions.hands.HandLandmark.MIDDLE_FINGER_PIP)
-        mid_dip = get_point_2d(mp.solutions.hands.HandLandmark.MIDDLE_FINGER_DIP)
-        mid_tip = get_point_2d(mp.solutions.hands.HandLandmark.MIDDLE_FINGER_TIP)
-
-        # 약지
-        ring_mcp = get_point_2d(mp.solutions.hands.HandLandmark.RING_FINGER_MCP)
-        ring_pip = get_point_2d(mp.solutions.hands.HandLandmark.RING_FINGER_PIP)
-        ring_dip = get_point_2d(mp.solutions.hands.HandLandmark.RING_FINGER_DIP)
-        ring_tip = get_point_2d(mp.solutions.hands.HandLandmark.RING_FINGER_TIP)
-
-        # 새끼
-        pinky_mcp = get_point_2d(mp.solutions.hands.HandLandmark.PINKY_MCP)
-        pinky_pip = get_point_2d(mp.solutions.hands.HandLandmark.PINKY_PIP)
-        pinky_dip = get_point_2d(mp.solutions.hands.HandLandmark.PINKY_DIP)
-        pinky_tip = get_point_2d(mp.solutions.hands.HandLandmark.PINKY_TIP)
-
-        # 손목
-        wrist = get_point_2d(mp.solutions.hands.HandLandmark.WRIST)
+        return HandLandmarks._make(pts)
 
-        return {
-            'wrist': wrist,
-            'thm_cmc': thm_cmc,
-            'thm_mcp': thm_mcp,
-            'thm_ip': thm_ip,
-            'thm_tip': thm_tip,
-            'idx_mcp': idx_mcp,
-            'idx_pip': idx_pip,
-            'idx_dip': idx_dip,
-            'idx_tip': idx_tip,
-            'mid_mcp': mid_mcp,
-            'mid_pip': mid_pip,
-            'mid_dip': mid_dip,
-            'mid_tip': mid_tip,
-            'ring_mcp': ring_mcp,
-            'ring_pip': ring_pip,
-            'ring_dip': ring_dip,
-            'ring_tip': ring_tip,
-            'pinky_mcp': pinky_mcp,
-            'pinky_pip': pinky_pip,
-            'pinky_dip': pinky_dip,
-            'pinky_tip': pinky_tip
-        }
+    def _pixel_scale(self, image_width, image_height):
+        """(W, H) 스케일 배열 캐시 (해상도가 바뀔 때만 재생성)"""
+        if self._scale_key != (image_width, image_height):
+            self._scale_key = (image_width, image_height)
+            self._scale = np.array(self._scale_key, dtype=np.float64)
+        return self._scale
 
     def get_landmarks_3d(self, hand_landmarks, image_width):
         """
@@ -238,14 +446,26 @@ class HandDetector:
         """
         lm = hand_landmarks.landmark
 
-        idx_tip_z = float(lm[mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP].z) * image_width
-        thm_tip_z = float(lm[mp.solutions.hands.HandLandmark.THUMB_TIP].z) * image_width
+        idx_tip_z = float(lm[INDEX_FINGER_TIP].z) * image_width
+        thm_tip_z = float(lm[THUMB_TIP].z) * image_width
 
         return {
             'idx_tip_z': idx_tip_z,
             'thm_tip_z': thm_tip_z
         }
 
+    def get_normalized_landmarks_array(self, hand_landmarks):
+        """
+        MediaPipe 정규화 좌표를 그대로 (21, 3) 배열로 추출
+
+        Args:
+            hand_landmarks: MediaPipe 손 랜드마크
+
+        Returns:
+            np.ndarray: (21, 3) float32 (x, y: 0.0~1.0, z: 손목 기준 상대 깊이)
+        """
+        return np.array([(p.x, p.y, p.z) for p in hand_landmarks.landmark], dtype=np.float32)
+
     def get_normalized_landmarks(self, hand_landmarks):
         """
         정규화된 랜드마크 좌표 추출 (0.0~1.0)
@@ -259,12 +479,13 @@ class HandDetector:
         lm = hand_landmarks.landmark
 
         return {
-            'idx_mcp': (lm[mp.solutions.hands.HandLandmark.INDEX_FINGER_MCP].x,
-                       lm[mp.solutions.hands.HandLandmark.INDEX_FINGER_MCP].y),
-            'mid_mcp': (lm[mp.solutions.hands.HandLandmark.MIDDLE_FINGER_MCP].x,
-                       lm[mp.solutions.hands.HandLandmark.MIDDLE_FINGER_MCP].y)
+            'idx_mcp': (lm[INDEX_FINGER_MCP].x, lm[INDEX_FINGER_MCP].y),
+            'mid_mcp': (lm[MIDDLE_FINGER_MCP].x, lm[MIDDLE_FINGER_MCP].y)
         }
 
     def close(self):
         """리소스 해제"""
-        self.hands.close()
\ No newline at end of file
+        if self._landmarker is not None:
+            self._landmarker.close()
+        else:
+            self.hands.close()
\ No newline at end of file
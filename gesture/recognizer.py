@@ -4,8 +4,82 @@ Gesture Recognition Module
 Pinch 거리 계산
 """
 
-from utils.math_utils import angle_at_joint, l2_distance
+from typing import NamedTuple
+
+import numpy as np
+
+from utils.math_utils import l2_distance, angles_at_joints
 import config
+from .detector import (
+    THUMB_CMC, THUMB_MCP, THUMB_IP,
+    INDEX_FINGER_MCP, INDEX_FINGER_PIP, INDEX_FINGER_DIP,
+    MIDDLE_FINGER_MCP, MIDDLE_FINGER_PIP, MIDDLE_FINGER_DIP,
+    RING_FINGER_MCP, RING_FINGER_PIP, RING_FINGER_DIP,
+    PINKY_MCP, PINKY_PIP, PINKY_DIP,
+    INDEX_FINGER_TIP, THUMB_TIP
+)
+
+# 손가락별 각도 계산 관절 (HandLandmark 인덱스)
+# 엄지 CMC-MCP-IP, 검지/중지/약지/새끼 MCP-PIP-DIP
+_FINGER_JOINTS = np.array([
+    [THUMB_CMC, THUMB_MCP, THUMB_IP],
+    [INDEX_FINGER_MCP, INDEX_FINGER_PIP, INDEX_FINGER_DIP],
+    [MIDDLE_FINGER_MCP, MIDDLE_FINGER_PIP, MIDDLE_FINGER_DIP],
+    [RING_FINGER_MCP, RING_FINGER_PIP, RING_FINGER_DIP],
+    [PINKY_MCP, PINKY_PIP, PINKY_DIP],
+])
+
+
+class HandFeatures(NamedTuple):
+    """
+    프레임당 한 번 계산해 모든 인식기가 공유하는 손 특징값
+    
+    각도는 관절 기준 구부림 각도 (degree), 거리는 픽셀 단위
+    """
+    thumb_angle: float
+    idx_angle: float
+    mid_angle: float
+    ring_angle: float
+    pinky_angle: float
+    pinch_dist: float
+
+
+def _joint_angles(pts, joints=_FINGER_JOINTS):
+    """
+    여러 관절 각도를 한 번에 계산 (angle_at_joint와 동일한 식)
+    
+    Args:
+        pts: (21, 2) 랜드마크 좌표 배열
+        joints: (N, 3) 관절 인덱스 (a, b, c), b가 중심 관절
+    
+    Returns:
+        np.ndarray: (N,) 각도 (degree)
+    """
+    tri = pts[joints]
+    return angles_at_joints(tri[:, 0], tri[:, 1], tri[:, 2])
+
+
+def compute_hand_features(landmarks_2d):
+    """
+    5개 손가락 각도와 Pinch 거리를 한 번에 계산
+    
+    Args:
+        landmarks_2d: 2D 랜드마크 (HandLandmarks 또는 (21, 2) 배열)
+    
+    Returns:
+        HandFeatures
+    """
+    # 21개 점을 (21, 2) float64 배열로 한 번에 모음
+    pts = np.asarray(landmarks_2d, dtype=np.float64)
+    
+    # 5개 손가락 (a, b, c) 관절 좌표를 (5, 3, 2)로 모아 각도를 한 번에 계산
+    angles = _joint_angles(pts)
+    
+    # Pinch 거리 (검지 끝 ↔ 엄지 끝)
+    d = pts[INDEX_FINGER_TIP] - pts[THUMB_TIP]
+    pinch_dist = float(np.sqrt(d[0] * d[0] + d[1] * d[1]))
+    
+    return HandFeatures(*angles.tolist(), pinch_dist)
 
 
 class FingerGestureRecognizer:
@@ -33,34 +107,20 @@ class FingerGestureRecognizer:
         self.drag_in_angle = drag_in_angle
         self.drag_out_angle = drag_out_angle
     
-    def calculate_finger_angles(self, landmarks_2d):
+    def drag_transition(self, middle_angle, dragging):
         """
-        손가락 관절 각도 계산
+        드래그 상태 전이 판정 (Hysteresis 포함)
         
         Args:
-            landmarks_2d: 2D 랜드마크 dict (from HandDetector.get_landmarks_2d)
+            middle_angle: 중지 각도
+            dragging: 현재 드래그 중 여부
         
         Returns:
-            dict: {'idx': index_angle, 'mid': middle_angle}
-        """
-        # 검지 각도 (PIP 관절 기준)
-        idx_angle = angle_at_joint(
-            landmarks_2d['idx_mcp'],
-            landmarks_2d['idx_pip'],
-            landmarks_2d['idx_dip']
-        )
-        
-        # 중지 각도 (PIP 관절 기준)
-        mid_angle = angle_at_joint(
-            landmarks_2d['mid_mcp'],
-            landmarks_2d['mid_pip'],
-            landmarks_2d['mid_dip']
-        )
-        
-        return {
-            'idx': idx_angle,
-            'mid': mid_angle
-        }
+            int: +1 (드래그 시작), -1 (드래그 종료), 0 (변화 없음)
+        """
+        if dragging:
+            return -(middle_angle >= self.drag_out_angle)
+        return int(middle_angle <= self.drag_in_angle)
     
     def is_click_triggered(self, index_angle):
         """
@@ -128,7 +188,19 @@ class PinchRecognizer:
         Returns:
             float: Pinch 거리 (픽셀)
         """
-        return l2_distance(landmarks_2d['idx_tip'], landmarks_2d['thm_tip'])
+        return l2_distance(landmarks_2d.idx_tip, landmarks_2d.thm_tip)
+    
+    def pinch_distance(self, features):
+        """
+        Pinch 거리 (미리 계산된 특징값 사용)
+        
+        Args:
+            features: HandFeatures
+        
+        Returns:
+            float: Pinch 거리 (픽셀)
+        """
+        return features.pinch_dist
 
 
 class ShakaModeRecognizer:
@@ -148,70 +220,37 @@ class ShakaModeRecognizer:
             hold_duration_ms: 제스처 유지 시간 (밀리초)
         """
         self.hold_duration_ms = hold_duration_ms
+        self._inv_hold = 1.0 / float(hold_duration_ms)
         self.gesture_start_time = None
         self.gesture_confirmed = False
 
+    def is_shaka(self, features):
+        """
+        엄지+새끼만 펴진 상태 확인 (미리 계산된 특징값 사용)
+
+        Args:
+            features: HandFeatures
+
+        Returns:
+            bool: Shaka 제스처 여부
+        """
+        return (features.thumb_angle > 150.0
+                and features.idx_angle < 140.0
+                and features.mid_angle < 140.0
+                and features.ring_angle < 140.0
+                and features.pinky_angle > 150.0)
+
     def is_shaka_gesture(self, landmarks_2d):
         """
         엄지+새끼만 펴진 상태 확인
 
         Args:
-            landmarks_2d: 2D 랜드마크 dict
+            landmarks_2d: 2D 랜드마크 (HandLandmarks)
 
         Returns:
             bool: Shaka 제스처 여부
         """
-        from utils.math_utils import angle_at_joint
-
-        # 엄지 펴짐 판단 (CMC-MCP-IP 각도)
-        thumb_angle = angle_at_joint(
-            landmarks_2d['thm_cmc'],
-            landmarks_2d['thm_mcp'],
-            landmarks_2d['thm_ip']
-        )
-
-        # 검지 각도
-        index_angle = angle_at_joint(
-            landmarks_2d['idx_mcp'],
-            landmarks_2d['idx_pip'],
-            landmarks_2d['idx_dip']
-        )
-
-        # 중지 각도
-        middle_angle = angle_at_joint(
-            landmarks_2d['mid_mcp'],
-            landmarks_2d['mid_pip'],
-            landmarks_2d['mid_dip']
-        )
-
-        # 약지 각도
-        ring_angle = angle_at_joint(
-            landmarks_2d['ring_mcp'],
-            landmarks_2d['ring_pip'],
-            landmarks_2d['ring_dip']
-        )
-
-        # 새끼 각도
-        pinky_angle = angle_at_joint(
-            landmarks_2d['pinky_mcp'],
-            landmarks_2d['pinky_pip'],
-            landmarks_2d['pinky_dip']
-        )
-
-        # 판정 기준
-        thumb_extended = thumb_angle > 150      # 엄지 펴짐
-        index_curled = index_angle < 140        # 검지 접힘
-        middle_curled = middle_angle < 140      # 중지 접힘
-        ring_curled = ring_angle < 140          # 약지 접힘
-        pinky_extended = pinky_angle > 150      # 새끼 펴짐
-
-        is_shaka = (thumb_extended and
-                    index_curled and
-                    middle_curled and
-                    ring_curled and
-                    pinky_extended)
-
-        return is_shaka
+        return self.is_shaka(compute_hand_features(landmarks_2d))
 
     def check_hold_duration(self, is_shaka, current_time_ms):
         """
@@ -224,27 +263,29 @@ class ShakaModeRecognizer:
         Returns:
             (bool, float): (모드 전환 트리거, 진행률 0.0~1.0)
         """
-        if is_shaka:
-            if self.gesture_start_time is None:
-                # 제스처 시작
-                self.gesture_start_time = current_time_ms
-                self.gesture_confirmed = False
-
-            elapsed = current_time_ms - self.gesture_start_time
-            progress = min(1.0, elapsed / self.hold_duration_ms)
-
-            if elapsed >= self.hold_duration_ms and not self.gesture_confirmed:
-                # 2초 완료 - 모드 전환 트리거
-                self.gesture_confirmed = True
-                return (True, 1.0)
-
-            return (False, progress)
-        else:
+        if not is_shaka:
             # 제스처 해제
             self.gesture_start_time = None
             self.gesture_confirmed = False
             return (False, 0.0)
 
+        if self.gesture_start_time is None:
+            # 제스처 시작
+            self.gesture_start_time = current_time_ms
+            self.gesture_confirmed = False
+
+        elapsed = current_time_ms - self.gesture_start_time
+
+        if elapsed >= self.hold_duration_ms and not self.gesture_confirmed:
+            # 2초 완료 - 모드 전환 트리거
+            self.gesture_confirmed = True
+            return (True, 1.0)
+
+        progress = elapsed * self._inv_hold
+        if progress > 1.0:
+            progress = 1.0
+        return (False, progress)
+
     def reset(self):
         """상태 초기화"""
         self.gesture_start_time = None
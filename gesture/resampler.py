@@ -0,0 +1,155 @@
+"""
+Temporal Resampler Module
+손 검출 추론 프레임 건너뛰기 + 랜드마크 예측 보간
+"""
+
+import itertools
+
+import numpy as np
+
+import config
+from .detector import _LandmarkList
+
+
+class _Landmark:
+    """예측된 정규화 랜드마크 (MediaPipe 랜드마크와 같은 x, y, z 인터페이스)"""
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+def _match_hands(prev, curr):
+    """
+    직전 추론의 손 순서를 최근 추론에 맞게 재배열
+    (MediaPipe는 추론마다 손 순서를 보장하지 않으므로 손목 거리 합이 최소인 대응을 선택)
+
+    Args:
+        prev: (n_hands, 21, 3) 직전 추론 결과
+        curr: (n_hands, 21, 3) 최근 추론 결과
+
+    Returns:
+        curr의 손 순서에 맞춘 prev
+    """
+    n = len(curr)
+    if n < 2:
+        return prev
+
+    # dist[i, j]: curr 손 i와 prev 손 j의 손목 거리
+    dist = np.linalg.norm(curr[:, None, 0, :2] - prev[None, :, 0, :2], axis=2)
+    rows = range(n)
+    best = min(itertools.permutations(rows), key=lambda perm: dist[rows, perm].sum())
+    return prev[list(best)]
+
+
+class TemporalResampler:
+    """
+    MediaPipe 손 추론을 N 프레임에 한 번만 실행하고,
+    사이 프레임은 직전 두 추론 결과로 선형 외삽한 랜드마크를 반환
+
+    out = curr + prediction_ratio × (curr - prev)
+    (절반 주기 추론이면 prediction_ratio=0.5가 한 프레임 앞 위치)
+
+    손을 놓치면 매 프레임 추론하여 빠르게 재검출하고,
+    idle_after_misses번 넘게 연속으로 놓치면 idle_interval 프레임마다만 탐색
+
+    두 추론 사이 손은 손목 위치로 대응시키고,
+    손목이 max_wrist_jump보다 크게 튀면 다른 손으로 보고 외삽하지 않음
+    """
+
+    def __init__(self, hand_detector,
+                 inference_interval=config.HAND_INFERENCE_INTERVAL,
+                 prediction_ratio=config.PREDICTION_RATIO,
+                 idle_after_misses=config.HAND_IDLE_AFTER_MISSES,
+                 idle_interval=config.HAND_IDLE_INFERENCE_INTERVAL,
+                 max_wrist_jump=config.PREDICTION_MAX_WRIST_JUMP):
+        """
+        Args:
+            hand_detector: HandDetector 인스턴스
+            inference_interval: 추론 주기 (프레임, 1이면 매 프레임 추론)
+            prediction_ratio: 사이 프레임 외삽 비율
+            idle_after_misses: 저빈도 탐색으로 전환할 연속 미검출 추론 횟수
+            idle_interval: 저빈도 탐색 주기 (프레임)
+            max_wrist_jump: 외삽을 허용하는 추론 간 최대 손목 이동 (정규화 좌표)
+        """
+        self.hand_detector = hand_detector
+        self.inference_interval = max(1, int(inference_interval))
+        self.prediction_ratio = float(prediction_ratio)
+        self.idle_after_misses = int(idle_after_misses)
+        self.idle_interval = max(1, int(idle_interval))
+        self.max_wrist_jump = float(max_wrist_jump)
+
+        self._tick = 0
+        self._miss_streak = 0   # 연속 미검출 추론 횟수
+        self._prev = None   # (n_hands, 21, 3) 직전 추론 결과
+        self._curr = None   # (n_hands, 21, 3) 최근 추론 결과
+
+    def detect(self, rgb_image):
+        """
+        손 랜드마크 검출 (추론 프레임) 또는 예측 (사이 프레임)
+
+        Args:
+            rgb_image: RGB 이미지 (numpy array)
+
+        Returns:
+            손 랜드마크 리스트 (없으면 None)
+        """
+        tick = self._tick
+        self._tick += 1
+
+        if self._curr is None:
+            # 손이 오래 없으면 저빈도 탐색, 막 놓쳤으면 빠른 재검출을 위해 매 프레임 추론
+            if self._miss_streak > self.idle_after_misses and tick % self.idle_interval:
+                return None
+            return self._infer(rgb_image)
+
+        if tick % self.inference_interval == 0:
+            return self._infer(rgb_image)
+
+        if self._prev is None:
+            pts = self._curr
+        else:
+            pts = self._curr + self.prediction_ratio * (self._curr - self._prev)
+
+        return [
+            _LandmarkList([_Landmark(x, y, z) for x, y, z in hand])
+            for hand in pts.tolist()
+        ]
+
+    def _infer(self, rgb_image):
+        """MediaPipe 추론 실행 및 예측용 상태 갱신"""
+        hand_landmarks_list = self.hand_detector.detect(rgb_image)
+
+        if not hand_landmarks_list:
+            self._prev = None
+            self._curr = None
+            self._miss_streak += 1
+            return hand_landmarks_list
+
+        self._miss_streak = 0
+
+        curr = np.array([
+            [(p.x, p.y, p.z) for p in hand.landmark]
+            for hand in hand_landmarks_list
+        ])
+
+        # 손 개수가 바뀌거나 같은 손으로 대응되지 않으면 속도 추정 불가 → 외삽 없이 유지
+        self._prev = None
+        if self._curr is not None and self._curr.shape == curr.shape:
+            prev = _match_hands(self._curr, curr)
+            jump = np.linalg.norm(curr[:, 0, :2] - prev[:, 0, :2], axis=1).max()
+            if jump <= self.max_wrist_jump:
+                self._prev = prev
+        self._curr = curr
+
+        return hand_landmarks_list
+
+    def reset(self):
+        """상태 초기화"""
+        self._tick = 0
+        self._miss_streak = 0
+        self._prev = None
+        self._curr = None
@@ -6,14 +6,62 @@ Main Application with Mode Switching
 Shaka 제스처(🤙)로 모드 전환
 """
 
+import argparse
 import cv2
+import numpy as np
+import queue
+import threading
 import time
 import config
 from gesture import FaceDetector, HandDetector, FingerGestureRecognizer, PinchRecognizer, ShakaModeRecognizer
+from gesture import compute_hand_features, TemporalResampler, AdaptiveHandDetector
 from control import MouseController, ClickManager, CursorMapper, SystemCursorChanger
 from control import PinchZoomManager, ZoomGuard, VirtualKeyboard
 from state import StateManager, ModeManager
 from scroll import ScrollGestureManager
+from pipeline import CaptureThread, InferenceThread
+
+
+# HUD 스프라이트 영역 (x0, y0, x1, y1) - 테두리 두께까지 포함
+_MODE_SPRITE_ROI = (0, 0, 310, 70)
+
+# Shaka 진행률 바
+_BAR_X = 320
+_BAR_Y = 20
+_BAR_WIDTH = 200
+_BAR_HEIGHT = 30
+_BAR_SPRITE_ROI = (_BAR_X - 4, _BAR_Y - 4, _BAR_X + _BAR_WIDTH + 5, _BAR_Y + _BAR_HEIGHT + 5)
+
+# 스프라이트 배경 판별용 색 (HUD에서 쓰지 않는 값)
+_SPRITE_KEY = (1, 2, 3)
+
+
+def _render_sprite(roi, draw, *args):
+    """
+    정적 HUD 요소를 한 번만 그려 (스프라이트, 마스크)로 캐시
+
+    Args:
+        roi: 프레임 좌표계 영역 (x0, y0, x1, y1)
+        draw: draw(canvas, *args) 그리기 함수 (프레임 좌표계 기준)
+        *args: 그리기 함수 추가 인자
+
+    Returns:
+        (sprite, mask): ROI 크기 BGR 이미지, 그려진 픽셀 마스크
+    """
+    x0, y0, x1, y1 = roi
+    canvas = np.empty((y1, x1, 3), dtype=np.uint8)
+    canvas[:] = _SPRITE_KEY
+    draw(canvas, *args)
+
+    sprite = canvas[y0:y1, x0:x1].copy()
+    mask = np.any(sprite != _SPRITE_KEY, axis=2, keepdims=True)
+    return sprite, mask
+
+
+def _blit_sprite(frame, roi, sprite, mask):
+    """캐시된 스프라이트를 프레임에 복사 (그려진 픽셀만)"""
+    x0, y0, x1, y1 = roi
+    np.copyto(frame[y0:y1, x0:x1], sprite, where=mask)
 
 
 class AirTouchApp:
@@ -23,15 +71,42 @@ class AirTouchApp:
     - 키보드 모드: 가상 키보드
     """
 
-    def __init__(self):
+    def __init__(self, show_window=config.SHOW_WINDOW):
+        """
+        Args:
+            show_window: 미리보기 창 표시 여부 (False면 헤드리스)
+        """
         # 웹캠 초기화
         self.cap = cv2.VideoCapture(config.CAM_INDEX, cv2.CAP_DSHOW)
+        # 압축 포맷은 해상도보다 먼저 지정해야 적용되는 드라이버가 있음
+        if config.CAM_FOURCC:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*config.CAM_FOURCC))
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.CAM_WIDTH)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.CAM_HEIGHT)
-
-        # 검출기
-        self.face_detector = FaceDetector()
-        self.hand_detector = HandDetector()
+        # 드라이버 버퍼에 오래된 프레임이 쌓이지 않도록 (입력 지연 ≈ 1프레임)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, config.CAM_BUFFER_SIZE)
+        # 자동 초점/노출 탐색으로 인한 프레임 지연 방지
+        if config.CAM_DISABLE_AUTOFOCUS:
+            self.cap.set(cv2.CAP_PROP_AUTOFOCUS, 0)
+        if config.CAM_DISABLE_AUTO_EXPOSURE:
+            self.cap.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.25)  # DSHOW: 0.25 = 수동, 0.75 = 자동
+        self._rgb_buf = None
+        self._small_buf = None
+
+        # 추론 전처리 OpenCL 가속 (지원 장치가 있을 때만)
+        self.use_opencl = bool(config.USE_OPENCL and cv2.ocl.haveOpenCL())
+        cv2.ocl.setUseOpenCL(self.use_opencl)
+
+        # 검출기 (MediaPipe 그래프는 첫 추론 시 생성 → 웹캠/창이 먼저 뜨도록)
+        self.face_detector = None
+        self.hand_detector = None
+        self.hand_resampler = None
+        self._hand_source = None   # 추론에 쓰는 손 검출기 (적응 전환 시 lite/full 쌍)
+
+        # 얼굴 추론 프레임 건너뛰기 (직전 결과 재사용)
+        self.face_inference_interval = max(1, int(config.FACE_INFERENCE_INTERVAL))
+        self._face_tick = 0
+        self._last_face = None
 
         # 제스처 인식기
         self.finger_recognizer = FingerGestureRecognizer()
@@ -66,6 +141,8 @@ class AirTouchApp:
         self.pinch_zoom_manager = PinchZoomManager(
             px_per_step=config.PX_PER_STEP,
             deadzone_px=config.DEADZONE_PX,
+            deadzone_full_speed=config.DEADZONE_FULL_SPEED,
+            deadzone_curve=config.DEADZONE_CURVE,
             max_steps_per_frame=config.MAX_STEPS_PER_FRAME,
             z_normalization_enabled=config.Z_NORMALIZATION_ENABLED,
             min_z_for_normalization=config.MIN_Z_FOR_NORMALIZATION,
@@ -97,60 +174,77 @@ class AirTouchApp:
         # Shaka 제스처 진행률 (시각화용)
         self.shaka_progress = 0.0
 
-    def draw_mode_indicator(self, frame):
-        """모드 표시"""
-        mode = self.mode_manager.get_mode()
+        # 미리보기 표시 (헤드리스면 오버레이/imshow 모두 생략)
+        self.show_window = show_window
+        self.display_every_n = max(1, int(config.HUD_REDRAW_EVERY_N))
+        self._frame_idx = 0
+        self._draw_overlay = show_window   # 이번 프레임 오버레이 그리기 여부
 
-        if mode == ModeManager.TOUCH_MODE:
-            color = (0, 255, 0)  # 초록색
-            text = "MODE: TOUCH"
-        else:
-            color = (255, 0, 255)  # 자홍색
-            text = "MODE: KEYBOARD"
-
-        # 배경
-        cv2.rectangle(frame, (10, 10), (300, 60), (0, 0, 0), -1)
-        cv2.rectangle(frame, (10, 10), (300, 60), color, 3)
+        # 정적 HUD 요소 사전 렌더링
+        self._build_hud_sprites()
 
-        # 텍스트
-        cv2.putText(frame, text, (20, 45),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.0, color, 2)
+        # 키 입력 디스패치 테이블
+        self._build_key_handlers()
 
-    def draw_shaka_progress(self, frame):
-        """Shaka 제스처 진행률 표시"""
-        if self.shaka_progress > 0:
-            bar_x = 320
-            bar_y = 20
-            bar_width = 200
-            bar_height = 30
+    def _build_hud_sprites(self):
+        """모드 표시 / Shaka 진행률 배경 스프라이트 사전 렌더링"""
 
+        def draw_mode(canvas, color, text):
             # 배경
-            cv2.rectangle(frame, (bar_x, bar_y),
-                         (bar_x + bar_width, bar_y + bar_height),
+            cv2.rectangle(canvas, (10, 10), (300, 60), (0, 0, 0), -1)
+            cv2.rectangle(canvas, (10, 10), (300, 60), color, 3)
+
+            # 텍스트
+            cv2.putText(canvas, text, (20, 45),
+                       cv2.FONT_HERSHEY_SIMPLEX, 1.0, color, 2)
+
+        self._mode_sprites = {
+            ModeManager.TOUCH_MODE: _render_sprite(
+                _MODE_SPRITE_ROI, draw_mode, (0, 255, 0), "MODE: TOUCH"),        # 초록색
+            ModeManager.KEYBOARD_MODE: _render_sprite(
+                _MODE_SPRITE_ROI, draw_mode, (255, 0, 255), "MODE: KEYBOARD"),   # 자홍색
+        }
+
+        def draw_bar_bg(canvas):
+            cv2.rectangle(canvas, (_BAR_X, _BAR_Y),
+                         (_BAR_X + _BAR_WIDTH, _BAR_Y + _BAR_HEIGHT),
                          (50, 50, 50), -1)
-            cv2.rectangle(frame, (bar_x, bar_y),
-                         (bar_x + bar_width, bar_y + bar_height),
+            cv2.rectangle(canvas, (_BAR_X, _BAR_Y),
+                         (_BAR_X + _BAR_WIDTH, _BAR_Y + _BAR_HEIGHT),
                          (200, 200, 200), 2)
 
+        self._bar_sprite = _render_sprite(_BAR_SPRITE_ROI, draw_bar_bg)
+
+    def draw_mode_indicator(self, frame):
+        """모드 표시"""
+        _blit_sprite(frame, _MODE_SPRITE_ROI, *self._mode_sprites[self.mode_manager.get_mode()])
+
+    def draw_shaka_progress(self, frame):
+        """Shaka 제스처 진행률 표시"""
+        if self.shaka_progress > 0:
+            # 배경 (사전 렌더링)
+            _blit_sprite(frame, _BAR_SPRITE_ROI, *self._bar_sprite)
+
             # 진행률
-            fill_width = int(bar_width * self.shaka_progress)
+            fill_width = int(_BAR_WIDTH * self.shaka_progress)
             if fill_width > 0:
                 color = (0, 255, 255) if self.shaka_progress < 1.0 else (0, 255, 0)
-                cv2.rectangle(frame, (bar_x, bar_y),
-                             (bar_x + fill_width, bar_y + bar_height),
+                cv2.rectangle(frame, (_BAR_X, _BAR_Y),
+                             (_BAR_X + fill_width, _BAR_Y + _BAR_HEIGHT),
                              color, -1)
 
             # 텍스트
             text = f"Hold: {int(self.shaka_progress * 100)}%"
-            cv2.putText(frame, text, (bar_x + 10, bar_y + 22),
+            cv2.putText(frame, text, (_BAR_X + 10, _BAR_Y + 22),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
 
     def process_touch_mode(self, frame, eye_mid_z, idx_tip_z, thm_tip_z,
-                          landmarks_2d, angles, pinch_distance, shaka_detected=False,
-                          hand_landmarks_list=None):
+                          landmarks_2d, features, shaka_detected=False,
+                          hand_landmarks_list=None, now_ms=None):
         """터치 모드 처리"""
         hud = []
-        now_ms = int(time.time() * 1000)
+        if now_ms is None:
+            now_ms = time.perf_counter_ns() // 1_000_000
 
         # Z 거리 계산 및 상태 판정
         z_distance = abs(eye_mid_z - idx_tip_z)
@@ -180,9 +274,10 @@ class AirTouchApp:
         hud.append("ACTIVE" if state_info['active'] else "IDLE")
 
         # ACTIVE 상태: Pinch Zoom
-        if state_info['active'] and pinch_distance is not None and thm_tip_z is not None:
+        if state_info['active'] and features is not None and thm_tip_z is not None:
             steps_to_fire, zoom_info = self.pinch_zoom_manager.process_pinch(
-                pinch_distance, idx_tip_z, thm_tip_z
+                self.pinch_recognizer.pinch_distance(features), idx_tip_z, thm_tip_z,
+                current_time_ms=now_ms
             )
 
             # Zoom 허용 체크
@@ -199,7 +294,7 @@ class AirTouchApp:
                 self.pinch_zoom_manager.execute_zoom(steps_to_fire)
 
         # IDLE 상태: 클릭/드래그 제스처
-        if not state_info['active'] and angles is not None:
+        if not state_info['active'] and features is not None:
             if self.cursor_on:
                 if shaka_detected:
                     hud.append("(IDLE) cursor only - Shaka blocking clicks/drag")
@@ -209,19 +304,19 @@ class AirTouchApp:
             # Shaka 제스처 중에는 클릭/드래그 차단
             if not shaka_detected:
                 # 클릭 (검지)
-                if self.finger_recognizer.is_click_triggered(angles['idx']):
+                if self.finger_recognizer.is_click_triggered(features.idx_angle):
                     if self.click_manager.can_click(now_ms):
                         self.mouse_controller.click()
                         self.click_manager.register_click(now_ms)
 
                 # 드래그 (중지)
-                if self.finger_recognizer.is_drag_triggered(angles['mid']):
-                    if not self.mouse_controller.is_dragging():
-                        self.mouse_controller.drag_start()
-                else:
-                    if self.finger_recognizer.is_drag_released(angles['mid']):
-                        if self.mouse_controller.is_dragging():
-                            self.mouse_controller.drag_end()
+                transition = self.finger_recognizer.drag_transition(
+                    features.mid_angle, self.mouse_controller.is_dragging()
+                )
+                if transition > 0:
+                    self.mouse_controller.drag_start()
+                elif transition < 0:
+                    self.mouse_controller.drag_end()
             else:
                 # Shaka 제스처 중 드래그 중이었다면 종료
                 if self.mouse_controller.is_dragging():
@@ -231,7 +326,7 @@ class AirTouchApp:
         if hand_landmarks_list:
             h, w = frame.shape[:2]
             scroll_status = self.scroll_manager.process_dual_hand_scroll(
-                hand_landmarks_list, self.hand_detector, w, h
+                hand_landmarks_list, self.hand_detector, w, h, now_ms
             )
             if scroll_status:
                 hud.append(f"Scroll: {scroll_status}")
@@ -253,23 +348,104 @@ class AirTouchApp:
 
         return frame, hud
 
-    def process_frame(self, frame):
+    def _create_detectors(self):
+        """MediaPipe 검출기 생성 (추론을 수행하는 스레드에서 첫 프레임에 한 번)"""
+        hand_detector = HandDetector()
+        hand_source = hand_detector
+        if config.ADAPTIVE_HAND_MODEL and config.MAX_NUM_HANDS > 1:
+            # 두 번째 손이 없는 동안은 lite + 한 손 모델로 추론
+            lite_detector = HandDetector(
+                model_complexity=config.HAND_LITE_COMPLEXITY, max_num_hands=1)
+            hand_source = AdaptiveHandDetector(lite_detector, hand_detector)
+
+        self.hand_resampler = TemporalResampler(hand_source)
+        self._hand_source = hand_source
+        self.hand_detector = hand_detector
+        self.face_detector = FaceDetector()
+
+    def _inference_rgb(self, frame):
+        """
+        MediaPipe 입력용 축소 RGB 이미지 생성
+
+        추론용 축소 (MediaPipe 모델 입력은 192~256px이므로 원본 해상도 불필요)
+        랜드마크는 정규화 좌표로 반환되므로 픽셀 변환은 원본 w, h 그대로 사용
+
+        Args:
+            frame: 웹캠 프레임 (BGR)
+
+        Returns:
+            RGB 이미지 (numpy array, C-contiguous)
+        """
+        h, w = frame.shape[:2]
+        scale = config.INFERENCE_SCALE
+        size = (max(1, int(w * scale)), max(1, int(h * scale)))
+
+        if self.use_opencl:
+            # OpenCL (T-API): 축소 + 색 변환을 GPU에서 수행하고 결과만 호스트로 복사
+            src = cv2.UMat(frame)
+            if scale != 1.0:
+                src = cv2.resize(src, size, interpolation=cv2.INTER_AREA)
+            return cv2.cvtColor(src, cv2.COLOR_BGR2RGB).get()
+
+        if scale != 1.0:
+            if self._small_buf is None or self._small_buf.shape[1::-1] != size:
+                self._small_buf = np.empty((size[1], size[0], 3), dtype=frame.dtype)
+            frame = cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+
+        # RGB 변환 버퍼 재사용 (프레임당 할당 방지)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+
+    def detect_landmarks(self, frame):
+        """
+        얼굴/손 랜드마크 검출 (MediaPipe 추론 단계)
+
+        Args:
+            frame: 웹캠 프레임 (BGR)
+
+        Returns:
+            (face_landmarks, hand_landmarks_list)
+        """
+        if self.face_detector is None:
+            self._create_detectors()
+
+        rgb = self._inference_rgb(frame)
+
+        # 얼굴 검출 (얼굴은 거의 움직이지 않으므로 N 프레임마다, 놓쳤으면 매 프레임)
+        if self._last_face is None or self._face_tick % self.face_inference_interval == 0:
+            self._last_face = self.face_detector.detect(rgb)
+        self._face_tick += 1
+        face_landmarks = self._last_face
+
+        # 손 검출 (복수 손 처리, 사이 프레임은 TemporalResampler가 외삽)
+        hand_landmarks_list = self.hand_resampler.detect(rgb)
+
+        return face_landmarks, hand_landmarks_list
+
+    def process_frame(self, frame, detections=None):
         """
         프레임 처리 메인 로직
 
         Args:
             frame: 웹캠 프레임 (BGR)
+            detections: detect_landmarks() 결과 (None이면 이 자리에서 검출)
 
         Returns:
             (output_frame, hud_lines)
         """
         h, w = frame.shape[:2]
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        # 프레임 기준 시각 (단조 시계, 프레임 내 모든 판정이 같은 값을 사용)
+        now_ms = time.perf_counter_ns() // 1_000_000
+
+        if detections is None:
+            detections = self.detect_landmarks(frame)
+        face_landmarks, hand_landmarks_list = detections
 
         hud = []
 
-        # 얼굴 검출
-        face_landmarks = self.face_detector.detect(rgb)
+        # 얼굴
         eye_mid_xy = None
         eye_mid_z = None
 
@@ -278,35 +454,43 @@ class AirTouchApp:
                 self.face_detector.get_eye_midpoint(face_landmarks, w, h)
 
             # 시각화
-            cv2.circle(frame, (int(eye_mid_xy[0]), int(eye_mid_xy[1])), 8, (0, 200, 255), -1)
+            if self._draw_overlay:
+                cv2.circle(frame, (int(eye_mid_xy[0]), int(eye_mid_xy[1])), 8, (0, 200, 255), -1)
 
-        # 손 검출 (복수 손 처리)
-        hand_landmarks_list = self.hand_detector.detect(rgb)
+        # 손 (복수 손 처리)
         idx_tip_z = None
         thm_tip_z = None
         normalized_landmarks = None
         landmarks_2d = None
-        angles = None
-        pinch_distance = None
+        features = None
         shaka_detected = False  # Shaka 제스처 감지 플래그
 
         if hand_landmarks_list:
-            # 모든 손 검출하여 Shaka 제스처 확인
-            for hand_landmarks in hand_landmarks_list:
-                temp_landmarks_2d = self.hand_detector.get_landmarks_2d(hand_landmarks, w, h)
-                if self.shaka_recognizer.is_shaka_gesture(temp_landmarks_2d):
-                    shaka_detected = True
-                    break
-
             # 첫 번째 손을 제어용으로 사용 (기존 로직 유지)
             control_hand = hand_landmarks_list[0]
 
-            # 랜드마크 그리기
-            for hand_landmarks in hand_landmarks_list:
-                self.hand_detector.draw_landmarks(frame, hand_landmarks)
+            # 손별 2D 랜드마크 (프레임당 한 번 추출, Shaka/스크롤이 공유)
+            landmarks_2d_list = [
+                self.hand_detector.get_landmarks_2d(hand_landmarks, w, h)
+                for hand_landmarks in hand_landmarks_list
+            ]
 
-            # 2D 랜드마크
-            landmarks_2d = self.hand_detector.get_landmarks_2d(control_hand, w, h)
+            # 제어 손 특징값 (프레임당 한 번 계산, 모든 인식기가 공유)
+            landmarks_2d = landmarks_2d_list[0]
+            features = compute_hand_features(landmarks_2d)
+
+            # 모든 손 검출하여 Shaka 제스처 확인
+            shaka_detected = self.shaka_recognizer.is_shaka(features)
+            if not shaka_detected:
+                for temp_landmarks_2d in landmarks_2d_list[1:]:
+                    if self.shaka_recognizer.is_shaka_gesture(temp_landmarks_2d):
+                        shaka_detected = True
+                        break
+
+            # 랜드마크 그리기
+            if self._draw_overlay:
+                for hand_landmarks in hand_landmarks_list:
+                    self.hand_detector.draw_landmarks(frame, hand_landmarks)
 
             # 3D 랜드마크 (Z 좌표)
             landmarks_3d = self.hand_detector.get_landmarks_3d(control_hand, w)
@@ -316,14 +500,7 @@ class AirTouchApp:
             # 정규화된 좌표 (커서 매핑용)
             normalized_landmarks = self.hand_detector.get_normalized_landmarks(control_hand)
 
-            # 손가락 각도 계산
-            angles = self.finger_recognizer.calculate_finger_angles(landmarks_2d)
-
-            # Pinch 거리 계산
-            pinch_distance = self.pinch_recognizer.calculate_pinch_distance(landmarks_2d)
-
             # Shaka 제스처 감지 (모드 전환)
-            now_ms = int(time.time() * 1000)
             mode_changed, self.shaka_progress = self.shaka_recognizer.check_hold_duration(
                 shaka_detected, now_ms
             )
@@ -363,8 +540,8 @@ class AirTouchApp:
         if self.mode_manager.is_touch_mode():
             frame, mode_hud = self.process_touch_mode(
                 frame, eye_mid_z, idx_tip_z, thm_tip_z,
-                landmarks_2d, angles, pinch_distance, shaka_detected,
-                hand_landmarks_list
+                landmarks_2d, features, shaka_detected,
+                hand_landmarks_list, now_ms
             )
             hud.extend(mode_hud)
         else:  # KEYBOARD_MODE
@@ -383,12 +560,20 @@ class AirTouchApp:
             frame: 프레임
             hud_lines: HUD 텍스트 리스트
         """
+        # Hershey 폰트 래스터화는 줄당 수십 µs로, 캐시 스프라이트 합성보다 빠름
+        # → 줄마다 cv2.putText를 직접 호출하되 루프 밖에서 설정값을 한 번만 조회
+        font = config.HUD_FONT
+        scale = config.HUD_FONT_SCALE
+        thickness = config.HUD_FONT_THICKNESS
+        line_height = config.HUD_LINE_HEIGHT
+        color_active = config.HUD_COLOR_ACTIVE
+        color_normal = config.HUD_COLOR_NORMAL
+
         y = config.HUD_START_Y + 70  # 모드 표시 아래부터
         for line in hud_lines:
-            color = config.HUD_COLOR_ACTIVE if "ACTIVE" in line else config.HUD_COLOR_NORMAL
-            cv2.putText(frame, line, (10, y), config.HUD_FONT,
-                       config.HUD_FONT_SCALE, color, config.HUD_FONT_THICKNESS, cv2.LINE_AA)
-            y += config.HUD_LINE_HEIGHT
+            color = color_active if "ACTIVE" in line else color_normal
+            cv2.putText(frame, line, (10, y), font, scale, color, thickness, cv2.LINE_AA)
+            y += line_height
 
     def handle_key(self, key):
         """
@@ -400,36 +585,72 @@ class AirTouchApp:
         Returns:
             True: 계속 실행, False: 종료
         """
-        if key == ord('q'):
-            return False
-        elif key == ord('c'):
-            self.cursor_on = not self.cursor_on
-        elif key == ord('m'):
-            self.cursor_mapper.toggle_mirror()
-        elif key == ord('n'):
-            enabled = self.pinch_zoom_manager.toggle_normalization()
-            print(f"\n원근 보정: {'ON' if enabled else 'OFF'}")
-        elif key == ord('<'):
-            factor = self.state_manager.decrease_factor()
-            print(f"\nFactor: {factor:.2f}")
-        elif key == ord('>'):
-            factor = self.state_manager.increase_factor()
-            print(f"\nFactor: {factor:.2f}")
-        elif key == ord('r'):
-            self.state_manager.reset_baseline()
-            print("\nBaseline reset!")
-        elif key == ord('t'):
-            # 키보드 모드에서만 작동
-            if self.mode_manager.is_keyboard_mode():
-                enabled = self.virtual_keyboard.toggle_typing()
-                print(f"\nTyping: {'ON' if enabled else 'OFF'}")
-        elif key == ord('k'):
-            # 키보드 모드에서만 작동
-            if self.mode_manager.is_keyboard_mode():
-                enabled = self.virtual_keyboard.toggle_keyboard_display()
-                print(f"\nKeyboard Display: {'ON' if enabled else 'OFF'}")
-
-        return True
+        handler = self._key_handlers.get(key)
+        if handler is None and self.mode_manager.is_keyboard_mode():
+            handler = self._keyboard_key_handlers.get(key)
+        if handler is None:
+            return True
+        return handler() is not False
+
+    def _build_key_handlers(self):
+        """키 코드 → 처리 메서드 디스패치 테이블 생성"""
+        # 모든 모드 공통
+        self._key_handlers = {
+            ord('q'): self._key_quit,
+            ord('c'): self._key_toggle_cursor,
+            ord('m'): self._key_toggle_mirror,
+            ord('n'): self._key_toggle_normalization,
+            ord('<'): self._key_decrease_factor,
+            ord('>'): self._key_increase_factor,
+            ord('r'): self._key_reset_baseline,
+        }
+        # 키보드 모드에서만 작동
+        self._keyboard_key_handlers = {
+            ord('t'): self._key_toggle_typing,
+            ord('k'): self._key_toggle_keyboard_display,
+        }
+
+    def _key_quit(self):
+        """종료 (q)"""
+        return False
+
+    def _key_toggle_cursor(self):
+        """커서 ON/OFF (c)"""
+        self.cursor_on = not self.cursor_on
+
+    def _key_toggle_mirror(self):
+        """커서 좌우 반전 (m)"""
+        self.cursor_mapper.toggle_mirror()
+
+    def _key_toggle_normalization(self):
+        """원근 보정 토글 (n)"""
+        enabled = self.pinch_zoom_manager.toggle_normalization()
+        print(f"\n원근 보정: {'ON' if enabled else 'OFF'}")
+
+    def _key_decrease_factor(self):
+        """Factor 감소 (<)"""
+        factor = self.state_manager.decrease_factor()
+        print(f"\nFactor: {factor:.2f}")
+
+    def _key_increase_factor(self):
+        """Factor 증가 (>)"""
+        factor = self.state_manager.increase_factor()
+        print(f"\nFactor: {factor:.2f}")
+
+    def _key_reset_baseline(self):
+        """Baseline 리셋 (r)"""
+        self.state_manager.reset_baseline()
+        print("\nBaseline reset!")
+
+    def _key_toggle_typing(self):
+        """타이핑 ON/OFF (t)"""
+        enabled = self.virtual_keyboard.toggle_typing()
+        print(f"\nTyping: {'ON' if enabled else 'OFF'}")
+
+    def _key_toggle_keyboard_display(self):
+        """키보드 표시 ON/OFF (k)"""
+        enabled = self.virtual_keyboard.toggle_keyboard_display()
+        print(f"\nKeyboard Display: {'ON' if enabled else 'OFF'}")
 
     def run(self):
         """메인 루프"""
@@ -454,39 +675,109 @@ class AirTouchApp:
         print("  t: Toggle typing ON/OFF")
         print("  k: Toggle keyboard display")
         print("=" * 70)
+        if not self.show_window:
+            print("Headless mode: no preview window, press Ctrl+C to quit")
 
         try:
-            while True:
-                ok, frame = self.cap.read()
-                if not ok:
-                    break
+            if config.PIPELINE_THREADED:
+                self._run_threaded()
+            else:
+                self._run_serial()
+        finally:
+            self.cleanup()
 
-                # 좌우 반전 (거울 모드)
-                frame = cv2.flip(frame, 1)
+    def render(self, frame, detections=None):
+        """
+        프레임 처리 + 화면 표시 + 키 입력 처리
 
-                # 프레임 처리
-                output, hud = self.process_frame(frame)
+        Args:
+            frame: 좌우 반전된 웹캠 프레임 (BGR)
+            detections: detect_landmarks() 결과 (None이면 이 자리에서 검출)
 
-                # 모드 표시
-                self.draw_mode_indicator(output)
+        Returns:
+            bool: 계속 실행 여부
+        """
+        # 미리보기는 N 프레임마다 갱신 (사이 프레임은 창이 직전 화면을 유지)
+        self._draw_overlay = self.show_window and self._frame_idx % self.display_every_n == 0
+        self._frame_idx += 1
+
+        # 프레임 처리
+        output, hud = self.process_frame(frame, detections)
+
+        if not self.show_window:
+            return True
 
-                # Shaka 진행률 표시
-                self.draw_shaka_progress(output)
+        if self._draw_overlay:
+            # 모드 표시
+            self.draw_mode_indicator(output)
 
-                # HUD 그리기
-                self.draw_hud(output, hud)
+            # Shaka 진행률 표시
+            self.draw_shaka_progress(output)
 
-                # 화면 표시
-                cv2.imshow(config.WINDOW_NAME, output)
+            # HUD 그리기
+            self.draw_hud(output, hud)
+
+            # 화면 표시
+            cv2.imshow(config.WINDOW_NAME, output)
+
+        # 키 입력 처리
+        # pollKey: waitKey(1)과 달리 GUI 이벤트만 처리하고 대기 없이 즉시 반환
+        key = cv2.pollKey()
+        if key != -1:  # 키 입력이 있을 때
+            return self.handle_key(key & 0xFF)
+        return True
 
-                # 키 입력 처리
-                key = cv2.waitKey(1) & 0xFF
-                if key != 255:  # 키 입력이 있을 때
-                    if not self.handle_key(key):
+    def _run_serial(self):
+        """단일 스레드 루프 (캡처 → 추론 → 렌더링 순차 실행)"""
+        while True:
+            ok, frame = self.cap.read()
+            if not ok:
+                break
+
+            # 좌우 반전 (거울 모드, 제자리 연산으로 프레임 크기 할당 방지)
+            cv2.flip(frame, 1, dst=frame)
+
+            if not self.render(frame):
+                break
+
+    def _run_threaded(self):
+        """
+        캡처 / 추론 스레드 + 메인 스레드 렌더링 파이프라인
+
+        단계 사이는 크기 1 큐 (최신 프레임 우선)로 연결하여
+        추론 중에도 다음 프레임 캡처가 진행되도록 함
+        """
+        stop_event = threading.Event()
+        frame_q = queue.Queue(maxsize=1)
+        result_q = queue.Queue(maxsize=1)
+
+        threads = [
+            CaptureThread(self.cap, frame_q, stop_event),
+            InferenceThread(self.detect_landmarks, frame_q, result_q, stop_event),
+        ]
+        for t in threads:
+            t.start()
+
+        try:
+            while not stop_event.is_set():
+                try:
+                    frame, detections = result_q.get(timeout=0.1)
+                except queue.Empty:
+                    if not self.show_window:
+                        continue
+                    # 결과가 없어도 창 이벤트/키 입력은 처리
+                    key = cv2.pollKey()
+                    if key != -1 and not self.handle_key(key & 0xFF):
                         break
+                    continue
 
+                if not self.render(frame, detections):
+                    break
         finally:
-            self.cleanup()
+            # 스레드가 웹캠/MediaPipe를 쓰는 중에 해제하지 않도록 먼저 종료 대기
+            stop_event.set()
+            for t in threads:
+                t.join()
 
     def cleanup(self):
         """리소스 정리"""
@@ -502,8 +793,10 @@ class AirTouchApp:
         self.cap.release()
 
         # MediaPipe 리소스 해제
-        self.face_detector.close()
-        self.hand_detector.close()
+        if self.face_detector is not None:
+            self.face_detector.close()
+        if self._hand_source is not None:
+            self._hand_source.close()
 
         # 창 닫기
         cv2.destroyAllWindows()
@@ -513,7 +806,12 @@ class AirTouchApp:
 
 def main():
     """진입점"""
-    app = AirTouchApp()
+    parser = argparse.ArgumentParser(description="AirTouch - Virtual Touch Plane")
+    parser.add_argument("--headless", action="store_true",
+                        help="미리보기 창 없이 실행 (Ctrl+C로 종료)")
+    args = parser.parse_args()
+
+    app = AirTouchApp(show_window=config.SHOW_WINDOW and not args.headless)
     app.run()
 
 
@@ -0,0 +1,99 @@
+"""
+Frame Pipeline Module
+캡처 / 추론 / 렌더링 단계를 스레드로 분리하는 파이프라인
+"""
+
+import queue
+import threading
+
+import cv2
+
+
+def put_latest(q, item):
+    """
+    크기 1 큐에 최신 항목만 유지하며 넣기 (가득 차 있으면 오래된 항목 버림)
+
+    Args:
+        q: queue.Queue (maxsize=1)
+        item: 넣을 항목
+    """
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+
+class CaptureThread(threading.Thread):
+    """
+    웹캠 캡처 스레드
+
+    프레임을 읽어 좌우 반전 후 frame_q에 최신 프레임만 유지
+    """
+
+    def __init__(self, cap, frame_q, stop_event):
+        """
+        Args:
+            cap: cv2.VideoCapture
+            frame_q: 출력 프레임 큐 (maxsize=1)
+            stop_event: 종료 이벤트 (읽기 실패 시 이 스레드가 설정)
+        """
+        super().__init__(name="CaptureThread", daemon=True)
+        self.cap = cap
+        self.frame_q = frame_q
+        self.stop_event = stop_event
+
+    def run(self):
+        try:
+            while not self.stop_event.is_set():
+                ok, frame = self.cap.read()
+                if not ok:
+                    break
+
+                # 좌우 반전 (거울 모드, 제자리 연산으로 프레임 크기 할당 방지)
+                cv2.flip(frame, 1, dst=frame)
+                put_latest(self.frame_q, frame)
+        finally:
+            # 읽기 실패/예외 시 전체 파이프라인 종료
+            self.stop_event.set()
+
+
+class InferenceThread(threading.Thread):
+    """
+    MediaPipe 추론 스레드
+
+    frame_q에서 프레임을 받아 얼굴/손 검출 후 (frame, detections)를 result_q에 전달
+    """
+
+    def __init__(self, detect_fn, frame_q, result_q, stop_event, timeout=0.1):
+        """
+        Args:
+            detect_fn: frame → detections 검출 함수
+            frame_q: 입력 프레임 큐
+            result_q: 출력 결과 큐 (maxsize=1)
+            stop_event: 종료 이벤트
+            timeout: 프레임 대기 시간 (초, 종료 확인 주기)
+        """
+        super().__init__(name="InferenceThread", daemon=True)
+        self.detect_fn = detect_fn
+        self.frame_q = frame_q
+        self.result_q = result_q
+        self.stop_event = stop_event
+        self.timeout = timeout
+
+    def run(self):
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    frame = self.frame_q.get(timeout=self.timeout)
+                except queue.Empty:
+                    continue
+
+                put_latest(self.result_q, (frame, self.detect_fn(frame)))
+        finally:
+            # 추론 예외 시 메인 루프가 무한 대기하지 않도록 종료 신호
+            self.stop_event.set()
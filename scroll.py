@@ -3,16 +3,26 @@ Scroll Gesture Module
 양손 Pinch 제스처 기반 스크롤 제어
 """
 
-import numpy as np
-import win32api
-import win32con
+import math
 import time
 
+from gesture.detector import THUMB_TIP, INDEX_FINGER_TIP
+from control.win_input import (
+    key_input, mouse_input, send_inputs,
+    KEYEVENTF_KEYUP, MOUSEEVENTF_WHEEL
+)
+
 # 설정
 SCROLL_UNIT = 0.03        # 방향당 최소 이동 거리
 SCROLL_AMOUNT = 120       # 스크롤 양
 SCROLL_DELAY = 0.2        # 제스처 인식 후 딜레이
-PINCH_THRESHOLD = 0.05    # Pinch 거리 임계값
+PINCH_THRESHOLD = 0.05    # Pinch 거리 임계값 (이미지 가로 길이 대비 비율)
+
+VK_SHIFT = 0x10
+
+# 매 호출마다 재생성하지 않도록 Shift 누름/뗌 INPUT을 미리 생성
+_SHIFT_DOWN = key_input(VK_SHIFT)
+_SHIFT_UP = key_input(VK_SHIFT, KEYEVENTF_KEYUP)
 
 
 class ScrollGestureManager:
@@ -34,6 +44,7 @@ class ScrollGestureManager:
         self.scroll_amount = scroll_amount
         self.scroll_delay = scroll_delay
         self.pinch_threshold = pinch_threshold
+        self._scroll_delay_ms = scroll_delay * 1000.0
 
         # 상태 추적
         self.last_thumb_pos = None
@@ -44,7 +55,7 @@ class ScrollGestureManager:
     @staticmethod
     def get_distance(p1, p2):
         """두 점 사이의 거리 계산"""
-        return np.linalg.norm(np.array(p1) - np.array(p2))
+        return math.hypot(p1[0] - p2[0], p1[1] - p2[1])
 
     def perform_scroll(self, dx, dy):
         """
@@ -58,54 +69,55 @@ class ScrollGestureManager:
             str: 스크롤 방향 텍스트
         """
         scrolls = []
+        inputs = []
 
         # ↑↓ 수직 스크롤
         if abs(dy) >= self.scroll_unit:
             if dy < 0:
-                win32api.mouse_event(win32con.MOUSEEVENTF_WHEEL, 0, 0, self.scroll_amount)
+                inputs.append(mouse_input(MOUSEEVENTF_WHEEL, data=self.scroll_amount))
                 scrolls.append("UP")
             else:
-                win32api.mouse_event(win32con.MOUSEEVENTF_WHEEL, 0, 0, -self.scroll_amount)
+                inputs.append(mouse_input(MOUSEEVENTF_WHEEL, data=-self.scroll_amount))
                 scrolls.append("DOWN")
 
         # ←→ 수평 스크롤 (Shift + 휠 사용)
         if abs(dx) >= self.scroll_unit:
-            win32api.keybd_event(win32con.VK_SHIFT, 0, 0, 0)  # Shift 누름
+            inputs.append(_SHIFT_DOWN)  # Shift 누름
             if dx < 0:
-                win32api.mouse_event(win32con.MOUSEEVENTF_WHEEL, 0, 0, self.scroll_amount)
+                inputs.append(mouse_input(MOUSEEVENTF_WHEEL, data=self.scroll_amount))
                 scrolls.append("LEFT")
             else:
-                win32api.mouse_event(win32con.MOUSEEVENTF_WHEEL, 0, 0, -self.scroll_amount)
+                inputs.append(mouse_input(MOUSEEVENTF_WHEEL, data=-self.scroll_amount))
                 scrolls.append("RIGHT")
-            win32api.keybd_event(win32con.VK_SHIFT, 0, win32con.KEYEVENTF_KEYUP, 0)  # Shift 뗌
+            inputs.append(_SHIFT_UP)  # Shift 뗌
+
+        # 수직/수평 이벤트를 한 번의 SendInput으로 전송
+        send_inputs(*inputs)
 
         return " + ".join(scrolls) if scrolls else ""
 
-    def check_pinch(self, landmarks_2d):
+    def check_pinch(self, normalized_landmarks, aspect=1.0):
         """
         손의 Pinch 제스처 확인
 
         Args:
-            landmarks_2d: 손 랜드마크 2D 좌표 dict
+            normalized_landmarks: (21, 3) 정규화 랜드마크 배열
+            aspect: 이미지 세로/가로 비율 (y 정규화 좌표를 가로 기준으로 보정)
 
         Returns:
             bool: Pinch 여부
         """
-        thumb_tip = landmarks_2d['thm_tip']
-        index_tip = landmarks_2d['idx_tip']
-
-        distance = self.get_distance(
-            (thumb_tip[0], thumb_tip[1]),
-            (index_tip[0], index_tip[1])
-        )
+        thumb_tip = normalized_landmarks[THUMB_TIP]
+        index_tip = normalized_landmarks[INDEX_FINGER_TIP]
 
-        # 정규화된 좌표이므로 이미지 크기 고려 필요
-        # 평균 화면 크기(1280px)로 스케일링
-        distance_scaled = distance / 1280.0
+        # 이미지 가로 길이 기준 거리 (해상도와 무관)
+        distance = math.hypot(thumb_tip[0] - index_tip[0],
+                              (thumb_tip[1] - index_tip[1]) * aspect)
 
-        return distance_scaled < self.pinch_threshold
+        return distance < self.pinch_threshold
 
-    def process_dual_hand_scroll(self, hand_landmarks_list, hand_detector, image_width, image_height):
+    def process_dual_hand_scroll(self, hand_landmarks_list, hand_detector, image_width, image_height,
+                                 now_ms=None):
         """
         양손 Pinch 제스처 기반 스크롤 처리
 
@@ -114,6 +126,7 @@ class ScrollGestureManager:
             hand_detector: HandDetector 인스턴스
             image_width: 이미지 너비
             image_height: 이미지 높이
+            now_ms: 현재 시간 (ms, 단조 시계, 생략 시 내부 시계 사용)
 
         Returns:
             str: 스크롤 상태 텍스트
@@ -125,29 +138,33 @@ class ScrollGestureManager:
             self.last_scroll_text = ""
             return ""
 
-        # 양손 랜드마크 추출
-        hand1_landmarks = hand_detector.get_landmarks_2d(hand_landmarks_list[0], image_width, image_height)
-        hand2_landmarks = hand_detector.get_landmarks_2d(hand_landmarks_list[1], image_width, image_height)
+        if now_ms is None:
+            now_ms = time.perf_counter_ns() // 1_000_000
+
+        # 양손 정규화 랜드마크 추출 (픽셀 변환 없이 MediaPipe 좌표 그대로 사용)
+        hand1_landmarks = hand_detector.get_normalized_landmarks_array(hand_landmarks_list[0])
+        hand2_landmarks = hand_detector.get_normalized_landmarks_array(hand_landmarks_list[1])
 
         # 양손 Pinch 확인
-        hand1_pinch = self.check_pinch(hand1_landmarks)
-        hand2_pinch = self.check_pinch(hand2_landmarks)
+        aspect = image_height / image_width
+        hand1_pinch = self.check_pinch(hand1_landmarks, aspect)
+        hand2_pinch = self.check_pinch(hand2_landmarks, aspect)
 
         # 양손 모두 Pinch 상태일 때만 스크롤
         if hand1_pinch and hand2_pinch:
             # 첫 번째 손의 엄지를 추적
-            current_thumb_pos = hand1_landmarks['thm_tip']
+            current_thumb_pos = hand1_landmarks[THUMB_TIP]
 
             if not self.scroll_ready:
                 # 스크롤 시작
-                self.scroll_start_time = time.time()
+                self.scroll_start_time = now_ms
                 self.scroll_ready = True
                 self.last_thumb_pos = current_thumb_pos
                 self.last_scroll_text = "Scroll Ready"
-            elif time.time() - self.scroll_start_time > self.scroll_delay and self.last_thumb_pos is not None:
+            elif now_ms - self.scroll_start_time > self._scroll_delay_ms and self.last_thumb_pos is not None:
                 # 딜레이 후 스크롤 실행
-                dx = (current_thumb_pos[0] - self.last_thumb_pos[0]) / image_width
-                dy = (current_thumb_pos[1] - self.last_thumb_pos[1]) / image_height
+                dx = float(current_thumb_pos[0] - self.last_thumb_pos[0])
+                dy = float(current_thumb_pos[1] - self.last_thumb_pos[1])
 
                 scroll_text = self.perform_scroll(dx, dy)
                 if scroll_text:
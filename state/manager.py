@@ -38,6 +38,7 @@ class StateManager:
         self.factor_step = float(factor_step)
         self.z_margin = float(z_margin)
         self.hysteresis_ratio = float(hysteresis_ratio)
+        self._update_off_ratio()
         
         # EMA 필터
         self.ema_filter = EMAFilter(alpha=ema_alpha)
@@ -47,6 +48,10 @@ class StateManager:
         self.base_len = None
         self._prev_z_len = None
     
+    def _update_off_ratio(self):
+        """IDLE 복귀 비율 캐시 갱신 (factor/hysteresis 변경 시에만 호출)"""
+        self._off_ratio = max(0.8, self.factor * self.hysteresis_ratio)
+    
     def process_z_distance(self, z_distance):
         """
         Z 거리 처리 및 상태 판정
@@ -69,38 +74,36 @@ class StateManager:
         z_len_filtered = self.ema_filter.update(z_distance)
         
         # 기준선 설정 (처음)
-        if self.base_len is None:
-            self.base_len = z_len_filtered
+        base_len = self.base_len
+        if base_len is None:
+            base_len = self.base_len = z_len_filtered
         
         # 임계값 계산
-        threshold_on = self.base_len * self.factor + self.z_margin
-        threshold_off = self.base_len * max(0.8, self.factor * self.hysteresis_ratio) - self.z_margin
+        threshold_on = base_len * self.factor + self.z_margin
+        threshold_off = base_len * self._off_ratio - self.z_margin
         
         # 상태 전환 판정
-        state_changed = False
-        new_state = self.active
-        
-        if not self.active and z_len_filtered >= threshold_on:
-            # IDLE → ACTIVE
-            self.active = True
-            state_changed = True
-            new_state = True
-        elif self.active and z_len_filtered < threshold_off:
+        active = self.active
+        if active:
             # ACTIVE → IDLE
-            self.active = False
-            state_changed = True
-            new_state = False
+            state_changed = z_len_filtered < threshold_off
+        else:
+            # IDLE → ACTIVE
+            state_changed = z_len_filtered >= threshold_on
+        if state_changed:
+            active = not active
+            self.active = active
         
         self._prev_z_len = z_len_filtered
         
         return {
-            'active': self.active,
+            'active': active,
             'z_len_filtered': z_len_filtered,
-            'base_len': self.base_len,
+            'base_len': base_len,
             'threshold_on': threshold_on,
             'threshold_off': threshold_off,
             'state_changed': state_changed,
-            'new_state': new_state
+            'new_state': active
         }
     
     def is_active(self):
@@ -116,11 +119,13 @@ class StateManager:
     def increase_factor(self):
         """Factor 증가 (덜 민감하게)"""
         self.factor = min(self.factor + self.factor_step, self.factor_max)
+        self._update_off_ratio()
         return self.factor
     
     def decrease_factor(self):
         """Factor 감소 (더 민감하게)"""
         self.factor = max(self.factor - self.factor_step, self.factor_min)
+        self._update_off_ratio()
         return self.factor
     
     def increase_z_margin(self):
@@ -136,11 +141,13 @@ class StateManager:
     def increase_hysteresis(self):
         """Hysteresis 증가"""
         self.hysteresis_ratio = min(self.hysteresis_ratio + 0.01, 0.99)
+        self._update_off_ratio()
         return self.hysteresis_ratio
     
     def decrease_hysteresis(self):
         """Hysteresis 감소"""
         self.hysteresis_ratio = max(self.hysteresis_ratio - 0.01, 0.80)
+        self._update_off_ratio()
         return self.hysteresis_ratio
     
     def get_state_info(self):
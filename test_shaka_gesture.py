@@ -4,22 +4,78 @@ Shaka 제스처 인식 테스트
 """
 
 import cv2
+import numpy as np
+import queue
+import threading
 import time
-from gesture import FaceDetector, HandDetector, ShakaModeRecognizer
+from gesture import FaceDetector, HandDetector, ShakaModeRecognizer, TemporalResampler
+from gesture.detector import (
+    THUMB_CMC, THUMB_MCP, THUMB_IP,
+    INDEX_FINGER_MCP, INDEX_FINGER_PIP, INDEX_FINGER_DIP,
+    MIDDLE_FINGER_MCP, MIDDLE_FINGER_PIP, MIDDLE_FINGER_DIP,
+    RING_FINGER_MCP, RING_FINGER_PIP, RING_FINGER_DIP,
+    PINKY_MCP, PINKY_PIP, PINKY_DIP,
+    landmarks_array
+)
+from utils.math_utils import angles_at_joints
+from pipeline import CaptureThread, InferenceThread
 import config
 
 
+# 손가락별 각도 계산 관절 (HandLandmark 인덱스)
+# 엄지 CMC-MCP-IP, 검지/중지/약지/새끼 MCP-PIP-DIP
+_FINGER_TRIPLETS = np.array([
+    (THUMB_CMC, THUMB_MCP, THUMB_IP),
+    (INDEX_FINGER_MCP, INDEX_FINGER_PIP, INDEX_FINGER_DIP),
+    (MIDDLE_FINGER_MCP, MIDDLE_FINGER_PIP, MIDDLE_FINGER_DIP),
+    (RING_FINGER_MCP, RING_FINGER_PIP, RING_FINGER_DIP),
+    (PINKY_MCP, PINKY_PIP, PINKY_DIP),
+])
+
+
+def _draw_hud_line(canvas, text, x, y):
+    """HUD 한 줄 그리기 (검은 배경 + 텍스트, 기준점 (x, y))"""
+    (text_w, text_h), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)
+    cv2.rectangle(canvas, (x - 5, y - 22), (x + 5 + text_w, y + 5), (0, 0, 0), -1)
+
+    color = (0, 255, 0) if "YES" in text else (255, 255, 255)
+    cv2.putText(canvas, text, (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+
+
+def _draw_mode_panel(canvas, text, color):
+    """현재 모드 패널 그리기 (검은 배경 + 모드 색 테두리 + 텍스트)"""
+    cv2.rectangle(canvas, (10, 10), (400, 80), (0, 0, 0), -1)
+    cv2.rectangle(canvas, (10, 10), (400, 80), color, 3)
+    cv2.putText(canvas, text, (20, 50), cv2.FONT_HERSHEY_SIMPLEX, 1.2, color, 3)
+
+
+# 손가락 각도 패널 (이름, 각도 기준 판정)
+_FINGER_NAMES = ("Thumb", "Index", "Middle", "Ring", "Pinky")
+_FINGER_EXTENDED = (True, False, False, False, True)  # 펴야 하는 손가락 (> 150°), 나머지는 접기 (< 140°)
+
+
 class ShakaGestureTest:
     """Shaka 제스처 테스트 애플리케이션"""
 
     def __init__(self):
         # 웹캠 초기화
         self.cap = cv2.VideoCapture(config.CAM_INDEX, cv2.CAP_DSHOW)
+        # 압축 포맷은 해상도보다 먼저 지정해야 적용되는 드라이버가 있음
+        if config.CAM_FOURCC:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*config.CAM_FOURCC))
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.CAM_WIDTH)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.CAM_HEIGHT)
+        # 드라이버 버퍼에 오래된 프레임이 쌓이지 않도록 (백엔드에 따라 무시될 수 있음)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, config.CAM_BUFFER_SIZE)
+
+        # 추론 입력 버퍼 (프레임당 할당 방지)
+        self._small_buf = None
+        self._rgb_buf = None
 
         # 검출기
         self.hand_detector = HandDetector()
+        # 손 추적 중에는 추론을 건너뛰고 외삽, 손이 없으면 저빈도 탐색
+        self.hand_resampler = TemporalResampler(self.hand_detector)
 
         # Shaka 제스처 인식기
         self.shaka_recognizer = ShakaModeRecognizer(hold_duration_ms=2000)
@@ -31,6 +87,32 @@ class ShakaGestureTest:
             "KEYBOARD": (255, 0, 255)   # 자홍색
         }
 
+        # 프레임마다 다시 채워 쓰는 HUD 줄 / 손가락 각도 행 ([이름, 각도, 판정])
+        self._hud_buf = ["=== SHAKA GESTURE TEST ===", "", "", ""]
+        self._angle_rows = [[name, 0.0, False] for name in _FINGER_NAMES]
+
+    def read_latest(self, max_drain=2, stale_grab_ms=5.0):
+        """
+        버퍼에 쌓인 오래된 프레임은 디코딩 없이 grab()으로 버리고 최신 프레임만 디코딩
+
+        grab()이 즉시 반환되면 버퍼에 있던 프레임이므로 한 번 더 grab()
+        (BUFFERSIZE가 무시되는 백엔드 대비, 최대 max_drain회)
+
+        Args:
+            max_drain: 추가로 버릴 최대 프레임 수
+            stale_grab_ms: 이 시간보다 빨리 반환된 grab()은 버퍼 프레임으로 간주
+
+        Returns:
+            (ok, frame)
+        """
+        for _ in range(max_drain + 1):
+            t0 = time.perf_counter()
+            if not self.cap.grab():
+                return False, None
+            if (time.perf_counter() - t0) * 1000.0 >= stale_grab_ms:
+                break  # 새 프레임을 기다렸음 → 최신
+        return self.cap.retrieve()
+
     def draw_progress_bar(self, frame, progress):
         """제스처 진행률 표시"""
         bar_x = 50
@@ -58,56 +140,21 @@ class ShakaGestureTest:
 
     def draw_finger_angles(self, frame, landmarks_2d, x_offset=50, y_offset=200):
         """각 손가락의 각도 표시"""
-        from utils.math_utils import angle_at_joint
-
-        # 엄지
-        thumb_angle = angle_at_joint(
-            landmarks_2d['thm_cmc'],
-            landmarks_2d['thm_mcp'],
-            landmarks_2d['thm_ip']
-        )
-
-        # 검지
-        index_angle = angle_at_joint(
-            landmarks_2d['idx_mcp'],
-            landmarks_2d['idx_pip'],
-            landmarks_2d['idx_dip']
-        )
-
-        # 중지
-        middle_angle = angle_at_joint(
-            landmarks_2d['mid_mcp'],
-            landmarks_2d['mid_pip'],
-            landmarks_2d['mid_dip']
-        )
-
-        # 약지
-        ring_angle = angle_at_joint(
-            landmarks_2d['ring_mcp'],
-            landmarks_2d['ring_pip'],
-            landmarks_2d['ring_dip']
-        )
-
-        # 새끼
-        pinky_angle = angle_at_joint(
-            landmarks_2d['pinky_mcp'],
-            landmarks_2d['pinky_pip'],
-            landmarks_2d['pinky_dip']
-        )
+        # 5개 손가락 (a, b, c) 관절을 (5, 3, 2)로 한 번에 모아 각도 계산
+        pts = landmarks_array(landmarks_2d)[_FINGER_TRIPLETS]
+        angles = angles_at_joints(pts[:, 0], pts[:, 1], pts[:, 2]).tolist()
+
+        # 각도 행 제자리 갱신
+        rows = self._angle_rows
+        for row, angle, extended in zip(rows, angles, _FINGER_EXTENDED):
+            row[1] = angle
+            row[2] = angle > 150 if extended else angle < 140
 
         # 각도 표시
         y = y_offset
         line_height = 30
 
-        angles = [
-            ("Thumb", thumb_angle, thumb_angle > 150),
-            ("Index", index_angle, index_angle < 140),
-            ("Middle", middle_angle, middle_angle < 140),
-            ("Ring", ring_angle, ring_angle < 140),
-            ("Pinky", pinky_angle, pinky_angle > 150)
-        ]
-
-        for finger_name, angle, is_correct in angles:
+        for finger_name, angle, is_correct in rows:
             text = f"{finger_name}: {angle:.1f}°"
             color = (0, 255, 0) if is_correct else (100, 100, 100)
 
@@ -126,31 +173,59 @@ class ShakaGestureTest:
 
             y += line_height
 
-    def process_frame(self, frame):
-        """프레임 처리"""
+    def detect_hands(self, frame):
+        """
+        손 랜드마크 검출 (MediaPipe 추론 단계)
+
+        Args:
+            frame: 좌우 반전된 웹캠 프레임 (BGR)
+
+        Returns:
+            손 랜드마크 리스트 또는 None
+        """
+        # 추론용 축소 (랜드마크는 정규화 좌표이므로 픽셀 변환은 원본 w, h 그대로 사용)
+        scale = config.INFERENCE_SCALE
+        if scale != 1.0:
+            h, w = frame.shape[:2]
+            size = (max(1, int(w * scale)), max(1, int(h * scale)))
+            if self._small_buf is None or self._small_buf.shape[1::-1] != size:
+                self._small_buf = np.empty((size[1], size[0], 3), dtype=frame.dtype)
+            frame = cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+
+        # RGB 변환 (MediaPipe는 C-contiguous 입력이 필요하므로 채널 반전 view 대신 버퍼에 변환)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        return self.hand_resampler.detect(rgb)
+
+    def process_frame(self, frame, hand_landmarks):
+        """
+        프레임 처리
+
+        Args:
+            frame: 좌우 반전된 웹캠 프레임 (BGR)
+            hand_landmarks: detect_hands() 결과 (손 랜드마크 리스트 또는 None)
+        """
         h, w = frame.shape[:2]
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # 손 검출
-        hand_landmarks = self.hand_detector.detect(rgb)
 
-        hud = []
         is_shaka = False
         progress = 0.0
         mode_changed = False
 
         if hand_landmarks:
             # 손 랜드마크 그리기
-            self.hand_detector.draw_landmarks(frame, hand_landmarks)
-
-            # 2D 랜드마크 추출
-            landmarks_2d = self.hand_detector.get_landmarks_2d(hand_landmarks, w, h)
-
-            # Shaka 제스처 인식
-            is_shaka = self.shaka_recognizer.is_shaka_gesture(landmarks_2d)
+            for hand in hand_landmarks:
+                self.hand_detector.draw_landmarks(frame, hand)
+
+            # Shaka 제스처 인식 (어느 손이든 Shaka면 인정, main.py와 같은 정책)
+            for hand in hand_landmarks:
+                landmarks_2d = self.hand_detector.get_landmarks_2d(hand, w, h)
+                is_shaka = self.shaka_recognizer.is_shaka_gesture(landmarks_2d)
+                if is_shaka:
+                    break
 
             # 2초 홀드 체크
-            now_ms = int(time.time() * 1000)
+            now_ms = time.perf_counter_ns() // 1_000_000  # 단조 시계 (시스템 시각 보정 영향 없음)
             mode_changed, progress = self.shaka_recognizer.check_hold_duration(is_shaka, now_ms)
 
             # 모드 전환
@@ -168,24 +243,102 @@ class ShakaGestureTest:
 
         # 현재 모드 표시
         mode_color = self.mode_colors[self.current_mode]
-        cv2.rectangle(frame, (10, 10), (400, 80), (0, 0, 0), -1)
-        cv2.rectangle(frame, (10, 10), (400, 80), mode_color, 3)
-
         mode_text = f"CURRENT MODE: {self.current_mode}"
-        cv2.putText(frame, mode_text, (20, 50),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, mode_color, 3)
+        _draw_mode_panel(frame, mode_text, mode_color)
 
-        # HUD 정보
-        hud.append("=== SHAKA GESTURE TEST ===")
-        hud.append(f"Hand Detected: {'YES' if hand_landmarks else 'NO'}")
-        hud.append(f"Shaka Gesture: {'YES [OK]' if is_shaka else 'NO'}")
-        hud.append(f"Hold Progress: {int(progress * 100)}%")
+        # HUD 정보 (제목 줄은 고정, 나머지 줄만 제자리 갱신)
+        hud = self._hud_buf
+        hud[1] = f"Hand Detected: {'YES' if hand_landmarks else 'NO'}"
+        hud[2] = f"Shaka Gesture: {'YES [OK]' if is_shaka else 'NO'}"
+        hud[3] = f"Hold Progress: {int(progress * 100)}%"
 
+        del hud[4:]
         if is_shaka:
             hud.append(">> Keep holding for 2 seconds to toggle mode!")
 
         return frame, hud
 
+    def render(self, frame, hand_landmarks):
+        """
+        프레임 처리 + HUD + 화면 표시 + 키 입력 처리
+
+        Args:
+            frame: 좌우 반전된 웹캠 프레임 (BGR)
+            hand_landmarks: detect_hands() 결과
+
+        Returns:
+            bool: 계속 실행 여부
+        """
+        # 프레임 처리
+        output, hud = self.process_frame(frame, hand_landmarks)
+
+        # HUD 그리기
+        self.draw_hud(output, hud)
+
+        # 화면 표시
+        cv2.imshow("Shaka Gesture Test", output)
+
+        # 키 입력
+        key = cv2.waitKey(1) & 0xFF
+        return key != ord('q')
+
+    def draw_hud(self, frame, hud_lines, y=550):
+        """
+        HUD 그리기
+
+        Args:
+            frame: 프레임
+            hud_lines: HUD 텍스트 리스트
+            y: 첫 줄 기준선 Y 좌표
+        """
+        for text in hud_lines:
+            _draw_hud_line(frame, text, 10, y)
+            y += 30
+
+    def _run_serial(self):
+        """단일 스레드 루프 (캡처 → 추론 → 렌더링 순차 실행)"""
+        while True:
+            ok, frame = self.read_latest()
+            if not ok:
+                break
+
+            # 좌우 반전
+            cv2.flip(frame, 1, dst=frame)
+
+            if not self.render(frame, self.detect_hands(frame)):
+                break
+
+    def _run_threaded(self):
+        """캡처 / 추론 스레드 + 메인 스레드 렌더링 파이프라인"""
+        stop_event = threading.Event()
+        frame_q = queue.Queue(maxsize=1)
+        result_q = queue.Queue(maxsize=1)
+
+        threads = [
+            CaptureThread(self.cap, frame_q, stop_event),
+            InferenceThread(self.detect_hands, frame_q, result_q, stop_event),
+        ]
+        for t in threads:
+            t.start()
+
+        try:
+            while not stop_event.is_set():
+                try:
+                    frame, hand_landmarks = result_q.get(timeout=0.1)
+                except queue.Empty:
+                    # 결과가 없어도 창 이벤트/키 입력은 처리
+                    if (cv2.waitKey(1) & 0xFF) == ord('q'):
+                        break
+                    continue
+
+                if not self.render(frame, hand_landmarks):
+                    break
+        finally:
+            # 스레드가 웹캠/MediaPipe를 쓰는 중에 해제하지 않도록 먼저 종료 대기
+            stop_event.set()
+            for t in threads:
+                t.join()
+
     def run(self):
         """메인 루프"""
         if not self.cap.isOpened():
@@ -209,40 +362,10 @@ class ShakaGestureTest:
         print("=" * 70)
 
         try:
-            while True:
-                ok, frame = self.cap.read()
-                if not ok:
-                    break
-
-                # 좌우 반전
-                frame = cv2.flip(frame, 1)
-
-                # 프레임 처리
-                output, hud = self.process_frame(frame)
-
-                # HUD 그리기
-                y = 550
-                for text in hud:
-                    # 배경
-                    (text_w, text_h), _ = cv2.getTextSize(
-                        text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2
-                    )
-                    cv2.rectangle(output, (5, y - 22), (15 + text_w, y + 5), (0, 0, 0), -1)
-
-                    # 텍스트
-                    color = (0, 255, 0) if "YES" in text else (255, 255, 255)
-                    cv2.putText(output, text, (10, y),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
-                    y += 30
-
-                # 화면 표시
-                cv2.imshow("Shaka Gesture Test", output)
-
-                # 키 입력
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    break
-
+            if config.PIPELINE_THREADED:
+                self._run_threaded()
+            else:
+                self._run_serial()
         finally:
             self.cap.release()
             self.hand_detector.close()
@@ -7,6 +7,7 @@ from .math_utils import (
     clamp,
     l2_distance,
     angle_at_joint,
+    angles_at_joints,
     normalize_coordinates,
     denormalize_coordinates
 )
@@ -15,6 +16,7 @@ __all__ = [
     'clamp',
     'l2_distance',
     'angle_at_joint',
+    'angles_at_joints',
     'normalize_coordinates',
     'denormalize_coordinates'
 ]
\ No newline at end of file
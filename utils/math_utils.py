@@ -22,10 +22,17 @@ def clamp(value, min_val, max_val):
     return min_val if value < min_val else max_val if value > max_val else value
 
 
+def _coords(point):
+    """점 좌표를 Python float 시퀀스로 (ndarray는 tolist 한 번으로 원소별 스칼라 박싱 회피)"""
+    return point.tolist() if isinstance(point, np.ndarray) else point
+
+
 def l2_distance(point_a, point_b):
     """
     두 점 사이의 L2 거리 (유클리드 거리) 계산
     
+    작은 점은 NumPy 호출 비용이 연산보다 크므로 math로 직접 계산
+    
     Args:
         point_a: 첫 번째 점 (numpy array or tuple)
         point_b: 두 번째 점 (numpy array or tuple)
@@ -33,7 +40,7 @@ def l2_distance(point_a, point_b):
     Returns:
         거리 (float)
     """
-    return float(np.linalg.norm(np.array(point_a) - np.array(point_b)))
+    return math.dist(_coords(point_a), _coords(point_b))
 
 
 def angle_at_joint(point_a, point_b, point_c):
@@ -52,25 +59,66 @@ def angle_at_joint(point_a, point_b, point_c):
         손가락 각도 계산:
         angle_at_joint(MCP, PIP, DIP) → PIP 관절의 구부림 정도
     """
-    # 벡터 계산
-    v1 = np.array(point_a) - np.array(point_b)
-    v2 = np.array(point_c) - np.array(point_b)
-    
-    # 벡터 크기
-    norm_v1 = np.linalg.norm(v1) + 1e-9  # 0으로 나누기 방지
-    norm_v2 = np.linalg.norm(v2) + 1e-9
-    
-    # 코사인 값 계산
-    cos_angle = np.dot(v1, v2) / (norm_v1 * norm_v2)
+    point_a = _coords(point_a)
+    point_b = _coords(point_b)
+    point_c = _coords(point_c)
+    
+    # 2D: atan2(외적, 내적) 한 번으로 계산 (sqrt 2회 + acos보다 빠르고 0°/180° 부근에서 정확)
+    if len(point_b) == 2:
+        bx, by = point_b
+        v1x = point_a[0] - bx
+        v1y = point_a[1] - by
+        v2x = point_c[0] - bx
+        v2y = point_c[1] - by
+        cross = v1x * v2y - v1y * v2x
+        dot = v1x * v2x + v1y * v2y
+        if cross == 0.0 and dot == 0.0:
+            return 90.0  # 길이 0 벡터 (acos 식과 같은 값 유지)
+        return math.degrees(abs(math.atan2(cross, dot)))
+    
+    # 3D 이상: 벡터 계산 및 내적
+    v1 = [a - b for a, b in zip(point_a, point_b)]
+    v2 = [c - b for c, b in zip(point_c, point_b)]
+    norm_v1 = math.hypot(*v1)
+    norm_v2 = math.hypot(*v2)
+    dot = sum(x * y for x, y in zip(v1, v2))
+    
+    # 코사인 값 계산 (0으로 나누기 방지)
+    cos_angle = dot / ((norm_v1 + 1e-9) * (norm_v2 + 1e-9))
     
     # -1 ~ 1 범위로 제한 (부동소수점 오차 방지)
-    cos_angle = max(-1.0, min(1.0, float(cos_angle)))
+    cos_angle = max(-1.0, min(1.0, cos_angle))
     
     # 라디안 → 도(degree) 변환
-    angle_rad = math.acos(cos_angle)
-    angle_deg = math.degrees(angle_rad)
+    return math.degrees(math.acos(cos_angle))
+
+
+def angles_at_joints(point_a, point_b, point_c):
+    """
+    여러 관절 각도를 한 번에 계산 (2D angle_at_joint의 벡터화 버전)
+    
+    Args:
+        point_a: (N, 2) 첫 번째 점들
+        point_b: (N, 2) 중심점(관절)들
+        point_c: (N, 2) 세 번째 점들
     
-    return angle_deg
+    Returns:
+        np.ndarray: (N,) 각도 (degree)
+    
+    Raises:
+        ValueError: 2D 좌표 배열이 아닐 때 (3D 각도는 angle_at_joint 사용)
+    """
+    if point_b.ndim != 2 or point_b.shape[1] != 2:
+        raise ValueError(f"Expected (N, 2) points, got shape {point_b.shape}")
+    
+    v1 = point_a - point_b
+    v2 = point_c - point_b
+    cross = v1[:, 0] * v2[:, 1] - v1[:, 1] * v2[:, 0]
+    dot = np.einsum('ij,ij->i', v1, v2)
+    # atan2(외적, 내적): 길이 0 벡터(0, 0)는 acos 식과 같은 90°로
+    angles = np.degrees(np.abs(np.arctan2(cross, dot)))
+    angles[(cross == 0) & (dot == 0)] = 90.0
+    return angles
 
 
 def normalize_coordinates(x, y, width, height):
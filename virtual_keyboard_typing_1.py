@@ -3,6 +3,10 @@ import numpy as np
 import time
 import math
 import ctypes
+import bisect
+import concurrent.futures
+import queue
+import threading
 
 try:
     import win32api, win32con
@@ -12,6 +16,9 @@ except Exception:
 
 import mediapipe as mp
 
+from control.win_input import tap_key
+from pipeline import CaptureThread, InferenceThread
+
 
 def clamp(v, lo, hi):
     return lo if v < lo else hi if v > hi else v
@@ -31,6 +38,10 @@ class VirtualKeyboardWithGesture:
     L_EYE_OUTER = 263
     L_EYE_INNER = 362
     
+    # Hand landmarks (검지 MCP → PIP → DIP → TIP, 연속 인덱스)
+    INDEX_MCP = 5
+    INDEX_TIP = 8
+    
     # 키보드 레이아웃 정의 (휴대폰 스타일)
     KEYBOARD_LAYOUT = {
         'row0': ['1', '2', '3', '4', '5', '6', '7', '8', '9', '0'],  # 숫자
@@ -50,6 +61,9 @@ class VirtualKeyboardWithGesture:
                  cam_index=0, 
                  cam_w=1280, 
                  cam_h=720,
+                 cam_fourcc="MJPG",
+                 cam_fps=30,
+                 cam_buffer_size=1,
                  det_conf_face=0.5,
                  det_conf_hand=0.7, 
                  track_conf_hand=0.6,
@@ -57,15 +71,44 @@ class VirtualKeyboardWithGesture:
                  key_spacing=6,
                  keyboard_y_start=250,
                  click_angle_threshold=150.0,
-                 release_angle_threshold=165.0):
+                 release_angle_threshold=165.0,
+                 threaded=True,
+                 inference_scale=0.5,
+                 face_reuse_frames=2,
+                 hand_reuse_frames=2):
         
         # 카메라 설정
         self.cap = cv2.VideoCapture(cam_index, cv2.CAP_DSHOW)
+        # 압축 포맷(MJPG)은 해상도보다 먼저 지정해야 적용되는 드라이버가 있음
+        # (DSHOW 기본 YUY2는 720p에서 USB 대역폭 때문에 10fps 안팎으로 제한됨)
+        if cam_fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*cam_fourcc))
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, cam_w)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, cam_h)
+        self.cap.set(cv2.CAP_PROP_FPS, cam_fps)
+        # 드라이버 버퍼에 오래된 프레임이 쌓이지 않도록 (백엔드에 따라 무시될 수 있음)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, cam_buffer_size)
         self.frame_w = cam_w
         self.frame_h = cam_h
 
+        # 캡처 / 추론 스레드 파이프라인 사용 여부
+        self.threaded = threaded
+        
+        # MediaPipe 입력 축소 비율 (1.0이면 원본 해상도)
+        self.inference_scale = inference_scale
+        
+        # 추론 입력 버퍼 (프레임당 할당 방지, 해상도가 바뀌면 재생성)
+        self._small_buf = None
+        self._rgb_buf = None
+        
+        # 검출 성공 후 직전 결과를 재사용할 프레임 수 (놓치면 다음 프레임에 바로 재검출)
+        self.face_reuse_frames = face_reuse_frames
+        self.hand_reuse_frames = hand_reuse_frames
+        self._face_res = None
+        self._hand_res = None
+        self._face_skip = 0
+        self._hand_skip = 0
+
         # MediaPipe 초기화
         self.face_mesh = mp.solutions.face_mesh.FaceMesh(
             static_image_mode=False,
@@ -83,6 +126,13 @@ class VirtualKeyboardWithGesture:
         )
         
         self.drawer = mp.solutions.drawing_utils
+        # 손 그리기 연결선/스타일 (스타일 함수는 호출마다 dict를 새로 만들므로 한 번만 생성)
+        self._hand_connections = mp.solutions.hands.HAND_CONNECTIONS
+        self._hand_landmark_style = mp.solutions.drawing_styles.get_default_hand_landmarks_style()
+        self._hand_connection_style = mp.solutions.drawing_styles.get_default_hand_connections_style()
+        
+        # 얼굴/손 추론 동시 실행용 (TFLite 추론 중에는 GIL이 풀려 두 모델이 다른 코어에서 겹침)
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="MediaPipe")
         
         # 키보드 설정
         self.key_size = key_size
@@ -99,8 +149,10 @@ class VirtualKeyboardWithGesture:
         self.typing_enabled = True
         self.show_keyboard = True
         self.show_angle_info = True
+        self.show_hand_overlay = False  # 손 전체 랜드마크 (검지 관절 선은 항상 표시)
         self.last_key_press = {}
         self.key_cooldown_ms = 300
+        self.key_cooldown_ns = self.key_cooldown_ms * 1_000_000
         
         # 각 손가락의 클릭 상태 추적
         self.finger_click_state = {}  # {hand_idx: bool}
@@ -108,6 +160,13 @@ class VirtualKeyboardWithGesture:
         # 시각화
         self.hovered_keys = {}  # {hand_idx: key_char}
         self.pressed_keys = {}  # {key_char: timestamp}
+        
+        # HUD 스프라이트 캐시 (HUD 줄 내용이 바뀔 때만 다시 렌더링)
+        self._hud_cache = None  # (sprite, mask)
+        self._hud_state_key = None
+        
+        # 키 → 가상 키 코드 (SHIFT, !#1은 모드 전환 키라 제외)
+        self._vk_table = self._build_vk_table() if WINDOWS else {}
 
         if WINDOWS:
             self.SW = win32api.GetSystemMetrics(0)
@@ -186,22 +245,169 @@ class VirtualKeyboardWithGesture:
             h = self.key_size
             self.key_rects[key] = (x, y, w, h)
             x += w + self.key_spacing
+        
+        # 키 라벨 위치와 기본 상태 키보드는 레이아웃이 바뀔 때만 계산
+        self._build_key_index()
+        self._build_key_labels()
+        self._render_keyboard_base()
 
-    def _get_eye_midpoint(self, face, w, h):
-        """양안 중점 계산"""
-        lm = face.landmark
+    def _build_key_index(self):
+        """
+        키 충돌 검사용 행/열 경계 인덱스 생성
+        
+        self._row_tops: 행 위쪽 Y 좌표 (오름차순)
+        self._key_rows: 행별 (아래쪽 Y, 키 왼쪽 X 리스트, 키 오른쪽 X 리스트, 키 리스트)
+        """
+        rows = {}
+        for key_char, (x, y, w, h) in self.key_rects.items():
+            rows.setdefault((y, y + h), []).append((x, x + w, key_char))
+        
+        self._row_tops = []
+        self._key_rows = []
+        for (top, bottom), keys in sorted(rows.items()):
+            keys.sort()
+            self._row_tops.append(top)
+            self._key_rows.append((
+                bottom,
+                [left for left, right, key_char in keys],
+                [right for left, right, key_char in keys],
+                [key_char for left, right, key_char in keys],
+            ))
+
+    def _build_key_labels(self):
+        """키별 (텍스트, 글자 크기, 기준점) 계산 (텍스트 없는 키는 None)"""
+        self.key_labels = {}
         
-        r_outer = np.array([lm[self.R_EYE_OUTER].x * w, lm[self.R_EYE_OUTER].y * h])
-        r_inner = np.array([lm[self.R_EYE_INNER].x * w, lm[self.R_EYE_INNER].y * h])
-        r_center = 0.5 * (r_outer + r_inner)
+        for key_char, (x, y, w, h) in self.key_rects.items():
+            if key_char == 'SPACE':
+                text = ''  # 스페이스바는 빈 공간
+                font_scale = 0.5
+            elif key_char == 'BKSP':
+                text = '←'
+                font_scale = 0.8
+            elif key_char == 'SHIFT':
+                text = '⇧'
+                font_scale = 0.8
+            elif key_char == 'ENTER':
+                text = '↵'
+                font_scale = 0.8
+            elif key_char == '!#1':
+                text = '!#1'
+                font_scale = 0.5
+            elif key_char.isdigit():
+                text = key_char
+                font_scale = 0.7
+            else:
+                text = key_char
+                font_scale = 0.7
+            
+            if not text:
+                self.key_labels[key_char] = None
+                continue
+            
+            text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)[0]
+            text_x = x + (w - text_size[0]) // 2
+            text_y = y + (h + text_size[1]) // 2
+            self.key_labels[key_char] = (text, font_scale, (text_x, text_y))
+
+    def _draw_key(self, canvas, key_char, color, origin=(0, 0)):
+        """
+        키 하나 그리기 (박스 + 테두리 + 텍스트)
+        
+        Args:
+            canvas: 그릴 이미지
+            key_char: 키
+            color: 키 배경 색
+            origin: canvas 좌상단의 프레임 좌표 (x, y)
+        """
+        ox, oy = origin
+        x, y, w, h = self.key_rects[key_char]
+        x -= ox
+        y -= oy
+        
+        # 키 박스
+        cv2.rectangle(canvas, (x, y), (x + w, y + h), color, -1)
+        cv2.rectangle(canvas, (x, y), (x + w, y + h), (200, 200, 200), 2)
+        
+        # 키 텍스트
+        label = self.key_labels[key_char]
+        if label is not None:
+            text, font_scale, (text_x, text_y) = label
+            cv2.putText(canvas, text, (text_x - ox, text_y - oy),
+                       cv2.FONT_HERSHEY_SIMPLEX, font_scale, self.TEXT_COLOR, 2)
+
+    def _render_keyboard_base(self):
+        """
+        모든 키를 기본 색으로 한 번 그려 스프라이트로 캐시
+        
+        self._kb_base = (x0, y0, sprite, mask): 키들을 감싸는 영역의 프레임 좌표,
+        BGR 이미지, 그려진 픽셀 마스크 (uint8, 키 사이 빈 공간은 0)
+        """
+        key_color = (1, 2, 3)  # 키 그리기에 쓰지 않는 배경 판별용 색
+        
+        # 테두리(두께 2)가 사각형 밖으로 1px 나가므로 여유 2px
+        x0 = min(x for x, y, w, h in self.key_rects.values()) - 2
+        y0 = min(y for x, y, w, h in self.key_rects.values()) - 2
+        x1 = max(x + w for x, y, w, h in self.key_rects.values()) + 3
+        y1 = max(y + h for x, y, w, h in self.key_rects.values()) + 3
+        
+        canvas = np.empty((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+        canvas[:] = key_color
+        for key_char in self.key_rects:
+            self._draw_key(canvas, key_char, self.KEY_COLOR_NORMAL, (x0, y0))
+        
+        mask = np.any(canvas != key_color, axis=2).astype(np.uint8)
+        self._kb_base = (x0, y0, canvas, mask)
+
+    def _render_hud(self, hud, frame_w, frame_h):
+        """
+        HUD 텍스트 줄을 검정 배경 막대와 함께 스프라이트로 렌더링
+        
+        Args:
+            hud: HUD 텍스트 줄 리스트
+            frame_w, frame_h: 프레임 크기 (스프라이트를 프레임 안으로 자름)
+        
+        Returns:
+            (sprite, mask): 좌상단 (0, 0) 기준 BGR 이미지, 배경 막대 마스크 (uint8)
+        """
+        # 글자는 항상 자기 배경 막대 안에 그려지므로 막대 영역만 덮어쓰면 직접 그린 것과 동일
+        widths = [cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0][0] for text in hud]
+        hud_w = min(frame_w, max(widths) + 16)
+        hud_h = min(frame_h, 28 * len(hud) + 8)
+        
+        sprite = np.zeros((hud_h, hud_w, 3), dtype=np.uint8)
+        mask = np.zeros((hud_h, hud_w), dtype=np.uint8)
+        
+        y = 30
+        for text, text_w in zip(hud, widths):
+            # 배경
+            cv2.rectangle(mask, (5, y - 22), (15 + text_w, y + 5), 255, -1)
+            
+            # 텍스트
+            if "ON" in text or "YES" in text:
+                color = (0, 255, 0)
+            elif "MOBILE" in text:
+                color = (0, 255, 255)
+            else:
+                color = (255, 255, 255)
+            
+            cv2.putText(sprite, text, (10, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+            y += 28
         
-        l_outer = np.array([lm[self.L_EYE_OUTER].x * w, lm[self.L_EYE_OUTER].y * h])
-        l_inner = np.array([lm[self.L_EYE_INNER].x * w, lm[self.L_EYE_INNER].y * h])
-        l_center = 0.5 * (l_outer + l_inner)
+        return sprite, mask
+
+    def _get_eye_midpoint(self, face, w, h):
+        """양안 중점 계산 (눈 꼬리 4점의 평균, 스칼라 연산)"""
+        lm = face.landmark
+        r_outer = lm[self.R_EYE_OUTER]
+        r_inner = lm[self.R_EYE_INNER]
+        l_outer = lm[self.L_EYE_OUTER]
+        l_inner = lm[self.L_EYE_INNER]
         
-        eye_midpoint = 0.5 * (r_center + l_center)
+        mx = (r_outer.x + r_inner.x + l_outer.x + l_inner.x) * 0.25 * w
+        my = (r_outer.y + r_inner.y + l_outer.y + l_inner.y) * 0.25 * h
         
-        return eye_midpoint
+        return (mx, my)
 
     def _get_index_finger_data(self, hand_landmarks_list, w, h):
         """양손의 검지 손가락 데이터 추출 (MCP 위치 + 각도)"""
@@ -210,65 +416,63 @@ class VirtualKeyboardWithGesture:
         for hand_idx, hand in enumerate(hand_landmarks_list):
             lm = hand.landmark
             
-            # 검지 관절 좌표
-            idx_mcp = mp.solutions.hands.HandLandmark.INDEX_FINGER_MCP
-            idx_pip = mp.solutions.hands.HandLandmark.INDEX_FINGER_PIP
-            idx_dip = mp.solutions.hands.HandLandmark.INDEX_FINGER_DIP
-            idx_tip = mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP
-            
-            # MCP 위치 (커서 위치로 사용)
-            mcp_x = lm[idx_mcp].x * w
-            mcp_y = lm[idx_mcp].y * h
-            
-            # 각도 계산을 위한 좌표
-            mcp_pos = np.array([lm[idx_mcp].x * w, lm[idx_mcp].y * h])
-            pip_pos = np.array([lm[idx_pip].x * w, lm[idx_pip].y * h])
-            dip_pos = np.array([lm[idx_dip].x * w, lm[idx_dip].y * h])
-            tip_pos = np.array([lm[idx_tip].x * w, lm[idx_tip].y * h])
+            # 검지 관절 4개를 한 번에 (x, y) 픽셀 좌표로 모으기 (연속 인덱스 슬라이스)
+            pts = [(p.x * w, p.y * h) for p in lm[self.INDEX_MCP:self.INDEX_TIP + 1]]
+            mcp_pos, pip_pos, dip_pos, tip_pos = pts
             
             # 검지 구부림 각도 계산 (PIP 관절 기준)
             finger_angle = self._calculate_angle(mcp_pos, pip_pos, dip_pos)
             
             finger_data_list.append({
                 'hand_idx': hand_idx,
-                'mcp_pos': np.array([mcp_x, mcp_y]),  # 커서 위치
+                'mcp_pos': mcp_pos,  # 커서 위치
                 'angle': finger_angle,  # 구부림 각도
                 'mcp': mcp_pos,
                 'pip': pip_pos,
                 'dip': dip_pos,
-                'tip': tip_pos
+                'tip': tip_pos,
+                'joints_px': [(int(x), int(y)) for x, y in pts]  # 그리기용 정수 좌표 (MCP → TIP)
             })
         
         return finger_data_list
 
     def _calculate_angle(self, a, b, c):
-        """세 점으로 이루어진 각도 계산 (b가 중심점)"""
-        v1 = a - b
-        v2 = c - b
+        """세 점으로 이루어진 각도 계산 (b가 중심점, 2D 점 3개는 NumPy 호출 없이 math로)"""
+        v1x, v1y = a[0] - b[0], a[1] - b[1]
+        v2x, v2y = c[0] - b[0], c[1] - b[1]
         
-        norm1 = np.linalg.norm(v1)
-        norm2 = np.linalg.norm(v2)
+        # atan2(|외적|, 내적): 정규화/클리핑 없이 0~180° (0°/180° 부근에서도 정확)
+        cross = v1x * v2y - v1y * v2x
+        dot = v1x * v2x + v1y * v2y
         
-        if norm1 == 0 or norm2 == 0:
-            return 180.0
+        if cross == 0 and dot == 0:
+            return 180.0  # 길이 0 벡터 (펴진 손가락으로 취급)
         
-        cos_angle = np.dot(v1, v2) / (norm1 * norm2)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        
-        angle_rad = np.arccos(cos_angle)
-        angle_deg = np.degrees(angle_rad)
-        
-        return angle_deg
+        return math.degrees(math.atan2(abs(cross), dot))
 
-    def _check_key_collision(self, finger_pos, key_char):
-        """손가락과 키 충돌 감지"""
-        if key_char not in self.key_rects:
-            return False
+    def _find_key(self, finger_pos):
+        """
+        손가락 위치의 키 찾기 (행/열 경계 이진 탐색, 경계 포함)
+        
+        Args:
+            finger_pos: (x, y) 픽셀 좌표
         
+        Returns:
+            키 문자 또는 None
+        """
         fx, fy = finger_pos
-        kx, ky, kw, kh = self.key_rects[key_char]
         
-        return (kx <= fx <= kx + kw) and (ky <= fy <= ky + kh)
+        row = bisect.bisect_right(self._row_tops, fy) - 1
+        if row < 0:
+            return None
+        bottom, lefts, rights, keys = self._key_rows[row]
+        if fy > bottom:
+            return None
+        
+        col = bisect.bisect_right(lefts, fx) - 1
+        if col < 0 or fx > rights[col]:
+            return None
+        return keys[col]
 
     def _detect_click_gesture(self, finger_data):
         """검지 구부리기 제스처로 클릭 감지"""
@@ -291,63 +495,68 @@ class VirtualKeyboardWithGesture:
         return False
 
     def _can_press_key(self, key_char):
-        """키 반복 입력 방지"""
-        now_ms = int(time.time() * 1000)
+        """키 반복 입력 방지 (단조 시계 정수 비교, 시스템 시각 보정 영향 없음)"""
+        now_ns = time.perf_counter_ns()
         
         if key_char not in self.last_key_press:
-            self.last_key_press[key_char] = now_ms
+            self.last_key_press[key_char] = now_ns
             return True
         
-        if now_ms - self.last_key_press[key_char] > self.key_cooldown_ms:
-            self.last_key_press[key_char] = now_ms
+        if now_ns - self.last_key_press[key_char] > self.key_cooldown_ns:
+            self.last_key_press[key_char] = now_ns
             return True
         
         return False
 
+    def _build_vk_table(self):
+        """레이아웃의 키별 가상 키 코드 테이블 생성"""
+        special = {
+            'SPACE': win32con.VK_SPACE,
+            'BKSP': win32con.VK_BACK,
+            'ENTER': win32con.VK_RETURN,
+            ',': win32con.VK_OEM_COMMA,
+            '.': win32con.VK_OEM_PERIOD,
+        }
+        
+        vk_table = {}
+        for row in self.KEYBOARD_LAYOUT.values():
+            for key_char in row:
+                if key_char in special:
+                    vk_table[key_char] = special[key_char]
+                elif key_char.isalpha() and len(key_char) == 1:
+                    # 알파벳
+                    vk_table[key_char] = ord(key_char.upper())
+                elif key_char.isdigit():
+                    # 숫자
+                    vk_table[key_char] = ord(key_char)
+        return vk_table
+
     def _type_key(self, key_char):
         """Win32 API를 사용한 실제 키 입력"""
         if not WINDOWS or not self.typing_enabled:
             return
         
+        if key_char == 'SHIFT':
+            # Shift는 토글 방식으로 처리 (대소문자 전환)
+            print(f"[SHIFT] Toggle (implement shift state if needed)")
+            return
+        elif key_char == '!#1':
+            # 특수기호 모드 전환
+            print(f"[SPECIAL] Toggle special characters mode")
+            return
+        
+        vk_code = self._vk_table.get(key_char)
+        if vk_code is None:
+            return
+        
         try:
-            # 특수 키 매핑
-            if key_char == 'SPACE':
-                vk_code = win32con.VK_SPACE
-            elif key_char == 'BKSP':
-                vk_code = win32con.VK_BACK
-            elif key_char == 'ENTER':
-                vk_code = win32con.VK_RETURN
-            elif key_char == 'SHIFT':
-                # Shift는 토글 방식으로 처리 (대소문자 전환)
-                print(f"[SHIFT] Toggle (implement shift state if needed)")
-                return
-            elif key_char == '!#1':
-                # 특수기호 모드 전환
-                print(f"[SPECIAL] Toggle special characters mode")
-                return
-            elif key_char.isalpha():
-                # 알파벳
-                vk_code = ord(key_char.upper())
-            elif key_char.isdigit():
-                # 숫자
-                vk_code = ord(key_char)
-            elif key_char == ',':
-                vk_code = win32con.VK_OEM_COMMA
-            elif key_char == '.':
-                vk_code = win32con.VK_OEM_PERIOD
-            else:
-                return
-            
-            # 키 누름
-            win32api.keybd_event(vk_code, 0, 0, 0)
-            time.sleep(0.01)
-            # 키 뗌
-            win32api.keybd_event(vk_code, 0, win32con.KEYEVENTF_KEYUP, 0)
+            # 키 누름 + 뗌을 SendInput 한 번으로 전송 (캡처 루프 블로킹 없음)
+            tap_key(vk_code)
             
             print(f"[TYPED] {key_char}")
             
             # 시각적 피드백
-            self.pressed_keys[key_char] = time.time()
+            self.pressed_keys[key_char] = time.perf_counter()
             
         except Exception as e:
             print(f"Typing error: {e}")
@@ -357,70 +566,104 @@ class VirtualKeyboardWithGesture:
         if not self.show_keyboard:
             return frame
         
-        # 반투명 배경
-        overlay = frame.copy()
-        cv2.rectangle(overlay, 
-                     (0, self.keyboard_y_start - 20), 
-                     (self.frame_w, self.frame_h), 
-                     (30, 30, 30), 
-                     -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
-        
-        now = time.time()
+        # 반투명 배경 (30 × 0.7 + frame × 0.3, 배경 영역만 제자리 변환)
+        bg = frame[max(self.keyboard_y_start - 20, 0):self.frame_h + 1, :self.frame_w + 1]
+        cv2.addWeighted(bg, 0.3, bg, 0.0, 30 * 0.7, bg)
+        
+        now = time.perf_counter()
+        
+        # 눌림 표시(0.2초)가 끝난 키는 버리고, 호버 키는 프레임당 한 번만 집합으로 모으기
+        if self.pressed_keys:
+            self.pressed_keys = {k: t for k, t in self.pressed_keys.items() if now - t < 0.2}
+        pressed = self.pressed_keys
+        hovered = set(self.hovered_keys.values())
+        
+        # 기본 색 키보드는 캐시된 스프라이트를 한 번에 복사
+        frame_h, frame_w = frame.shape[:2]
+        x0, y0, sprite, mask = self._kb_base
+        sh, sw = sprite.shape[:2]
+        if x0 >= 0 and y0 >= 0 and y0 + sh <= frame_h and x0 + sw <= frame_w:
+            cv2.copyTo(sprite, mask, frame[y0:y0 + sh, x0:x0 + sw])
+            keys = hovered.union(pressed)
+        else:
+            # 키보드가 프레임 밖으로 나가면 모든 키를 직접 그리기
+            keys = self.key_rects
         
-        # 각 키 그리기
-        for key_char, (x, y, w, h) in self.key_rects.items():
-            # 키 색상 결정
-            if key_char in self.pressed_keys and (now - self.pressed_keys[key_char] < 0.2):
+        # 눌림/호버 상태 키만 덧그리기
+        for key_char in keys:
+            if key_char in pressed:
                 color = self.KEY_COLOR_PRESSED
-            elif key_char in self.hovered_keys.values():
+            elif key_char in hovered:
                 color = self.KEY_COLOR_HOVER
-            else:
+            elif keys is self.key_rects:
                 color = self.KEY_COLOR_NORMAL
-            
-            # 키 박스
-            cv2.rectangle(frame, (x, y), (x + w, y + h), color, -1)
-            cv2.rectangle(frame, (x, y), (x + w, y + h), (200, 200, 200), 2)
-            
-            # 키 텍스트
-            if key_char == 'SPACE':
-                text = ''  # 스페이스바는 빈 공간
-                font_scale = 0.5
-            elif key_char == 'BKSP':
-                text = '←'
-                font_scale = 0.8
-            elif key_char == 'SHIFT':
-                text = '⇧'
-                font_scale = 0.8
-            elif key_char == 'ENTER':
-                text = '↵'
-                font_scale = 0.8
-            elif key_char == '!#1':
-                text = '!#1'
-                font_scale = 0.5
-            elif key_char.isdigit():
-                text = key_char
-                font_scale = 0.7
             else:
-                text = key_char
-                font_scale = 0.7
+                continue
             
-            if text:  # 텍스트가 있을 때만 그리기
-                text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)[0]
-                text_x = x + (w - text_size[0]) // 2
-                text_y = y + (h + text_size[1]) // 2
-                cv2.putText(frame, text, (text_x, text_y), 
-                           cv2.FONT_HERSHEY_SIMPLEX, font_scale, self.TEXT_COLOR, 2)
+            self._draw_key(frame, key_char, color)
         
         return frame
 
-    def process_frame(self, frame):
-        """프레임 처리"""
+    def detect_landmarks(self, frame):
+        """
+        얼굴/손 랜드마크 검출 (MediaPipe 추론 단계)
+        
+        Args:
+            frame: 좌우 반전된 웹캠 프레임 (BGR)
+        
+        Returns:
+            (face_res, hand_res)
+        """
+        # 직전 프레임에 검출된 얼굴/손은 몇 프레임 동안 결과 재사용
+        run_face = self._face_skip == 0
+        run_hand = self._hand_skip == 0
+        if not run_face:
+            self._face_skip -= 1
+        if not run_hand:
+            self._hand_skip -= 1
+        if not (run_face or run_hand):
+            return self._face_res, self._hand_res
+        
+        # 추론용 축소 (랜드마크는 정규화 좌표이므로 픽셀 변환은 원본 w, h 그대로 사용)
+        scale = self.inference_scale
+        if scale != 1.0:
+            h, w = frame.shape[:2]
+            size = (max(1, int(w * scale)), max(1, int(h * scale)))
+            if self._small_buf is None or self._small_buf.shape[1::-1] != size:
+                self._small_buf = np.empty((size[1], size[0], 3), dtype=frame.dtype)
+            frame = cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+        
+        # RGB 변환 (두 모델의 추론이 끝난 뒤 반환하므로 다음 프레임에서 버퍼를 덮어써도 안전)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        
+        # 얼굴과 손을 동시에 추론 (프레임 지연이 두 추론의 합 → 큰 쪽 하나로)
+        # 같은 모델은 한 번에 한 프레임만 처리하도록 두 결과를 모두 기다린 뒤 반환
+        f_face = self._pool.submit(self.face_mesh.process, rgb) if run_face else None
+        f_hand = self._pool.submit(self.hands.process, rgb) if run_hand else None
+        
+        if f_face is not None:
+            self._face_res = f_face.result()
+            self._face_skip = self.face_reuse_frames if self._face_res.multi_face_landmarks else 0
+        if f_hand is not None:
+            self._hand_res = f_hand.result()
+            self._hand_skip = self.hand_reuse_frames if self._hand_res.multi_hand_landmarks else 0
+        
+        return self._face_res, self._hand_res
+
+    def process_frame(self, frame, detections=None):
+        """
+        프레임 처리
+        
+        Args:
+            frame: 좌우 반전된 웹캠 프레임 (BGR)
+            detections: detect_landmarks() 결과 (None이면 이 자리에서 검출)
+        """
         h, w = frame.shape[:2]
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        face_res = self.face_mesh.process(rgb)
-        hand_res = self.hands.process(rgb)
+        if detections is None:
+            detections = self.detect_landmarks(frame)
+        face_res, hand_res = detections
         
         hud = []
         eye_midpoint = None
@@ -429,21 +672,23 @@ class VirtualKeyboardWithGesture:
         if face_res.multi_face_landmarks:
             face = face_res.multi_face_landmarks[0]
             eye_midpoint = self._get_eye_midpoint(face, w, h)
-            cv2.circle(frame, (int(eye_midpoint[0]), int(eye_midpoint[1])), 8, (0, 200, 255), -1)
+            eye_px = (int(eye_midpoint[0]), int(eye_midpoint[1]))
+            cv2.circle(frame, eye_px, 8, (0, 200, 255), -1)
         
         # 손 감지
         self.hovered_keys = {}
         
         if hand_res.multi_hand_landmarks:
-            # 손 랜드마크 그리기
-            for hand in hand_res.multi_hand_landmarks:
-                self.drawer.draw_landmarks(
-                    frame, 
-                    hand, 
-                    mp.solutions.hands.HAND_CONNECTIONS,
-                    mp.solutions.drawing_styles.get_default_hand_landmarks_style(),
-                    mp.solutions.drawing_styles.get_default_hand_connections_style()
-                )
+            # 손 랜드마크 그리기 (디버그용, 타이핑에 쓰는 검지 관절은 아래에서 따로 그림)
+            if self.show_hand_overlay:
+                for hand in hand_res.multi_hand_landmarks:
+                    self.drawer.draw_landmarks(
+                        frame, 
+                        hand, 
+                        self._hand_connections,
+                        self._hand_landmark_style,
+                        self._hand_connection_style
+                    )
             
             # 검지 손가락 데이터 추출
             finger_data_list = self._get_index_finger_data(hand_res.multi_hand_landmarks, w, h)
@@ -452,26 +697,20 @@ class VirtualKeyboardWithGesture:
                 hand_idx = finger_data['hand_idx']
                 mcp_pos = finger_data['mcp_pos']
                 angle = finger_data['angle']
-                mcp = finger_data['mcp']
-                pip = finger_data['pip']
-                dip = finger_data['dip']
-                tip = finger_data['tip']
+                mcp_px, pip_px, dip_px, tip_px = finger_data['joints_px']
                 
                 # 검지 MCP 위치 표시 (커서)
-                cv2.circle(frame, (int(mcp_pos[0]), int(mcp_pos[1])), 12, (255, 0, 255), -1)
-                cv2.circle(frame, (int(mcp_pos[0]), int(mcp_pos[1])), 15, (255, 0, 255), 2)
+                cv2.circle(frame, mcp_px, 12, (255, 0, 255), -1)
+                cv2.circle(frame, mcp_px, 15, (255, 0, 255), 2)
                 
                 # 검지 관절 선 그리기
-                cv2.line(frame, tuple(mcp.astype(int)), tuple(pip.astype(int)), (0, 255, 0), 2)
-                cv2.line(frame, tuple(pip.astype(int)), tuple(dip.astype(int)), (0, 255, 0), 2)
-                cv2.line(frame, tuple(dip.astype(int)), tuple(tip.astype(int)), (0, 255, 0), 2)
+                cv2.line(frame, mcp_px, pip_px, (0, 255, 0), 2)
+                cv2.line(frame, pip_px, dip_px, (0, 255, 0), 2)
+                cv2.line(frame, dip_px, tip_px, (0, 255, 0), 2)
                 
                 # 양안 중점에서 MCP까지 선
                 if eye_midpoint is not None:
-                    cv2.line(frame, 
-                            (int(eye_midpoint[0]), int(eye_midpoint[1])),
-                            (int(mcp_pos[0]), int(mcp_pos[1])),
-                            (255, 0, 255), 2)
+                    cv2.line(frame, eye_px, mcp_px, (255, 0, 255), 2)
                 
                 # 각도 정보 표시
                 if self.show_angle_info:
@@ -479,21 +718,19 @@ class VirtualKeyboardWithGesture:
                     angle_text = f"{angle:.1f}deg"
                     angle_color = (0, 255, 0) if is_clicking else (255, 255, 255)
                     cv2.putText(frame, angle_text,
-                               (int(mcp_pos[0]) + 20, int(mcp_pos[1])),
+                               (mcp_px[0] + 20, mcp_px[1]),
                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, angle_color, 2)
                 
                 # 키 충돌 감지 (MCP 위치 기준)
-                for key_char in self.key_rects.keys():
-                    if self._check_key_collision(mcp_pos, key_char):
-                        self.hovered_keys[hand_idx] = key_char
-                        
-                        # 클릭 제스처 감지
-                        is_click = self._detect_click_gesture(finger_data)
-                        
-                        if is_click and self._can_press_key(key_char):
-                            self._type_key(key_char)
-                        
-                        break
+                key_char = self._find_key(mcp_pos)
+                if key_char is not None:
+                    self.hovered_keys[hand_idx] = key_char
+                    
+                    # 클릭 제스처 감지
+                    is_click = self._detect_click_gesture(finger_data)
+                    
+                    if is_click and self._can_press_key(key_char):
+                        self._type_key(key_char)
         
         # 키보드 그리기
         frame = self._draw_keyboard(frame)
@@ -516,6 +753,117 @@ class VirtualKeyboardWithGesture:
         
         return frame, hud
 
+    def render(self, frame, detections=None):
+        """
+        프레임 처리 + HUD + 화면 표시 + 키 입력 처리
+        
+        Args:
+            frame: 좌우 반전된 웹캠 프레임 (BGR)
+            detections: detect_landmarks() 결과 (None이면 이 자리에서 검출)
+        
+        Returns:
+            bool: 계속 실행 여부
+        """
+        out, hud = self.process_frame(frame, detections)
+        
+        # HUD 텍스트 표시 (내용이 같으면 캐시된 스프라이트만 복사)
+        if hud:
+            frame_h, frame_w = out.shape[:2]
+            state_key = (frame_w, frame_h, tuple(hud))
+            if state_key != self._hud_state_key:
+                self._hud_cache = self._render_hud(hud, frame_w, frame_h)
+                self._hud_state_key = state_key
+            
+            sprite, mask = self._hud_cache
+            hud_h, hud_w = mask.shape
+            cv2.copyTo(sprite, mask, out[:hud_h, :hud_w])
+        
+        cv2.imshow("Mobile-Style Virtual Keyboard", out)
+        
+        # 키 입력
+        return self.handle_key(cv2.waitKey(1) & 0xFF)
+
+    def handle_key(self, key):
+        """
+        키 입력 처리
+        
+        Args:
+            key: cv2.waitKey 결과 (하위 8비트)
+        
+        Returns:
+            bool: 계속 실행 여부
+        """
+        if key == ord('q'):
+            return False
+        elif key == ord('t'):
+            self.typing_enabled = not self.typing_enabled
+            print(f"Typing: {'ON' if self.typing_enabled else 'OFF'}")
+        elif key == ord('k'):
+            self.show_keyboard = not self.show_keyboard
+            print(f"Keyboard display: {'ON' if self.show_keyboard else 'OFF'}")
+        elif key == ord('a'):
+            self.show_angle_info = not self.show_angle_info
+            print(f"Angle info: {'ON' if self.show_angle_info else 'OFF'}")
+        elif key == ord('h'):
+            self.show_hand_overlay = not self.show_hand_overlay
+            print(f"Hand overlay: {'ON' if self.show_hand_overlay else 'OFF'}")
+        elif key == ord('+') or key == ord('='):
+            self.click_angle_threshold = min(180.0, self.click_angle_threshold + 5.0)
+            print(f"Click angle threshold: {self.click_angle_threshold:.0f}°")
+        elif key == ord('-') or key == ord('_'):
+            self.click_angle_threshold = max(90.0, self.click_angle_threshold - 5.0)
+            print(f"Click angle threshold: {self.click_angle_threshold:.0f}°")
+        return True
+
+    def _run_serial(self):
+        """단일 스레드 루프 (캡처 → 추론 → 렌더링 순차 실행)"""
+        while True:
+            ok, frame = self.cap.read()
+            if not ok:
+                break
+            
+            # 좌우 반전 (제자리 연산으로 프레임 크기 할당 방지)
+            # 키보드/HUD 글자를 거울상 좌표에 그릴 수 없으므로 랜드마크 x 반전으로 대체하지 않음
+            cv2.flip(frame, 1, dst=frame)
+            if not self.render(frame):
+                break
+
+    def _run_threaded(self):
+        """
+        캡처 / 추론 스레드 + 메인 스레드 렌더링 파이프라인
+        
+        MediaPipe 객체는 추론 스레드만 사용하고, 키 상태와 창(imshow/waitKey)은
+        메인 스레드에서만 다룬다.
+        """
+        stop_event = threading.Event()
+        frame_q = queue.Queue(maxsize=1)
+        result_q = queue.Queue(maxsize=1)
+        
+        threads = [
+            CaptureThread(self.cap, frame_q, stop_event),
+            InferenceThread(self.detect_landmarks, frame_q, result_q, stop_event),
+        ]
+        for t in threads:
+            t.start()
+        
+        try:
+            while not stop_event.is_set():
+                try:
+                    frame, detections = result_q.get(timeout=0.1)
+                except queue.Empty:
+                    # 결과가 없어도 창 이벤트/키 입력은 처리
+                    if not self.handle_key(cv2.waitKey(1) & 0xFF):
+                        break
+                    continue
+                
+                if not self.render(frame, detections):
+                    break
+        finally:
+            # 스레드가 웹캠/MediaPipe를 쓰는 중에 해제하지 않도록 먼저 종료 대기
+            stop_event.set()
+            for t in threads:
+                t.join()
+
     def run(self):
         """메인 실행 루프"""
         if not self.cap.isOpened():
@@ -530,6 +878,7 @@ class VirtualKeyboardWithGesture:
         print("  t: Toggle typing ON/OFF")
         print("  k: Toggle keyboard display ON/OFF")
         print("  a: Toggle angle info ON/OFF")
+        print("  h: Toggle full hand landmarks ON/OFF")
         print("  +/-: Adjust click angle threshold")
         print("")
         print("Layout:")
@@ -548,60 +897,17 @@ class VirtualKeyboardWithGesture:
         print("=" * 70)
         
         try:
-            while True:
-                ok, frame = self.cap.read()
-                if not ok:
-                    break
-                
-                frame = cv2.flip(frame, 1)
-                out, hud = self.process_frame(frame)
-                
-                # HUD 텍스트 표시
-                y = 30
-                for text in hud:
-                    # 배경
-                    (text_w, text_h), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
-                    cv2.rectangle(out, (5, y - 22), (15 + text_w, y + 5), (0, 0, 0), -1)
-                    
-                    # 텍스트
-                    if "ON" in text or "YES" in text:
-                        color = (0, 255, 0)
-                    elif "MOBILE" in text:
-                        color = (0, 255, 255)
-                    else:
-                        color = (255, 255, 255)
-                    
-                    cv2.putText(out, text, (10, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
-                    y += 28
-                
-                cv2.imshow("Mobile-Style Virtual Keyboard", out)
-                
-                # 키 입력
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    break
-                elif key == ord('t'):
-                    self.typing_enabled = not self.typing_enabled
-                    print(f"Typing: {'ON' if self.typing_enabled else 'OFF'}")
-                elif key == ord('k'):
-                    self.show_keyboard = not self.show_keyboard
-                    print(f"Keyboard display: {'ON' if self.show_keyboard else 'OFF'}")
-                elif key == ord('a'):
-                    self.show_angle_info = not self.show_angle_info
-                    print(f"Angle info: {'ON' if self.show_angle_info else 'OFF'}")
-                elif key == ord('+') or key == ord('='):
-                    self.click_angle_threshold = min(180.0, self.click_angle_threshold + 5.0)
-                    print(f"Click angle threshold: {self.click_angle_threshold:.0f}°")
-                elif key == ord('-') or key == ord('_'):
-                    self.click_angle_threshold = max(90.0, self.click_angle_threshold - 5.0)
-                    print(f"Click angle threshold: {self.click_angle_threshold:.0f}°")
+            if self.threaded:
+                self._run_threaded()
+            else:
+                self._run_serial()
         
         finally:
             self.cap.release()
+            self._pool.shutdown()
             cv2.destroyAllWindows()
             print("\nVirtual Keyboard terminated.")
 
-
 def main():
     app = VirtualKeyboardWithGesture(
         cam_index=0,
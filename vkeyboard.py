@@ -3,6 +3,8 @@ import numpy as np
 import time
 import math
 import ctypes
+import queue
+import threading
 
 try:
     import win32api, win32con
@@ -12,11 +14,41 @@ except Exception:
 
 import mediapipe as mp
 
+from pipeline import CaptureThread
+
 
 def clamp(v, lo, hi):
     return lo if v < lo else hi if v > hi else v
 
 
+def z_touch_step(finger_z, prev_z, valid, push_count, threshold, required, touch, z_delta):
+    """
+    손가락 슬롯별 Z 밀어내기 상태 한 스텝 갱신 (상태/출력 버퍼 제자리 갱신)
+    
+    Args:
+        finger_z: 이번 프레임 손가락 Z (float64[:])
+        prev_z: 직전 프레임 손가락 Z (float64[:], 제자리 갱신)
+        valid: prev_z가 유효한 슬롯 (bool[:], 제자리 갱신)
+        push_count: 연속 밀기 카운트 (int64[:], 제자리 갱신)
+        threshold: 밀기로 인정할 프레임당 Z 변화량
+        required: 터치로 판정할 연속 밀기 프레임 수
+        touch: 터치 판정 출력 (bool[:])
+        z_delta: Z 변화량 출력 (float64[:], 처음 보는 슬롯은 0)
+    """
+    np.subtract(finger_z, prev_z, out=z_delta)
+    z_delta[~valid] = 0.0
+    
+    push_count += 1
+    push_count[~(z_delta > threshold)] = 0
+    
+    np.greater_equal(push_count, required, out=touch)
+    touch &= valid
+    push_count[touch] = 0
+    
+    prev_z[:] = finger_z
+    valid[:] = True
+
+
 class VirtualKeyboardTKL:
     """
     텐키리스 키보드 레이아웃을 사용한 가상 키보드
@@ -32,13 +64,17 @@ class VirtualKeyboardTKL:
     L_EYE_INNER = 362
     
     # Hand landmarks for all finger tips
-    FINGER_TIPS = [
-        mp.solutions.hands.HandLandmark.THUMB_TIP,        # 4
-        mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP,  # 8
-        mp.solutions.hands.HandLandmark.MIDDLE_FINGER_TIP, # 12
-        mp.solutions.hands.HandLandmark.RING_FINGER_TIP,   # 16
-        mp.solutions.hands.HandLandmark.PINKY_TIP          # 20
-    ]
+    # (HandLandmark enum 대신 정수 인덱스: 매 프레임 랜드마크 접근 시 enum 변환 방지)
+    FINGER_TIPS_IDX = (
+        4,   # THUMB_TIP
+        8,   # INDEX_FINGER_TIP
+        12,  # MIDDLE_FINGER_TIP
+        16,  # RING_FINGER_TIP
+        20,  # PINKY_TIP
+    )
+    
+    # 최대 손 개수 (손가락 슬롯 = hand_idx * 5 + finger_idx)
+    MAX_HANDS = 2
     
     # 손가락 이름
     FINGER_NAMES = ['THUMB', 'INDEX', 'MIDDLE', 'RING', 'PINKY']
@@ -75,6 +111,10 @@ class VirtualKeyboardTKL:
                  cam_index=0, 
                  cam_w=1280, 
                  cam_h=720,
+                 cam_fourcc="MJPG",
+                 cam_fps=30,
+                 cam_buffer_size=1,
+                 cv_threads=1,  # OpenCV 내부 스레드 수 (MediaPipe 추론 스레드와 코어 경쟁 방지, None이면 기본값)
                  det_conf_face=0.5,
                  det_conf_hand=0.7, 
                  track_conf_hand=0.6,
@@ -82,14 +122,49 @@ class VirtualKeyboardTKL:
                  key_spacing=3,
                  keyboard_x_start=None,  # None이면 자동 중앙 정렬
                  keyboard_y_start=None,  # None이면 자동 중앙 정렬
-                 z_push_threshold=0.10):  # Z축 밀어내기 감지 임계값 (높을수록 강하게 밀어야 함)
+                 z_push_threshold=0.10,  # Z축 밀어내기 감지 임계값 (높을수록 강하게 밀어야 함)
+                 inference_scale=0.5,  # MediaPipe 입력 축소 비율 (1.0이면 원본 해상도)
+                 face_interval=3,  # 얼굴 추론 주기 (프레임, 사이 프레임은 직전 결과 재사용)
+                 use_opencl=False,  # 추론 전처리(축소/색 변환)를 OpenCL(UMat)로 실행
+                 threaded=True):  # 캡처를 별도 스레드에서 실행 (추론과 프레임 디코딩 겹치기)
         
         # 카메라 설정
         self.cap = cv2.VideoCapture(cam_index, cv2.CAP_DSHOW)
+        # 압축 포맷(MJPG)은 해상도보다 먼저 지정해야 적용되는 드라이버가 있음
+        # (DSHOW 기본 YUY2는 720p에서 USB 대역폭 때문에 10fps 안팎으로 제한됨)
+        if cam_fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*cam_fourcc))
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, cam_w)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, cam_h)
+        self.cap.set(cv2.CAP_PROP_FPS, cam_fps)
+        # 드라이버 버퍼에 오래된 프레임이 쌓이지 않도록 (백엔드에 따라 무시될 수 있음)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, cam_buffer_size)
         self.frame_w = cam_w
         self.frame_h = cam_h
+        
+        # 프레임당 작은 OpenCV 연산이 대부분이라 병렬화 이득보다 MediaPipe와의 코어 경쟁이 더 큼
+        if cv_threads is not None:
+            cv2.setNumThreads(cv_threads)
+        
+        # 캡처 스레드 사용 여부
+        self.threaded = threaded
+        
+        # MediaPipe 입력 축소 비율
+        self.inference_scale = inference_scale
+        
+        # 추론 입력 버퍼 (프레임당 할당 방지, 해상도가 바뀌면 재생성)
+        self._small_buf = None
+        self._rgb_buf = None
+        
+        # 추론 전처리 OpenCL 가속 (지원 장치가 있을 때만)
+        self.use_opencl = bool(use_opencl and cv2.ocl.haveOpenCL())
+        cv2.ocl.setUseOpenCL(self.use_opencl)
+        
+        # 얼굴 추론 프레임 건너뛰기 (직전 결과 재사용)
+        self.face_interval = max(1, int(face_interval))
+        self._face_tick = 0
+        self._last_face_res = None
+        self._last_eye = None  # 직전 추론의 _get_eye_midpoint_with_z 결과
 
         # MediaPipe 초기화
         self.face_mesh = mp.solutions.face_mesh.FaceMesh(
@@ -103,12 +178,26 @@ class VirtualKeyboardTKL:
         # 양손 감지
         self.hands = mp.solutions.hands.Hands(
             static_image_mode=False,
-            max_num_hands=2,
+            max_num_hands=self.MAX_HANDS,
             min_detection_confidence=det_conf_hand,
             min_tracking_confidence=track_conf_hand
         )
         
-        self.drawer = mp.solutions.drawing_utils
+        # 손 그리기 스타일을 OpenCV 호출 인자 튜플로 한 번만 풀어두기
+        # (drawing_utils.draw_landmarks의 프레임당 스펙 조회/검사 비용 제거)
+        landmark_style = mp.solutions.drawing_styles.get_default_hand_landmarks_style()
+        connection_style = mp.solutions.drawing_styles.get_default_hand_connections_style()
+        # 연결선: (시작 idx, 끝 idx, 색, 두께), 그리는 순서는 HAND_CONNECTIONS 순회 순서 그대로
+        self._hand_edges = [
+            (a, b, connection_style[(a, b)].color, connection_style[(a, b)].thickness)
+            for a, b in mp.solutions.hands.HAND_CONNECTIONS
+        ]
+        # 관절 점: (색, 두께, 반지름, 흰 테두리 반지름), 랜드마크 idx 순
+        self._hand_dots = []
+        for idx in range(21):
+            spec = landmark_style[idx]
+            border_radius = max(spec.circle_radius + 1, int(spec.circle_radius * 1.2))
+            self._hand_dots.append((spec.color, spec.thickness, spec.circle_radius, border_radius))
         
         # 키보드 설정
         self.key_size = key_size
@@ -134,9 +223,23 @@ class VirtualKeyboardTKL:
         self.z_push_frames_required = 2  # 연속으로 몇 프레임 밀어야 하는지
         self.z_smoothing_alpha = 0.3  # Z축 EMA 평활화
         self.prev_eye_z = None
-        self.prev_finger_z = {}
-        self.prev_finger_z_raw = {}  # 델타 계산용
-        self.finger_push_count = {}  # 각 손가락의 연속 밀기 카운트        
+        # 손가락 슬롯별 Z EMA 상태 (슬롯 = hand_idx * 5 + finger_idx)
+        n_slots = self.MAX_HANDS * len(self.FINGER_TIPS_IDX)
+        self._finger_z = np.zeros(n_slots)
+        self._finger_z_valid = np.zeros(n_slots, dtype=bool)
+        # 프레임마다 다시 채워 쓰는 손가락 끝 좌표 / EMA 작업 버퍼
+        self._tips_buf = np.empty((n_slots, 3))
+        self._ema_buf = np.empty((2, n_slots))
+        self._tip_scale = None  # (w, h, w) 픽셀 변환 배율 (프레임 크기가 바뀌면 재생성)
+        self._finger_ids = [f"hand{hand_idx}_finger{finger_idx}"
+                            for hand_idx in range(self.MAX_HANDS)
+                            for finger_idx in range(len(self.FINGER_TIPS_IDX))]
+        # 손가락 슬롯별 밀어내기 감지 상태 (델타 계산용 직전 Z, 연속 밀기 카운트)
+        self._touch_prev_z = np.zeros(n_slots)
+        self._touch_valid = np.zeros(n_slots, dtype=bool)
+        self._push_count = np.zeros(n_slots, dtype=np.int64)
+        self._touch_buf = np.zeros(n_slots, dtype=bool)
+        self._z_delta_buf = np.zeros(n_slots)
         # 타이핑 상태
         self.typing_enabled = True
         self.show_keyboard = True
@@ -144,11 +247,15 @@ class VirtualKeyboardTKL:
         self.show_z_info = True  # Z축 정보 표시
         self.last_key_press = {}
         self.key_cooldown_ms = 500  # 쿨다운 시간 증가 (밀어내기 동작 간격 확보)
+        self.key_cooldown_ns = self.key_cooldown_ms * 1_000_000
         
         # 시각화
         self.hovered_keys = {}
         self.pressed_keys = {}
         
+        # HUD 줄별 스프라이트 캐시 [(텍스트, 스프라이트)] (텍스트가 바뀐 줄만 다시 렌더링)
+        self._hud_lines = []
+        
         # 손바닥 펼침 감지
         self.palm_open_threshold = 3
 
@@ -287,29 +394,180 @@ class VirtualKeyboardTKL:
             self.key_rects[key] = (edit_x + (i % 3) * (self.key_size + self.key_spacing), 
                                    edit_y, 
                                    self.key_size, self.key_size)
+        
+        # 키 라벨 위치/충돌 그리드/기본 키보드 스프라이트는 레이아웃이 바뀔 때만 계산
+        self._build_key_labels()
+        self._build_collision_grid()
+        self._render_keyboard_base()
+
+    def _build_collision_grid(self):
+        """
+        키 충돌 검사용 픽셀 → 키 인덱스 그리드 생성
+        
+        self._key_grid: 키보드 영역 픽셀마다 키 인덱스 (int16, 빈 공간은 -1)
+        self._key_grid_origin: 그리드 좌상단의 프레임 좌표 (x0, y0)
+        self._key_list: 키 인덱스 → 키
+        """
+        self._key_list = list(self.key_rects)
+        
+        x0 = min(x for x, y, w, h in self.key_rects.values())
+        y0 = min(y for x, y, w, h in self.key_rects.values())
+        x1 = max(x + w for x, y, w, h in self.key_rects.values())
+        y1 = max(y + h for x, y, w, h in self.key_rects.values())
+        
+        # 경계 포함 사각형, 겹치는 픽셀은 key_rects 순서상 앞선 키가 차지하도록 역순으로 채움
+        grid = np.full((y1 - y0 + 1, x1 - x0 + 1), -1, dtype=np.int16)
+        for idx in range(len(self._key_list) - 1, -1, -1):
+            x, y, w, h = self.key_rects[self._key_list[idx]]
+            grid[y - y0:y + h - y0 + 1, x - x0:x + w - x0 + 1] = idx
+        
+        self._key_grid = grid
+        self._key_grid_origin = (x0, y0)
+
+    def _build_key_labels(self):
+        """키별 기본 색과 (텍스트, 글자 크기, 기준점) 계산"""
+        self.key_base_colors = {}
+        self.key_labels = {}
+        
+        for key_char, (x, y, w, h) in self.key_rects.items():
+            # 기본 키 색상 (특수 키 구분)
+            if key_char in ['SHIFT', 'CTRL', 'ALT', 'WIN', 'CAPS', 'TAB', 'ENTER', 'BKSP']:
+                self.key_base_colors[key_char] = self.KEY_COLOR_SPECIAL
+            else:
+                self.key_base_colors[key_char] = self.KEY_COLOR_NORMAL
+            
+            # 키 텍스트
+            if key_char in ['SPACE', 'ENTER', 'SHIFT', 'CTRL', 'BKSP', 'TAB', 'CAPS']:
+                font_scale = 0.35
+            elif key_char.startswith('F') and len(key_char) <= 3:
+                font_scale = 0.4
+            else:
+                font_scale = 0.5
+            
+            # 텍스트 표시
+            if key_char == 'BKSP':
+                text = '←'
+            elif key_char == 'UP':
+                text = '↑'
+            elif key_char == 'DOWN':
+                text = '↓'
+            elif key_char == 'LEFT':
+                text = '←'
+            elif key_char == 'RIGHT':
+                text = '→'
+            else:
+                text = key_char
+            
+            text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 1)[0]
+            text_x = x + (w - text_size[0]) // 2
+            text_y = y + (h + text_size[1]) // 2
+            self.key_labels[key_char] = (text, font_scale, (text_x, text_y))
+
+    def _draw_key(self, canvas, key_char, color, origin=(0, 0)):
+        """
+        키 하나 그리기 (박스 + 테두리 + 텍스트)
+        
+        Args:
+            canvas: 그릴 이미지
+            key_char: 키
+            color: 키 배경 색
+            origin: canvas 좌상단의 프레임 좌표 (x, y)
+        """
+        ox, oy = origin
+        x, y, w, h = self.key_rects[key_char]
+        x -= ox
+        y -= oy
+        
+        # 키 박스
+        cv2.rectangle(canvas, (x, y), (x + w, y + h), color, -1)
+        cv2.rectangle(canvas, (x, y), (x + w, y + h), (150, 150, 150), 1)
+        
+        # 키 텍스트 (위치는 _build_key_labels에서 미리 계산)
+        text, font_scale, (text_x, text_y) = self.key_labels[key_char]
+        cv2.putText(canvas, text, (text_x - ox, text_y - oy),
+                   cv2.FONT_HERSHEY_SIMPLEX, font_scale, self.TEXT_COLOR, 1)
+
+    def _render_keyboard_base(self):
+        """
+        모든 키를 기본 색으로 한 번 그려 스프라이트로 캐시
+        
+        self._kb_base = (x0, y0, sprite, mask): 키들을 감싸는 영역의 프레임 좌표,
+        BGR 이미지, 키 사각형 마스크 (uint8, 키 사이 빈 공간은 0)
+        self._kb_overflow_keys: 라벨이 키 사각형 밖으로 나가는 키 (key_rects 순서)
+        self._kb_redraw_groups: 키 → 다시 그릴 때 함께 그려야 하는 키 (key_rects 순서)
+        """
+        x0 = min(x for x, y, w, h in self.key_rects.values())
+        y0 = min(y for x, y, w, h in self.key_rects.values())
+        x1 = max(x + w for x, y, w, h in self.key_rects.values())
+        y1 = max(y + h for x, y, w, h in self.key_rects.values())
+        
+        sprite = np.zeros((y1 - y0 + 1, x1 - x0 + 1, 3), dtype=np.uint8)
+        mask = np.zeros((y1 - y0 + 1, x1 - x0 + 1), dtype=np.uint8)
+        for key_char, (x, y, w, h) in self.key_rects.items():
+            self._draw_key(sprite, key_char, self.key_base_colors[key_char], (x0, y0))
+            mask[y - y0:y + h - y0 + 1, x - x0:x + w - x0 + 1] = 1
+        
+        # 키별 그리기 영역 (키 사각형 + 라벨, 안티에일리어싱 여유 2px)
+        boxes = {}
+        self._kb_overflow_keys = []
+        for key_char, (x, y, w, h) in self.key_rects.items():
+            text, font_scale, (text_x, text_y) = self.key_labels[key_char]
+            (text_w, text_h), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 1)
+            lx0, ly0 = text_x - 2, text_y - text_h - 2
+            lx1, ly1 = text_x + text_w + 2, text_y + baseline + 2
+            
+            if lx0 < x or ly0 < y or lx1 > x + w or ly1 > y + h:
+                self._kb_overflow_keys.append(key_char)
+            boxes[key_char] = (min(x, lx0), min(y, ly0), max(x + w, lx1), max(y + h, ly1))
+        
+        # 그리기 영역이 다른 키 사각형에 걸치는 키끼리 묶기
+        # (묶음 전체를 원래 순서대로 다시 그려야 겹친 글자까지 처음과 같아짐)
+        neighbors = {key_char: set() for key_char in self.key_rects}
+        for a, (bx0, by0, bx1, by1) in boxes.items():
+            for b, (x, y, w, h) in self.key_rects.items():
+                if a != b and bx0 <= x + w and x <= bx1 and by0 <= y + h and y <= by1:
+                    neighbors[a].add(b)
+                    neighbors[b].add(a)
+        
+        order = {key_char: i for i, key_char in enumerate(self.key_rects)}
+        self._kb_redraw_groups = {}
+        for key_char in self.key_rects:
+            if key_char in self._kb_redraw_groups:
+                continue
+            group = {key_char}
+            stack = [key_char]
+            while stack:
+                for other in neighbors[stack.pop()]:
+                    if other not in group:
+                        group.add(other)
+                        stack.append(other)
+            group = sorted(group, key=order.__getitem__)
+            for other in group:
+                self._kb_redraw_groups[other] = group
+        
+        self._kb_base = (x0, y0, sprite, mask)
+        self._kb_order = order
+        self._kb_hovered = set()  # 스프라이트에 반영된 호버 키
+        self._kb_pressed = set()  # 스프라이트에 반영된 눌림 키
 
     def _get_eye_midpoint_with_z(self, face, w, h):
-        """양안 중점 계산 (Z 좌표 포함)"""
+        """양안 중점 계산 (Z 좌표 포함, 랜드마크마다 protobuf 접근 1회 + 스칼라 연산)"""
         lm = face.landmark
         
         # 오른쪽 눈
-        r_outer = np.array([lm[self.R_EYE_OUTER].x * w, lm[self.R_EYE_OUTER].y * h])
-        r_outer_z = lm[self.R_EYE_OUTER].z * w
-        r_inner = np.array([lm[self.R_EYE_INNER].x * w, lm[self.R_EYE_INNER].y * h])
-        r_inner_z = lm[self.R_EYE_INNER].z * w
-        r_center = 0.5 * (r_outer + r_inner)
-        r_center_z = 0.5 * (r_outer_z + r_inner_z)
+        r_outer = lm[self.R_EYE_OUTER]
+        r_inner = lm[self.R_EYE_INNER]
+        r_center = (0.5 * (r_outer.x + r_inner.x) * w, 0.5 * (r_outer.y + r_inner.y) * h)
+        r_center_z = 0.5 * (r_outer.z + r_inner.z) * w
         
         # 왼쪽 눈
-        l_outer = np.array([lm[self.L_EYE_OUTER].x * w, lm[self.L_EYE_OUTER].y * h])
-        l_outer_z = lm[self.L_EYE_OUTER].z * w
-        l_inner = np.array([lm[self.L_EYE_INNER].x * w, lm[self.L_EYE_INNER].y * h])
-        l_inner_z = lm[self.L_EYE_INNER].z * w
-        l_center = 0.5 * (l_outer + l_inner)
-        l_center_z = 0.5 * (l_outer_z + l_inner_z)
+        l_outer = lm[self.L_EYE_OUTER]
+        l_inner = lm[self.L_EYE_INNER]
+        l_center = (0.5 * (l_outer.x + l_inner.x) * w, 0.5 * (l_outer.y + l_inner.y) * h)
+        l_center_z = 0.5 * (l_outer.z + l_inner.z) * w
         
         # 양안 중점
-        eye_midpoint = 0.5 * (r_center + l_center)
+        eye_midpoint = (0.5 * (r_center[0] + l_center[0]), 0.5 * (r_center[1] + l_center[1]))
         eye_midpoint_z = 0.5 * (r_center_z + l_center_z)
         
         # Z축 평활화 (EMA)
@@ -322,39 +580,85 @@ class VirtualKeyboardTKL:
         
         return eye_midpoint, r_center, l_center, eye_midpoint_z
 
+    def _draw_hand(self, frame, hand, w, h):
+        """
+        손 랜드마크/연결선 그리기 (drawing_utils.draw_landmarks와 같은 결과)
+        
+        랜드마크를 픽셀 좌표로 한 번만 변환한 뒤 cv2.line/cv2.circle을 직접 호출
+        정규화 좌표가 [0, 1] 밖인 점과 그 점에 이어진 선은 그리지 않음
+        
+        Args:
+            frame: 그릴 BGR 프레임 (제자리 수정)
+            hand: MediaPipe 손 랜드마크
+            w, h: 프레임 크기
+        """
+        max_x = w - 1
+        max_y = h - 1
+        pts = []
+        for lm in hand.landmark:
+            x = lm.x
+            y = lm.y
+            if (x >= 0.0 and y >= 0.0
+                    and (x <= 1.0 or math.isclose(1, x))
+                    and (y <= 1.0 or math.isclose(1, y))):
+                pts.append((min(math.floor(x * w), max_x), min(math.floor(y * h), max_y)))
+            else:
+                pts.append(None)
+        
+        for a, b, color, thickness in self._hand_edges:
+            pa = pts[a]
+            pb = pts[b]
+            if pa is not None and pb is not None:
+                cv2.line(frame, pa, pb, color, thickness)
+        
+        for pt, (color, thickness, radius, border_radius) in zip(pts, self._hand_dots):
+            if pt is not None:
+                cv2.circle(frame, pt, border_radius, (224, 224, 224), thickness)
+                cv2.circle(frame, pt, radius, color, thickness)
+    
     def _get_all_fingertips_with_z(self, hand_landmarks_list, w, h):
-        """양손의 모든 손가락 끝 좌표 추출 (Z 좌표 포함)"""
-        fingertips = []
+        """
+        양손의 모든 손가락 끝 좌표 추출 (Z 좌표 포함)
         
-        for hand_idx, hand in enumerate(hand_landmarks_list):
-            lm = hand.landmark
-            
-            for finger_idx, tip_landmark in enumerate(self.FINGER_TIPS):
-                tip_x = lm[tip_landmark].x * w
-                tip_y = lm[tip_landmark].y * h
-                tip_z_raw = lm[tip_landmark].z * w
-                
-                finger_id = f"hand{hand_idx}_finger{finger_idx}"
-                
-                # Z축 평활화
-                if finger_id not in self.prev_finger_z:
-                    self.prev_finger_z[finger_id] = tip_z_raw
-                else:
-                    tip_z_raw = (self.z_smoothing_alpha * tip_z_raw + 
-                                (1 - self.z_smoothing_alpha) * self.prev_finger_z[finger_id])
-                    self.prev_finger_z[finger_id] = tip_z_raw
-                
-                fingertips.append({
-                    'id': finger_id,
-                    'hand_idx': hand_idx,
-                    'finger_idx': finger_idx,
-                    'finger_name': self.FINGER_NAMES[finger_idx],
-                    'pos': np.array([tip_x, tip_y]),
-                    'z': tip_z_raw,
-                    'color': self.FINGER_COLORS[finger_idx]
-                })
-        
-        return fingertips
+        손가락 끝을 (n, 3) 배열 하나로 모은 뒤 슬롯별 Z EMA를 한 번에 갱신
+        
+        Args:
+            hand_landmarks_list: 손 랜드마크 리스트
+            w, h: 프레임 크기
+        
+        Returns:
+            (n, 3) 배열 [x, y, 평활화된 z] (픽셀 단위, 다음 호출 때 덮어쓰는 작업 버퍼의 view).
+            행 i는 손가락 슬롯 i로, id는 self._finger_ids[i],
+            이름/색상은 FINGER_NAMES[i % 5] / FINGER_COLORS[i % 5]
+        """
+        tip_ids = self.FINGER_TIPS_IDX
+        hands = hand_landmarks_list[:self.MAX_HANDS]
+        n = len(hands) * len(tip_ids)
+        
+        if self._tip_scale is None or self._tip_scale[0] != w or self._tip_scale[1] != h:
+            self._tip_scale = np.array((w, h, w), dtype=np.float64)
+        
+        tips = self._tips_buf[:n]
+        tips[:] = [
+            (tip.x, tip.y, tip.z)
+            for lm in [hand.landmark for hand in hands]
+            for tip in [lm[t] for t in tip_ids]
+        ]
+        tips *= self._tip_scale
+        
+        # Z축 평활화 (처음 보는 슬롯은 측정값 그대로 시작, 임시 배열 없이 작업 버퍼에 계산)
+        tip_z = tips[:, 2]
+        prev_z = self._finger_z[:n]
+        alpha = self.z_smoothing_alpha
+        ema, decayed = self._ema_buf[:, :n]
+        np.multiply(tip_z, alpha, out=ema)
+        np.multiply(prev_z, 1 - alpha, out=decayed)
+        np.add(ema, decayed, out=ema)
+        np.copyto(tip_z, ema, where=self._finger_z_valid[:n])
+        prev_z[:] = tip_z
+        self._finger_z_valid[:n] = True
+        
+        return tips
 
     def _check_key_collision(self, finger_pos, key_char):
         """손가락과 키 충돌 감지"""
@@ -366,50 +670,68 @@ class VirtualKeyboardTKL:
         
         return (kx <= fx <= kx + kw) and (ky <= fy <= ky + kh)
 
-    def _detect_z_touch(self, eye_z, finger_z, finger_id):
-        """Z축 좌표 변화로 밀어내기 동작 감지
+    def _find_key(self, finger_pos):
+        """
+        손가락 위치의 키 찾기 (그리드 조회, 경계 포함)
         
-        손가락을 카메라 방향으로 연속적으로 밀어낼 때만 터치로 인식
+        Args:
+            finger_pos: (x, y) 픽셀 좌표
+        
+        Returns:
+            키 문자 또는 None
         """
-        z_diff = abs(eye_z - finger_z)
-        
-        # 이전 Z 값 가져오기
-        if finger_id not in self.prev_finger_z_raw:
-            self.prev_finger_z_raw[finger_id] = finger_z
-            self.finger_push_count[finger_id] = 0
-            return False, z_diff, 0.0
-        
-        # Z 변화량 계산 (양수 = 카메라 방향으로 이동)
-        z_delta = finger_z - self.prev_finger_z_raw[finger_id]
-        self.prev_finger_z_raw[finger_id] = finger_z
-        
-        # 연속 밀기 카운트 업데이트
-        if z_delta > self.z_push_threshold:
-            # 임계값 이상 밀고 있음
-            self.finger_push_count[finger_id] = self.finger_push_count.get(finger_id, 0) + 1
-        else:
-            # 밀기 중단 또는 반대 방향
-            self.finger_push_count[finger_id] = 0
+        fx, fy = finger_pos
+        x0, y0 = self._key_grid_origin
+        gx = fx - x0
+        gy = fy - y0
+        grid_h, grid_w = self._key_grid.shape
+        if not (0 <= gx < grid_w and 0 <= gy < grid_h):
+            return None
+        
+        idx = self._key_grid.item(int(gy), int(gx))
+        if idx < 0:
+            return None
+        
+        key_char = self._key_list[idx]
+        if self._check_key_collision(finger_pos, key_char):
+            return key_char
+        
+        # 키 오른쪽/아래 경계 바로 바깥 (1px 미만) 소수 좌표는 경계 픽셀을 공유하므로 전체 검사
+        for key_char in self.key_rects:
+            if self._check_key_collision(finger_pos, key_char):
+                return key_char
+        return None
+
+    def _detect_z_touch(self, finger_z):
+        """
+        Z축 좌표 변화로 밀어내기 동작 감지 (손가락 슬롯 전체를 한 번에)
         
-        # 터치 판정: 연속적으로 충분히 밀었는지 확인
-        is_touch = self.finger_push_count[finger_id] >= self.z_push_frames_required
+        손가락을 카메라 방향으로 연속적으로 밀어낼 때만 터치로 인식
         
-        # 터치 감지 후 카운트 리셋 (중복 입력 방지)
-        if is_touch:
-            self.finger_push_count[finger_id] = 0
+        Args:
+            finger_z: 슬롯 0..n-1의 평활화된 손가락 Z 배열
         
-        return is_touch, z_diff, z_delta
+        Returns:
+            (touch, z_delta): 슬롯별 터치 판정 (bool 배열), Z 변화량 (양수 = 카메라 방향).
+            연속 밀기 카운트는 self._push_count[:n] (터치 판정 시 0으로 리셋)
+        """
+        n = finger_z.shape[0]
+        touch = self._touch_buf[:n]
+        z_delta = self._z_delta_buf[:n]
+        z_touch_step(finger_z, self._touch_prev_z[:n], self._touch_valid[:n], self._push_count[:n],
+                     self.z_push_threshold, self.z_push_frames_required, touch, z_delta)
+        return touch, z_delta
 
     def _can_press_key(self, key_char):
         """키 반복 입력 방지"""
-        now_ms = int(time.time() * 1000)
+        now_ns = time.perf_counter_ns()
         
         if key_char not in self.last_key_press:
-            self.last_key_press[key_char] = now_ms
+            self.last_key_press[key_char] = now_ns
             return True
         
-        if now_ms - self.last_key_press[key_char] > self.key_cooldown_ms:
-            self.last_key_press[key_char] = now_ms
+        if now_ns - self.last_key_press[key_char] > self.key_cooldown_ns:
+            self.last_key_press[key_char] = now_ns
             return True
         
         return False
@@ -475,70 +797,95 @@ class VirtualKeyboardTKL:
         if not self.show_keyboard:
             return frame
         
-        # 반투명 배경
-        overlay = frame.copy()
-        cv2.rectangle(overlay, 
-                     (0, 0), 
-                     (self.frame_w, self.frame_h), 
-                     (20, 20, 20), 
-                     -1)
-        cv2.addWeighted(overlay, 0.4, frame, 0.6, 0, frame)
+        x0, y0, sprite, mask = self._kb_base
+        sh, sw = mask.shape
+        
+        # 반투명 배경 (키보드 영역만 20 × 0.4 + frame × 0.6, 프레임 복사 없이 제자리 변환)
+        bg = frame[max(y0, 0):max(y0 + sh, 0), max(x0, 0):max(x0 + sw, 0)]
+        if bg.size:
+            cv2.addWeighted(bg, 0.6, bg, 0.0, 20 * 0.4, bg)
         
         now = time.time()
         
-        # 각 키 그리기
-        for key_char, (x, y, w, h) in self.key_rects.items():
-            # 키 색상 결정
-            if key_char in self.pressed_keys and (now - self.pressed_keys[key_char] < 0.2):
-                color = self.KEY_COLOR_PRESSED
-            elif key_char in self.hovered_keys.values():
-                color = self.KEY_COLOR_HOVER
-            elif key_char in ['SHIFT', 'CTRL', 'ALT', 'WIN', 'CAPS', 'TAB', 'ENTER', 'BKSP']:
-                color = self.KEY_COLOR_SPECIAL
-            else:
-                color = self.KEY_COLOR_NORMAL
-            
-            # 키 박스
-            cv2.rectangle(frame, (x, y), (x + w, y + h), color, -1)
-            cv2.rectangle(frame, (x, y), (x + w, y + h), (150, 150, 150), 1)
-            
-            # 키 텍스트
-            if key_char in ['SPACE', 'ENTER', 'SHIFT', 'CTRL', 'BKSP', 'TAB', 'CAPS']:
-                font_scale = 0.35
-            elif key_char.startswith('F') and len(key_char) <= 3:
-                font_scale = 0.4
-            else:
-                font_scale = 0.5
-            
-            # 텍스트 표시
-            if key_char == 'BKSP':
-                text = '←'
-            elif key_char == 'UP':
-                text = '↑'
-            elif key_char == 'DOWN':
-                text = '↓'
-            elif key_char == 'LEFT':
-                text = '←'
-            elif key_char == 'RIGHT':
-                text = '→'
-            else:
-                text = key_char
-            
-            text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 1)[0]
-            text_x = x + (w - text_size[0]) // 2
-            text_y = y + (h + text_size[1]) // 2
-            cv2.putText(frame, text, (text_x, text_y), 
-                       cv2.FONT_HERSHEY_SIMPLEX, font_scale, self.TEXT_COLOR, 1)
+        # 눌림 표시(0.2초)가 끝난 키는 버리고, 호버 키는 프레임당 한 번만 집합으로 모으기
+        if self.pressed_keys:
+            self.pressed_keys = {k: t for k, t in self.pressed_keys.items() if now - t < 0.2}
+        pressed = self.pressed_keys.keys()
+        hovered = set(self.hovered_keys.values())
+        
+        # 상태가 바뀐 키(와 겹쳐 그려지는 이웃 키)만 스프라이트에 다시 그리기
+        dirty = (hovered ^ self._kb_hovered) | (pressed ^ self._kb_pressed)
+        if dirty:
+            redraw = set()
+            for key_char in dirty:
+                redraw.update(self._kb_redraw_groups[key_char])
+            for key_char in sorted(redraw, key=self._kb_order.__getitem__):
+                self._draw_key(sprite, key_char, self._key_color(key_char, pressed, hovered), (x0, y0))
+            self._kb_hovered = hovered
+            self._kb_pressed = set(pressed)
+        
+        frame_h, frame_w = frame.shape[:2]
+        if x0 >= 0 and y0 >= 0 and y0 + sh <= frame_h and x0 + sw <= frame_w:
+            # 키 밖으로 나간 라벨 글자는 배경 위에 직접 그리고, 키 사각형은 스프라이트로 덮기
+            for key_char in self._kb_overflow_keys:
+                text, font_scale, text_org = self.key_labels[key_char]
+                cv2.putText(frame, text, text_org,
+                           cv2.FONT_HERSHEY_SIMPLEX, font_scale, self.TEXT_COLOR, 1)
+            cv2.copyTo(sprite, mask, frame[y0:y0 + sh, x0:x0 + sw])
+        else:
+            # 키보드가 프레임 밖으로 나가면 모든 키를 직접 그리기
+            for key_char in self.key_rects:
+                self._draw_key(frame, key_char, self._key_color(key_char, pressed, hovered))
         
         return frame
 
+    def _key_color(self, key_char, pressed, hovered):
+        """키 상태별 배경 색 (눌림 > 호버 > 기본)"""
+        if key_char in pressed:
+            return self.KEY_COLOR_PRESSED
+        if key_char in hovered:
+            return self.KEY_COLOR_HOVER
+        return self.key_base_colors[key_char]
+
     def process_frame(self, frame):
         """프레임 처리"""
         h, w = frame.shape[:2]
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         
-        face_res = self.face_mesh.process(rgb)
-        hand_res = self.hands.process(rgb)
+        # 추론용 축소 (랜드마크는 정규화 좌표이므로 픽셀 변환은 원본 w, h 그대로 사용)
+        scale = self.inference_scale
+        size = (max(1, int(w * scale)), max(1, int(h * scale)))
+        
+        if self.use_opencl:
+            # OpenCL (T-API): 축소 + 색 변환을 GPU에서 수행하고 결과만 호스트로 복사
+            src = cv2.UMat(frame)
+            if scale != 1.0:
+                src = cv2.resize(src, size, interpolation=cv2.INTER_AREA)
+            rgb = cv2.cvtColor(src, cv2.COLOR_BGR2RGB).get()
+        else:
+            small = frame
+            if scale != 1.0:
+                if self._small_buf is None or self._small_buf.shape[1::-1] != size:
+                    self._small_buf = np.empty((size[1], size[0], 3), dtype=frame.dtype)
+                small = cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+            
+            if self._rgb_buf is None or self._rgb_buf.shape != small.shape:
+                self._rgb_buf = np.empty_like(small)
+            rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        
+        # 읽기 전용으로 표시하면 MediaPipe가 내부 복사 없이 참조로 전달
+        # (다음 프레임에서 버퍼에 다시 쓸 수 있도록 추론 후 복구)
+        rgb.flags.writeable = False
+        # 얼굴은 거의 움직이지 않으므로 N 프레임마다, 놓쳤으면 매 프레임 추론
+        face_res = self._last_face_res
+        run_face = (face_res is None or not face_res.multi_face_landmarks
+                    or self._face_tick % self.face_interval == 0)
+        self._face_tick += 1
+        try:
+            if run_face:
+                face_res = self._last_face_res = self.face_mesh.process(rgb)
+            hand_res = self.hands.process(rgb)
+        finally:
+            rgb.flags.writeable = True
         
         hud = []
         eye_midpoint = None
@@ -546,16 +893,20 @@ class VirtualKeyboardTKL:
         
         # 얼굴 감지 및 양안 중점 (Z 포함)
         if face_res.multi_face_landmarks:
-            face = face_res.multi_face_landmarks[0]
-            eye_midpoint, r_center, l_center, eye_z = self._get_eye_midpoint_with_z(face, w, h)
+            # 사이 프레임은 같은 랜드마크로 Z EMA를 다시 갱신하지 않도록 직전 계산 결과 재사용
+            if run_face:
+                face = face_res.multi_face_landmarks[0]
+                self._last_eye = self._get_eye_midpoint_with_z(face, w, h)
+            eye_midpoint, r_center, l_center, eye_z = self._last_eye
             
             # 눈 중심점 표시
             cv2.circle(frame, (int(r_center[0]), int(r_center[1])), 3, (0, 255, 255), -1)
             cv2.circle(frame, (int(l_center[0]), int(l_center[1])), 3, (0, 255, 255), -1)
             
-            # 양안 중점 강조
-            cv2.circle(frame, (int(eye_midpoint[0]), int(eye_midpoint[1])), 8, (0, 200, 255), -1)
-            cv2.circle(frame, (int(eye_midpoint[0]), int(eye_midpoint[1])), 12, (0, 200, 255), 2)
+            # 양안 중점 강조 (픽셀 좌표는 한 번만 변환해 손가락 선에도 사용)
+            eye_px = (int(eye_midpoint[0]), int(eye_midpoint[1]))
+            cv2.circle(frame, eye_px, 8, (0, 200, 255), -1)
+            cv2.circle(frame, eye_px, 12, (0, 200, 255), 2)
         
         # 손 감지 및 모든 손가락 추적
         self.hovered_keys = {}
@@ -564,58 +915,64 @@ class VirtualKeyboardTKL:
         if hand_res.multi_hand_landmarks and eye_z is not None:
             # 손 랜드마크 그리기
             for hand in hand_res.multi_hand_landmarks:
-                self.drawer.draw_landmarks(
-                    frame, 
-                    hand, 
-                    mp.solutions.hands.HAND_CONNECTIONS,
-                    mp.solutions.drawing_styles.get_default_hand_landmarks_style(),
-                    mp.solutions.drawing_styles.get_default_hand_connections_style()
-                )
+                self._draw_hand(frame, hand, w, h)
             
             # 10개 손가락 TIP 추출 (Z 포함)
             fingertips = self._get_all_fingertips_with_z(hand_res.multi_hand_landmarks, w, h)
             
-            for finger_data in fingertips:
-                pos = finger_data['pos']
-                color = finger_data['color']
-                finger_id = finger_data['id']
-                finger_name = finger_data['finger_name']
-                finger_z = finger_data['z']
+            # Z축 터치 감지 (모든 손가락 슬롯 한 번에)
+            touches, z_deltas = self._detect_z_touch(fingertips[:, 2])
+            touches = touches.tolist()
+            z_deltas = z_deltas.tolist()
+            push_counts = self._push_count[:len(touches)].tolist()
+            
+            # 키보드를 숨기면 키 충돌 검사/입력도 건너뛰기 (Z 터치 상태는 계속 갱신)
+            find_keys = self.show_keyboard
+            
+            # 손가락 루프 동안 바뀌지 않는 속성은 한 번만 읽기
+            n_fingers = len(self.FINGER_TIPS_IDX)
+            finger_colors = self.FINGER_COLORS
+            finger_names = self.FINGER_NAMES
+            finger_ids = self._finger_ids
+            hovered_keys = self.hovered_keys
+            draw_lines = eye_midpoint is not None and self.show_lines
+            show_z_info = self.show_z_info
+            frames_required = self.z_push_frames_required
+            
+            for slot, (tip_x, tip_y, _) in enumerate(fingertips.tolist()):
+                pos = (tip_x, tip_y)
+                tip_px = (int(tip_x), int(tip_y))
+                color = finger_colors[slot % n_fingers]
+                finger_id = finger_ids[slot]
+                finger_name = finger_names[slot % n_fingers]
                 
                 # 손가락 끝 표시
-                cv2.circle(frame, (int(pos[0]), int(pos[1])), 8, color, -1)
-                cv2.circle(frame, (int(pos[0]), int(pos[1])), 10, color, 2)
+                cv2.circle(frame, tip_px, 8, color, -1)
+                cv2.circle(frame, tip_px, 10, color, 2)
                 
                 # 양안 중점에서 손가락까지 선
-                if eye_midpoint is not None and self.show_lines:
-                    cv2.line(frame, 
-                            (int(eye_midpoint[0]), int(eye_midpoint[1])),
-                            (int(pos[0]), int(pos[1])),
-                            color, 2, cv2.LINE_AA)
+                if draw_lines:
+                    cv2.line(frame, eye_px, tip_px, color, 2, cv2.LINE_AA)
                 
-                # Z축 터치 감지
-                is_touch, z_diff, z_delta = self._detect_z_touch(eye_z, finger_z, finger_id)
+                is_touch = touches[slot]
                 
                 # Z축 정보 표시 (손가락 옆)
-                if self.show_z_info:
-                    push_count = self.finger_push_count.get(finger_id, 0)
-                    z_text = f"Δ:{z_delta:.3f} [{push_count}/{self.z_push_frames_required}]"
+                if show_z_info:
+                    z_text = f"Δ:{z_deltas[slot]:.3f} [{push_counts[slot]}/{frames_required}]"
                     z_color = (0, 255, 0) if is_touch else (255, 255, 255)
                     cv2.putText(frame, z_text, 
-                               (int(pos[0]) + 15, int(pos[1])), 
+                               (tip_px[0] + 15, tip_px[1]), 
                                cv2.FONT_HERSHEY_SIMPLEX, 0.35, z_color, 1)
                 
                 # 키 충돌 감지
-                for key_char in self.key_rects.keys():
-                    if self._check_key_collision(pos, key_char):
-                        self.hovered_keys[finger_id] = key_char
-                        
-                        # 터치 시 키 입력
-                        if is_touch and self._can_press_key(key_char):
-                            self._type_key(key_char, finger_name)
-                            touch_events.append(f"{finger_name}→{key_char}")
-                        
-                        break
+                key_char = self._find_key(pos) if find_keys else None
+                if key_char is not None:
+                    hovered_keys[finger_id] = key_char
+                    
+                    # 터치 시 키 입력
+                    if is_touch and self._can_press_key(key_char):
+                        self._type_key(key_char, finger_name)
+                        touch_events.append(f"{finger_name}→{key_char}")
         
         # 키보드 그리기
         frame = self._draw_keyboard(frame)
@@ -627,8 +984,10 @@ class VirtualKeyboardTKL:
         hud.append(f"Face: {'YES' if eye_z is not None else 'NO'} | Eye Z: {eye_z_text}")
         
         if hand_res.multi_hand_landmarks:
-            fingertips = self._get_all_fingertips_with_z(hand_res.multi_hand_landmarks, w, h)
-            hud.append(f"Hands: {len(hand_res.multi_hand_landmarks)}/2 | Fingers: {len(fingertips)}/10")
+            # 손가락 수는 손 개수로 계산 (추출기를 다시 호출하면 Z EMA가 한 프레임에 두 번 갱신됨)
+            n_hands = len(hand_res.multi_hand_landmarks)
+            n_tips = min(n_hands, self.MAX_HANDS) * len(self.FINGER_TIPS_IDX)
+            hud.append(f"Hands: {n_hands}/2 | Fingers: {n_tips}/10")
         else:
             hud.append(f"Hands: 0/2 | Fingers: 0/10")
         
@@ -646,6 +1005,160 @@ class VirtualKeyboardTKL:
         
         return frame, hud
 
+    def read_latest(self, max_drain=2, stale_grab_ms=5.0):
+        """
+        버퍼에 쌓인 오래된 프레임은 디코딩 없이 grab()으로 버리고 최신 프레임만 디코딩
+        
+        grab()이 즉시 반환되면 버퍼에 있던 프레임이므로 한 번 더 grab()
+        (BUFFERSIZE가 무시되는 백엔드 대비, 최대 max_drain회)
+        
+        Args:
+            max_drain: 추가로 버릴 최대 프레임 수
+            stale_grab_ms: 이 시간보다 빨리 반환된 grab()은 버퍼 프레임으로 간주
+        
+        Returns:
+            (ok, frame)
+        """
+        for _ in range(max_drain + 1):
+            t0 = time.perf_counter()
+            if not self.cap.grab():
+                return False, None
+            if (time.perf_counter() - t0) * 1000.0 >= stale_grab_ms:
+                break  # 새 프레임을 기다렸음 → 최신
+        return self.cap.retrieve()
+
+    def render(self, frame):
+        """
+        프레임 처리 + HUD + 화면 표시 + 키 입력 처리
+        
+        Args:
+            frame: 좌우 반전된 웹캠 프레임 (BGR)
+        
+        Returns:
+            bool: 계속 실행 여부
+        """
+        out, hud = self.process_frame(frame)
+        
+        # HUD 텍스트 표시 (줄 내용이 같으면 캐시된 스프라이트만 복사)
+        cache = self._hud_lines
+        y = 30
+        for i, text in enumerate(hud):
+            if i == len(cache):
+                cache.append((text, self._render_hud_line(text)))
+            elif cache[i][0] != text:
+                cache[i] = (text, self._render_hud_line(text))
+            sprite = cache[i][1]
+            
+            # 배경 막대 (5, y - 20) ~ (15 + text_w, y + 5), 프레임 밖은 잘라서 복사
+            roi = out[y - 20:y - 20 + sprite.shape[0], 5:5 + sprite.shape[1]]
+            roi[:] = sprite[:roi.shape[0], :roi.shape[1]]
+            y += 25
+        
+        cv2.imshow("Virtual TKL Keyboard - Z-Axis Touch", out)
+        
+        # 키 입력
+        return self.handle_key(cv2.waitKey(1) & 0xFF)
+
+    def _render_hud_line(self, text):
+        """
+        HUD 한 줄을 검정 배경 막대와 함께 스프라이트로 렌더링
+        
+        글자는 항상 배경 막대 안에 그려지므로 막대 영역만 복사하면 직접 그린 것과 동일
+        
+        Args:
+            text: HUD 텍스트
+        
+        Returns:
+            배경 막대 영역 BGR 이미지 (좌상단이 프레임의 (5, y - 20), 기준점 y)
+        """
+        (text_w, text_h), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 2)
+        sprite = np.zeros((26, text_w + 11, 3), dtype=np.uint8)
+        
+        if "ON" in text or "YES" in text or "TOUCH:" in text:
+            color = (0, 255, 0)
+        elif "TKL" in text:
+            color = (0, 255, 255)
+        else:
+            color = (200, 200, 200)
+        
+        cv2.putText(sprite, text, (5, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
+        return sprite
+
+    def handle_key(self, key):
+        """
+        키 입력 처리
+        
+        Args:
+            key: cv2.waitKey 결과 (하위 8비트)
+        
+        Returns:
+            bool: 계속 실행 여부
+        """
+        if key == ord('q'):
+            return False
+        elif key == ord('t'):
+            self.typing_enabled = not self.typing_enabled
+            print(f"Typing: {'ON' if self.typing_enabled else 'OFF'}")
+        elif key == ord('k'):
+            self.show_keyboard = not self.show_keyboard
+            print(f"Keyboard display: {'ON' if self.show_keyboard else 'OFF'}")
+        elif key == ord('l'):
+            self.show_lines = not self.show_lines
+            print(f"Eye→Finger lines: {'ON' if self.show_lines else 'OFF'}")
+        elif key == ord('z'):
+            self.show_z_info = not self.show_z_info
+            print(f"Z-axis info: {'ON' if self.show_z_info else 'OFF'}")
+        elif key == ord('+') or key == ord('='):
+            self.z_push_threshold += 0.01
+            print(f"Z push threshold: {self.z_push_threshold:.3f}")
+        elif key == ord('-') or key == ord('_'):
+            self.z_push_threshold = max(0.01, self.z_push_threshold - 0.01)
+            print(f"Z push threshold: {self.z_push_threshold:.3f}")
+        return True
+
+    def _run_serial(self):
+        """단일 스레드 루프 (캡처 → 추론 → 렌더링 순차 실행)"""
+        while True:
+            ok, frame = self.read_latest()
+            if not ok:
+                break
+            
+            # 좌우 반전 (제자리 연산으로 프레임 크기 할당 방지)
+            # 키보드/HUD 글자를 거울상 좌표에 그릴 수 없으므로 랜드마크 x 반전으로 대체하지 않음
+            cv2.flip(frame, 1, dst=frame)
+            if not self.render(frame):
+                break
+
+    def _run_threaded(self):
+        """
+        캡처 스레드 + 메인 스레드 추론/렌더링 파이프라인
+        
+        캡처 스레드가 다음 프레임을 디코딩하는 동안 메인 스레드는 현재 프레임을 추론하고,
+        항상 최신 프레임만 꺼내 처리 (좌우 반전은 캡처 스레드에서 수행)
+        """
+        stop_event = threading.Event()
+        frame_q = queue.Queue(maxsize=1)
+        
+        capture = CaptureThread(self.cap, frame_q, stop_event)
+        capture.start()
+        
+        try:
+            while not stop_event.is_set():
+                try:
+                    frame = frame_q.get(timeout=0.1)
+                except queue.Empty:
+                    # 프레임이 없어도 창 이벤트/키 입력은 처리
+                    if not self.handle_key(cv2.waitKey(1) & 0xFF):
+                        break
+                    continue
+                
+                if not self.render(frame):
+                    break
+        finally:
+            # 캡처 스레드가 웹캠을 쓰는 중에 해제하지 않도록 먼저 종료 대기
+            stop_event.set()
+            capture.join()
+
     def run(self):
         """메인 실행 루프"""
         if not self.cap.isOpened():
@@ -658,7 +1171,7 @@ class VirtualKeyboardTKL:
         print("Controls:")
         print("  q: Quit")
         print("  t: Toggle typing ON/OFF")
-        print("  k: Toggle keyboard display ON/OFF")
+        print("  k: Toggle keyboard display ON/OFF (hidden keyboard takes no key input)")
         print("  l: Toggle eye→finger lines ON/OFF")
         print("  z: Toggle Z-axis info ON/OFF")
         print("  +: Increase Z push threshold (need to push harder)")
@@ -676,56 +1189,10 @@ class VirtualKeyboardTKL:
         print("=" * 70)
         
         try:
-            while True:
-                ok, frame = self.cap.read()
-                if not ok:
-                    break
-                
-                frame = cv2.flip(frame, 1)
-                out, hud = self.process_frame(frame)
-                
-                # HUD 텍스트 표시
-                y = 30
-                for text in hud:
-                    # 배경
-                    (text_w, text_h), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 2)
-                    cv2.rectangle(out, (5, y - 20), (15 + text_w, y + 5), (0, 0, 0), -1)
-                    
-                    # 텍스트
-                    if "ON" in text or "YES" in text or "TOUCH:" in text:
-                        color = (0, 255, 0)
-                    elif "TKL" in text:
-                        color = (0, 255, 255)
-                    else:
-                        color = (200, 200, 200)
-                    
-                    cv2.putText(out, text, (10, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
-                    y += 25
-                
-                cv2.imshow("Virtual TKL Keyboard - Z-Axis Touch", out)
-                
-                # 키 입력
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    break
-                elif key == ord('t'):
-                    self.typing_enabled = not self.typing_enabled
-                    print(f"Typing: {'ON' if self.typing_enabled else 'OFF'}")
-                elif key == ord('k'):
-                    self.show_keyboard = not self.show_keyboard
-                    print(f"Keyboard display: {'ON' if self.show_keyboard else 'OFF'}")
-                elif key == ord('l'):
-                    self.show_lines = not self.show_lines
-                    print(f"Eye→Finger lines: {'ON' if self.show_lines else 'OFF'}")
-                elif key == ord('z'):
-                    self.show_z_info = not self.show_z_info
-                    print(f"Z-axis info: {'ON' if self.show_z_info else 'OFF'}")
-                elif key == ord('+') or key == ord('='):
-                    self.z_push_threshold += 0.01
-                    print(f"Z push threshold: {self.z_push_threshold:.3f}")
-                elif key == ord('-') or key == ord('_'):
-                    self.z_push_threshold = max(0.01, self.z_push_threshold - 0.01)
-                    print(f"Z push threshold: {self.z_push_threshold:.3f}")
+            if self.threaded:
+                self._run_threaded()
+            else:
+                self._run_serial()
         
         finally:
             self.cap.release()
@@ -738,6 +1205,10 @@ def main():
         cam_index=0,
         cam_w=1280,
         cam_h=720,
+        cam_fourcc="MJPG",
+        cam_fps=30,
+        cam_buffer_size=1,
+        cv_threads=1,
         det_conf_face=0.5,
         det_conf_hand=0.7,
         track_conf_hand=0.6,
@@ -745,7 +1216,11 @@ def main():
         key_spacing=3,
         keyboard_x_start=None,  # 자동 중앙 정렬
         keyboard_y_start=None,  # 자동 중앙 정렬
-        z_push_threshold=0.10  # Z축 밀어내기 감지 임계값 (높을수록 강하게 밀어야 함)
+        z_push_threshold=0.10,  # Z축 밀어내기 감지 임계값 (높을수록 강하게 밀어야 함)
+        inference_scale=0.5,  # MediaPipe 입력 축소 비율 (1.0이면 원본 해상도)
+        face_interval=3,  # 얼굴 추론 주기 (프레임)
+        use_opencl=False,  # OpenCL 전처리 (지원 장치가 있을 때만 적용)
+        threaded=True  # 캡처 스레드 사용
     )
     app.run()
 